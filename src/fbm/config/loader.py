@@ -1,12 +1,97 @@
-import yaml
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import yaml
+
+from fbm.utils.cache import mtime_lru_cache
 
+# libyaml's C parser when PyYAML was built with it (same safe schema)
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+@mtime_lru_cache(maxsize=8)
 def load_config(path: str = "conf/default.yaml") -> dict:
     """
     Load YAML config into a dict.
+    Parsed configs are cached on the file's mtime; callers get a deep copy,
+    so repeated daily() calls in one process parse each config once.
     """
     cfg_path = Path(path)
     if not cfg_path.exists():
         raise FileNotFoundError(f"Config file not found: {cfg_path}")
     with cfg_path.open("r") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_SafeLoader)
+
+@dataclass(frozen=True)
+class DailyConfig:
+    """
+    The settings daily() reads, coerced to their types once. Defaults are
+    the pipeline's own fallbacks; bankroll, kelly_fraction and the datalake
+    path are required.
+    """
+    datalake: str
+    bankroll: float
+    kelly_fraction: float
+    min_edge: float = 0.0
+    min_stake: float = 0.0
+    ratings_method: str = "elo"
+    hfa_points: float = 2.0
+    sigma_diff: float = 13.0
+    sigma_total: float = 10.0
+    league_total_mean: float = 45.0
+    slate_workers: int = 1
+    slate_processes: bool = False
+    mc_closed_form: bool = True
+    ratings_target_std: float = 3.0
+    elo_k: float = 20.0
+    elo_iters: int = 2
+    elo_batch: bool = False
+    mov_enabled: bool = True
+    mov_scale_pts: float = 7.0
+    mov_cap: float = 2.0
+    bayes_l2_lambda: float = 4.0
+
+    @classmethod
+    def from_dict(cls, cfg: Dict[str, Any]) -> "DailyConfig":
+        """Build from a load_config dict (missing optional keys take the defaults)."""
+        betting = cfg["betting"]
+        model = cfg.get("model") or {}
+        fields = cls.__dataclass_fields__
+
+        def opt(src: Dict[str, Any], key: str, cast: Callable[[Any], Any], name: Optional[str] = None) -> Any:
+            return cast(src.get(key, fields[name or key].default))
+
+        return cls(
+            datalake=cfg["paths"]["datalake"],
+            bankroll=float(betting["bankroll"]),
+            kelly_fraction=float(betting["kelly_fraction"]),
+            min_edge=opt(betting, "min_edge_pct", float, "min_edge"),
+            min_stake=opt(betting, "min_kelly_stake", float, "min_stake"),
+            ratings_method=opt(model, "ratings_method", str).lower(),
+            hfa_points=opt(model, "hfa_points", float),
+            sigma_diff=opt(model, "sigma_diff", float),
+            sigma_total=opt(model, "sigma_total", float),
+            league_total_mean=opt(model, "league_total_mean", float),
+            slate_workers=opt(model, "slate_workers", int),
+            slate_processes=opt(model, "slate_processes", bool),
+            mc_closed_form=opt(model, "mc_closed_form", bool),
+            ratings_target_std=opt(model, "ratings_target_std", float),
+            elo_k=opt(model, "elo_k", float),
+            elo_iters=opt(model, "elo_iters", int),
+            elo_batch=opt(model, "elo_batch", bool),
+            mov_enabled=opt(model, "mov_enabled", bool),
+            mov_scale_pts=opt(model, "mov_scale_pts", float),
+            mov_cap=opt(model, "mov_cap", float),
+            bayes_l2_lambda=opt(model, "bayes_l2_lambda", float),
+        )
+
+def _same(cfg: DailyConfig) -> DailyConfig:
+    return cfg
+
+@mtime_lru_cache(maxsize=8, copy=_same)
+def load_daily_config(path: str = "conf/default.yaml") -> DailyConfig:
+    """
+    load_config + DailyConfig.from_dict, cached on the file's mtime. The
+    result is frozen, so every caller shares the cached instance (no copy).
+    """
+    return DailyConfig.from_dict(load_config(path))
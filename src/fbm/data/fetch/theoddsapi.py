@@ -1,32 +1,277 @@
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
-import json, urllib.request, urllib.error, ssl
-from collections import Counter, defaultdict
+from typing import Dict, Any, Iterator, List, Tuple, Optional
+import csv, gzip, hashlib, http.client, json, threading, time, urllib.error, urllib.parse, ssl
+
+from fbm.utils.io import ensure_dir
+
+try:  # optional fast JSON decoder; stdlib json accepts bytes too
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
+ODDS_HEADER = (
+    "game_id", "home_team", "away_team", "home_ml", "away_ml", "home_spread",
+    "home_spread_price", "away_spread_price", "total_line", "over_price", "under_price",
+)
+SCORES_HEADER = ("date", "home_team", "away_team", "home_pts", "away_pts")
+
+_WRITE_BUFFER = 1 << 20  # 1 MiB
+
+ODDS_CACHE_DIR = Path.home() / ".cache" / "fbm" / "odds"
+ODDS_CACHE_TTL_S = 600.0  # re-runs within 10 min reuse the last odds payload
 
 # Sports slugs per The Odds API docs:
 # NFL:  americanfootball_nfl
 # CFB:  americanfootball_ncaaf
 
+# Keep-alive connections reused across calls, keyed by (scheme, host[:port]).
+# One pool per thread: http.client connections are not thread-safe, and the
+# odds fetch runs on a worker thread while the scores fetch runs on the main one.
+_CONNECTIONS = threading.local()
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+_MAX_REDIRECTS = 10  # same cap as urllib's HTTPRedirectHandler
+
+def _pool() -> Dict[Tuple[str, str], http.client.HTTPConnection]:
+    """This thread's keep-alive connections."""
+    pool = getattr(_CONNECTIONS, "pool", None)
+    if pool is None:
+        pool = _CONNECTIONS.pool = {}
+    return pool
+
+def _connection(scheme: str, netloc: str, timeout: int) -> http.client.HTTPConnection:
+    """This thread's pooled connection to netloc, set to this call's timeout."""
+    conn = _pool().get((scheme, netloc))
+    if conn is None:
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(netloc, timeout=timeout, context=ssl.create_default_context())
+        else:
+            conn = http.client.HTTPConnection(netloc, timeout=timeout)
+        _pool()[(scheme, netloc)] = conn
+    else:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+    return conn
+
+def _get_bytes(url: str, timeout: int = 20) -> bytes:
+    """
+    GET a payload over a pooled keep-alive connection, so back-to-back
+    fetches on one thread share one TCP+TLS handshake (each thread has its
+    own). Requests gzip and returns the decompressed raw bytes. A
+    connection the server already closed is reopened once. Redirects are
+    followed like urlopen does, up to _MAX_REDIRECTS.
+    """
+    for _ in range(_MAX_REDIRECTS + 1):
+        resp, raw = _request(url, timeout)
+        location = resp.getheader("Location")
+        if resp.status not in _REDIRECT_STATUSES or not location:
+            break
+        url = urllib.parse.urljoin(url, location)
+    else:
+        raise urllib.error.HTTPError(url, resp.status, "too many redirects", resp.headers, None)
+    if not 200 <= resp.status < 300:
+        raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+    if (resp.getheader("Content-Encoding") or "").lower() == "gzip":
+        raw = gzip.decompress(raw)
+    return raw
+
+def _request(url: str, timeout: int) -> Tuple[http.client.HTTPResponse, bytes]:
+    """One GET on the pooled connection: the response and its undecoded body."""
+    parts = urllib.parse.urlsplit(url)
+    target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+    headers = {"User-Agent": "fbm/1.0", "Accept-Encoding": "gzip", "Connection": "keep-alive"}
+    for attempt in range(2):
+        conn = _connection(parts.scheme, parts.netloc, timeout)
+        try:
+            conn.request("GET", target, headers=headers)
+            resp = conn.getresponse()
+            raw = resp.read()
+            break
+        except Exception as e:
+            conn.close()
+            _pool().pop((parts.scheme, parts.netloc), None)
+            if attempt or not isinstance(e, _STALE_CONNECTION_ERRORS):
+                raise
+    return resp, raw
+
 def _get(url: str, timeout: int = 20) -> Any:
-    ctx = ssl.create_default_context()
-    req = urllib.request.Request(url, headers={"User-Agent": "fbm/1.0"})
-    with urllib.request.urlopen(req, timeout=timeout, context=ctx) as resp:
-        return json.loads(resp.read().decode("utf-8"))
+    """GET a JSON payload; decodes the raw bytes directly (orjson when installed)."""
+    return _json_loads(_get_bytes(url, timeout=timeout))
+
+def _get_cached(url: str, cache_path: Optional[Path], ttl_s: float, timeout: int = 20) -> Any:
+    """
+    _get with an on-disk cache of the raw payload: a cache file younger than
+    ttl_s is decoded instead of hitting the network. Cache I/O errors fall
+    through to a live fetch; ttl_s <= 0 or cache_path None disables caching.
+    """
+    if cache_path is None or ttl_s <= 0:
+        return _get(url, timeout=timeout)
+    try:
+        if time.time() - cache_path.stat().st_mtime < ttl_s:
+            return _json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        pass
+    raw = _get_bytes(url, timeout=timeout)
+    data = _json_loads(raw)
+    try:
+        ensure_dir(cache_path.parent)
+        tmp = cache_path.with_name(cache_path.name + ".tmp")
+        tmp.write_bytes(raw)
+        tmp.replace(cache_path)
+    except OSError:
+        pass
+    return data
+
+def _odds_cache_path(cache_dir: Path, api_key: str, sport: str, region: str) -> Path:
+    # the key is hashed so it never lands on disk in clear text
+    key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"{sport}-{region}-{key_hash}.json"
+
+@contextmanager
+def _csv_writer(out_csv: Path, header: Tuple[str, ...]) -> Iterator[Any]:
+    """
+    Stream rows through a buffered csv.writer into a temp sibling, then move it
+    over `out_csv`; a failure mid-way leaves any previous file untouched.
+    """
+    ensure_dir(out_csv.parent)
+    tmp = out_csv.with_name(out_csv.name + ".tmp")
+    try:
+        with open(tmp, "w", buffering=_WRITE_BUFFER, encoding="utf-8", newline="") as f:
+            w = csv.writer(f, lineterminator="\n")
+            w.writerow(header)
+            yield w
+        tmp.replace(out_csv)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+def _line_key(point: Any) -> int:
+    """
+    Quantize a spread/total point to a half-point int key (-2.5 -> -5), so
+    float noise like -2.5000001 cannot split a line into separate buckets.
+    """
+    return int(round(float(point) * 2.0))
+
+def _line_value(key: Optional[int]) -> Optional[float]:
+    """Inverse of _line_key (None passes through)."""
+    return None if key is None else key / 2.0
+
+def _most_quoted_line(acc: Dict[int, List[int]]) -> Optional[int]:
+    """Line with the most quotes in a line -> [price_sum, count] accumulator (first wins ties)."""
+    return max(acc, key=lambda k: acc[k][1], default=None)
+
+def _better_ml(price: int, best: Optional[int]) -> bool:
+    """
+    True if `price` pays more than the current `best` American price:
+    higher if both positive, closer to zero if both negative, else prefer positive.
+    """
+    if best is None:
+        return True
+    return (price >= 0 and (best < 0 or price > best)) or \
+           (price < 0 and best < 0 and price > best)
+
+def _reduce_event(ev: Dict[str, Any]) -> Tuple[Optional[int], ...]:
+    """
+    Reduce one event's bookmakers to a single row of prices in one pass.
+    Returns (home_ml, away_ml, sp_line, home_sp_price, away_sp_price,
+             ou_line, over_price, under_price).
+    Spread/total prices are kept as running (sum, count) per line rather than
+    growing per-line price lists; those counts also pick the consensus line.
+    Away spread quotes are keyed by the home-perspective line (-point).
+    Lines are keyed as half-point ints (see _line_key) and converted back on return.
+    """
+    home = ev.get("home_team", "")
+    away = ev.get("away_team", "")
+    best_home_ml: Optional[int] = None
+    best_away_ml: Optional[int] = None
+
+    spread_home: Dict[int, List[int]] = {}   # line key -> [price_sum, count]
+    spread_away: Dict[int, List[int]] = {}
+    total_over: Dict[int, List[int]] = {}
+    total_under: Dict[int, List[int]] = {}
+
+    def _acc(acc: Dict[int, List[int]], pt: int, pr: int) -> None:
+        s = acc.get(pt)
+        if s is None:
+            acc[pt] = [pr, 1]
+        else:
+            s[0] += pr; s[1] += 1
 
-def _most_common_value(values: List[Any]) -> Optional[Any]:
-    if not values:
-        return None
-    c = Counter(values).most_common(1)
-    return c[0][0] if c else None
+    for b in ev.get("bookmakers", []) or []:
+        for m in b.get("markets", []) or []:
+            key = m.get("key")  # 'h2h' | 'spreads' | 'totals'
+            outcomes = m.get("outcomes", []) or []
 
-def _avg(nums: List[float]) -> Optional[float]:
-    return sum(nums) / len(nums) if nums else None
+            if key == "h2h":
+                # each outcome: {name: team, price: int american}
+                for o in outcomes:
+                    pr = o.get("price")
+                    if pr is None:
+                        continue
+                    pr = int(pr); nm = o.get("name", "")
+                    if nm == home and _better_ml(pr, best_home_ml):
+                        best_home_ml = pr
+                    if nm == away and _better_ml(pr, best_away_ml):
+                        best_away_ml = pr
+
+            elif key == "spreads":
+                # outcomes: {name: team, point: float, price: int}
+                for o in outcomes:
+                    pt = o.get("point", None)
+                    pr = o.get("price", None)
+                    if pt is None or pr is None:
+                        continue
+                    pt = _line_key(pt); pr = int(pr); nm = o.get("name", "")
+                    if nm == home:
+                        _acc(spread_home, pt, pr)
+                    elif nm == away:
+                        _acc(spread_away, -pt, pr)
+
+            elif key == "totals":
+                # outcomes: {name: 'Over'|'Under', point: float, price: int}
+                for o in outcomes:
+                    pt = o.get("point", None)
+                    pr = o.get("price", None)
+                    if pt is None or pr is None:
+                        continue
+                    pt = _line_key(pt); pr = int(pr); nm = o.get("name", "").lower()
+                    if nm.startswith("over"):
+                        _acc(total_over, pt, pr)
+                    elif nm.startswith("under"):
+                        _acc(total_under, pt, pr)
+
+    # Choose consensus for spreads/totals
+    sp_line = _most_quoted_line(spread_home)
+    ou_line = _most_quoted_line(total_over)
+
+    # Average prices at that consensus line
+    def _avg_int(acc: Dict[int, List[int]], line: Optional[int]) -> Optional[int]:
+        s = acc.get(line) if line is not None else None
+        if not s:
+            return None
+        return int(round(s[0] / float(s[1])))
+
+    return (
+        best_home_ml,
+        best_away_ml,
+        _line_value(sp_line),
+        _avg_int(spread_home, sp_line),
+        _avg_int(spread_away, sp_line),
+        _line_value(ou_line),
+        _avg_int(total_over, ou_line),
+        _avg_int(total_under, ou_line),
+    )
 
 def fetch_odds_to_csv(
     api_key: str,
     sport: str,
     out_csv: Path,
     region: str = "us",
+    cache_dir: Optional[Path] = ODDS_CACHE_DIR,
+    cache_ttl_s: float = ODDS_CACHE_TTL_S,
 ) -> Path:
     """
     Fetch ML, spreads, totals for upcoming events; write one CSV with our schema:
@@ -35,129 +280,26 @@ def fetch_odds_to_csv(
       - ML: choose the BEST price across all books for each side (bettor-friendly)
       - Spreads: choose the MOST COMMON line across books; average the prices for that line
       - Totals: same as spreads (use most common total)
+    The raw payload is cached under cache_dir for cache_ttl_s seconds, keyed by
+    (sport, region, sha256(api_key)); pass cache_ttl_s=0 to always fetch live.
     """
     url = (
         f"https://api.the-odds-api.com/v4/sports/{sport}/odds?"
         f"apiKey={api_key}&regions={region}&markets=h2h,spreads,totals&oddsFormat=american"
     )
-    data = _get(url)
+    cache_path = _odds_cache_path(cache_dir, api_key, sport, region) if cache_dir is not None else None
+    data = _get_cached(url, cache_path, cache_ttl_s)
+
+    # Fall back to blanks if missing pieces
+    def _fmt(x: Optional[float]) -> str:
+        return "" if x is None else (f"{x:.1f}" if isinstance(x, float) else str(x))
 
-    lines = [
-        "game_id,home_team,away_team,home_ml,away_ml,home_spread,home_spread_price,away_spread_price,total_line,over_price,under_price"
-    ]
-
-    for ev in data:
-        gid = ev.get("id", "")
-        home = ev.get("home_team", "")
-        away = ev.get("away_team", "")
-        # Accumulators across books
-        best_home_ml: Optional[int] = None
-        best_away_ml: Optional[int] = None
-
-        spread_lines = []
-        spread_price_home_by_line: Dict[float, List[int]] = defaultdict(list)
-        spread_price_away_by_line: Dict[float, List[int]] = defaultdict(list)
-
-        total_lines = []
-        total_price_over_by_line: Dict[float, List[int]] = defaultdict(list)
-        total_price_under_by_line: Dict[float, List[int]] = defaultdict(list)
-
-        books = ev.get("bookmakers", []) or []
-        for b in books:
-            markets = b.get("markets", []) or []
-            for m in markets:
-                key = m.get("key")  # 'h2h' | 'spreads' | 'totals'
-                outcomes = m.get("outcomes", []) or []
-
-                if key == "h2h":
-                    # each outcome: {name: team, price: int american}
-                    for o in outcomes:
-                        nm = o.get("name", "")
-                        price = int(o.get("price")) if o.get("price") is not None else None
-                        if nm == home and price is not None:
-                            # best (max) for positive odds, least negative for negative odds
-                            if best_home_ml is None:
-                                best_home_ml = price
-                            else:
-                                # compare by implied payout; simply choose higher price if both positive,
-                                # else choose the one closer to zero if both negative, else prefer positive
-                                if (price >= 0 and (best_home_ml < 0 or price > best_home_ml)) or \
-                                   (price < 0 and best_home_ml < 0 and price > best_home_ml):
-                                    best_home_ml = price
-                        if nm == away and price is not None:
-                            if best_away_ml is None:
-                                best_away_ml = price
-                            else:
-                                if (price >= 0 and (best_away_ml < 0 or price > best_away_ml)) or \
-                                   (price < 0 and best_away_ml < 0 and price > best_away_ml):
-                                    best_away_ml = price
-
-                elif key == "spreads":
-                    # outcomes: {name: team, point: float, price: int}
-                    for o in outcomes:
-                        nm = o.get("name", "")
-                        pt = o.get("point", None)
-                        pr = o.get("price", None)
-                        if pt is None or pr is None:
-                            continue
-                        pt = float(pt); pr = int(pr)
-                        spread_lines.append(pt)
-                        if nm == home:
-                            spread_price_home_by_line[pt].append(pr)
-                        elif nm == away:
-                            spread_price_away_by_line[pt].append(pr)
-
-                elif key == "totals":
-                    # outcomes: {name: 'Over'|'Under', point: float, price: int}
-                    for o in outcomes:
-                        nm = o.get("name", "")
-                        pt = o.get("point", None)
-                        pr = o.get("price", None)
-                        if pt is None or pr is None:
-                            continue
-                        pt = float(pt); pr = int(pr)
-                        total_lines.append(pt)
-                        if nm.lower().startswith("over"):
-                            total_price_over_by_line[pt].append(pr)
-                        elif nm.lower().startswith("under"):
-                            total_price_under_by_line[pt].append(pr)
-
-        # Choose consensus for spreads/totals
-        sp_line = _most_common_value(spread_lines)
-        ou_line = _most_common_value(total_lines)
-
-        # Average prices at that consensus line (fallback to empty lists)
-        def _avg_int(xs: List[int]) -> Optional[int]:
-            if not xs:
-                return None
-            return int(round(sum(xs) / float(len(xs))))
-
-        home_sp_price = _avg_int(spread_price_home_by_line.get(sp_line, [])) if sp_line is not None else None
-        away_sp_price = _avg_int(spread_price_away_by_line.get(sp_line, [])) if sp_line is not None else None
-        over_price = _avg_int(total_price_over_by_line.get(ou_line, [])) if ou_line is not None else None
-        under_price = _avg_int(total_price_under_by_line.get(ou_line, [])) if ou_line is not None else None
-
-        # Fall back to blanks if missing pieces
-        def _fmt(x: Optional[float]) -> str:
-            return "" if x is None else (f"{x:.1f}" if isinstance(x, float) else str(x))
-
-        line = ",".join([
-            gid,
-            home,
-            away,
-            _fmt(best_home_ml),
-            _fmt(best_away_ml),
-            _fmt(sp_line),
-            _fmt(home_sp_price),
-            _fmt(away_sp_price),
-            _fmt(ou_line),
-            _fmt(over_price),
-            _fmt(under_price),
-        ])
-        lines.append(line)
-
-    out_csv.parent.mkdir(parents=True, exist_ok=True)
-    out_csv.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with _csv_writer(out_csv, ODDS_HEADER) as w:
+        for ev in data:
+            w.writerow(
+                (ev.get("id", ""), ev.get("home_team", ""), ev.get("away_team", ""))
+                + tuple(_fmt(x) for x in _reduce_event(ev))
+            )
     return out_csv
 
 def fetch_recent_scores_to_csv(
@@ -176,32 +318,30 @@ def fetch_recent_scores_to_csv(
     )
     data = _get(url)
 
-    lines = ["date,home_team,away_team,home_pts,away_pts"]
-    for ev in data:
-        # completed only
-        if not ev.get("completed"):
-            continue
-        # oddsapi gives teams; sometimes 'scores' array exists; else use home_score/away_score
-        home = ev.get("home_team", "")
-        away = ev.get("away_team", "")
-        commence_time = (ev.get("commence_time") or "").split("T")[0]  # YYYY-MM-DD
-        scores = ev.get("scores") or []
-        home_pts = None
-        away_pts = None
-        for s in scores:
-            if s.get("name") == home:
-                home_pts = s.get("score")
-            if s.get("name") == away:
-                away_pts = s.get("score")
-        # fallback fields
-        if home_pts is None:
-            home_pts = ev.get("home_score")
-        if away_pts is None:
-            away_pts = ev.get("away_score")
-
-        if home and away and home_pts is not None and away_pts is not None:
-            lines.append(f"{commence_time},{home},{away},{int(home_pts)},{int(away_pts)}")
-
-    out_csv.parent.mkdir(parents=True, exist_ok=True)
-    out_csv.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with _csv_writer(out_csv, SCORES_HEADER) as w:
+        for ev in data:
+            # completed only
+            if not ev.get("completed"):
+                continue
+            # oddsapi gives teams; sometimes 'scores' array exists; else use home_score/away_score
+            home = ev.get("home_team", "")
+            away = ev.get("away_team", "")
+            commence_time = (ev.get("commence_time") or "").split("T")[0]  # YYYY-MM-DD
+            scores = ev.get("scores") or []
+            home_pts = None
+            away_pts = None
+            for s in scores:
+                if s.get("name") == home:
+                    home_pts = s.get("score")
+                if s.get("name") == away:
+                    away_pts = s.get("score")
+            # fallback fields
+            if home_pts is None:
+                home_pts = ev.get("home_score")
+            if away_pts is None:
+                away_pts = ev.get("away_score")
+
+            if home and away and home_pts is not None and away_pts is not None:
+                w.writerow((commence_time, home, away, int(home_pts), int(away_pts)))
+
     return out_csv
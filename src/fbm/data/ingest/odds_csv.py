@@ -1,16 +1,117 @@
 import csv
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, List, Dict, Optional, Sequence, Tuple
 
+import numpy as np
+
+from fbm.utils.cache import mtime_lru_cache
+from fbm.utils.io import READ_BUFFER
+
+@mtime_lru_cache(maxsize=8, copy=lambda rows: [dict(r) for r in rows])
 def load_odds_csv(path: Path) -> List[Dict[str, str]]:
     """
     Load odds CSV into list of dicts with normalized lowercase keys.
+    Header names are normalized once, then each row is zipped against them.
+    Parsed rows are cached on the file's mtime; callers get fresh row dicts.
+    """
+    with open(path, newline="", encoding="utf-8", buffering=READ_BUFFER) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return []
+        # normalize column names: lower + underscores
+        keys = [k.strip().lower().replace(" ", "_") for k in header]
+        return [
+            dict(zip(keys, (v.strip() for v in row)))
+            for row in reader
+            if row
+        ]
+
+class OddsTable:
+    """
+    Column-major odds slate (load_odds_table): {normalized key: cells},
+    each a tuple of stripped strings, with None where a short line lacks the
+    column. len() is the row count; slicing selects rows. Immutable.
     """
-    with open(path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        rows = []
-        for row in reader:
-            # normalize column names: lower + underscores
-            normed = {k.strip().lower().replace(" ", "_"): v.strip() for k, v in row.items()}
-            rows.append(normed)
-        return rows
\ No newline at end of file
+    __slots__ = ("columns", "n_rows")
+
+    def __init__(self, columns: Dict[str, Tuple[Optional[str], ...]], n_rows: int):
+        self.columns = columns
+        self.n_rows = n_rows
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def __getitem__(self, rows: slice) -> "OddsTable":
+        return OddsTable({k: v[rows] for k, v in self.columns.items()}, len(range(self.n_rows)[rows]))
+
+    def cells(self, keys: Sequence[str]) -> Dict[str, Sequence[Any]]:
+        """odds_cells for this table: the requested columns, all-None when absent."""
+        missing = (None,) * self.n_rows
+        return {k: self.columns.get(k, missing) for k in keys}
+
+@mtime_lru_cache(maxsize=8, copy=lambda table: table)
+def load_odds_table(path: Path) -> OddsTable:
+    """
+    Load an odds CSV straight into columns (same header normalization and
+    cell stripping as load_odds_csv): the reader's rows are transposed with
+    one zip, so no per-row dicts are built. Cached on the file's mtime; the
+    table is immutable, so callers share it.
+    """
+    with open(path, newline="", encoding="utf-8", buffering=READ_BUFFER) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return OddsTable({}, 0)
+        keys = [k.strip().lower().replace(" ", "_") for k in header]
+        rows = [row for row in reader if row]
+    n = len(keys)
+    if any(len(row) != n for row in rows):
+        # short lines lack their trailing columns (None), long ones drop the extras
+        rows = [row[:n] + [None] * (n - len(row)) for row in rows]
+    cols = zip(*rows) if rows else [()] * n
+    # a repeated header keeps its last column, as in load_odds_csv's dicts
+    columns = {k: tuple(None if v is None else v.strip() for v in col) for k, col in zip(keys, cols)}
+    return OddsTable(columns, len(rows))
+
+def odds_cells(rows: Sequence[Dict[str, str]], keys: Sequence[str]) -> Dict[str, Sequence[Any]]:
+    """
+    Raw cell columns for several keys in one pass over the rows: one C-level
+    itemgetter call per row, transposed with zip. Rows missing a key (short
+    CSV lines) give None for it.
+    """
+    keys = list(keys)
+    try:
+        if len(keys) == 1:
+            return {keys[0]: list(map(itemgetter(keys[0]), rows))}
+        cols = list(zip(*map(itemgetter(*keys), rows))) or [()] * len(keys)
+    except KeyError:
+        cols = [[r.get(k) for r in rows] for k in keys]
+    return dict(zip(keys, cols))
+
+def parse_cells(cells: Sequence[Any], dtype=np.float64) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Typed column from raw cells: (values, parsed) arrays, where parsed[i] is
+    False for cells that int()/float() reject (blank, None). The whole column
+    is converted in one NumPy call; only a column with a bad cell falls back
+    to per-cell parsing. Unparsed cells hold 0.
+    """
+    try:
+        return np.array(cells, dtype=dtype), np.ones(len(cells), dtype=bool)
+    except (TypeError, ValueError, OverflowError):
+        pass
+    conv = int if np.issubdtype(dtype, np.integer) else float
+    out = np.zeros(len(cells), dtype=np.float64 if conv is int else dtype)
+    parsed = np.zeros(len(cells), dtype=bool)
+    for i, c in enumerate(cells):
+        try:
+            out[i] = conv(c)
+            parsed[i] = True
+        except (TypeError, ValueError, OverflowError):
+            pass
+    return out, parsed
+
+def odds_column(rows: Sequence[Dict[str, str]], key: str, dtype=np.float64) -> Tuple[np.ndarray, np.ndarray]:
+    """parse_cells for one key of load_odds_csv rows (missing key = unparsed)."""
+    return parse_cells([r.get(key) for r in rows], dtype)
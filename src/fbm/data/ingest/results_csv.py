@@ -1,6 +1,8 @@
 from pathlib import Path
-from typing import List, Dict, Any
-import re
+from typing import Any, Dict, Iterator, List
+import csv
+
+from fbm.utils.io import READ_BUFFER
 
 # --- Header normalization helpers ------------------------------------------------
 
@@ -15,12 +17,27 @@ _ALIAS = {
 
 _NUMERIC_INT_FIELDS = {"home_pts", "away_pts"}
 
+class _SnakeTable(dict):
+    """str.translate table: keep [a-z0-9 ], map '/' and '-' to space, drop the rest."""
+    def __missing__(self, key: int) -> None:
+        self[key] = None
+        return None
+
+_SNAKE_TABLE = _SnakeTable({ord(c): c for c in "abcdefghijklmnopqrstuvwxyz0123456789 "})
+_SNAKE_TABLE.update({ord("/"): " ", ord("-"): " "})
+
 def _snake(s: str) -> str:
-    s = s.strip().lower()
-    s = s.replace("/", " ").replace("-", " ")
-    s = re.sub(r"[^a-z0-9 ]+", "", s)
-    s = re.sub(r"\s+", "_", s).strip("_")
-    return s
+    s = s.strip().lower().translate(_SNAKE_TABLE)
+    # only spaces survive the translate; collapse runs into single underscores
+    return "_".join(s.split())
+
+# every accepted snake-cased spelling -> canonical name (first alias group wins)
+_LOOKUP: Dict[str, str] = {}
+for _canon, _variants in _ALIAS.items():
+    _LOOKUP.setdefault(_canon, _canon)
+    for _v in sorted(_variants):
+        _LOOKUP.setdefault(_snake(_v), _canon)
+del _canon, _variants, _v
 
 def _canonical(h: str) -> str:
     """
@@ -28,10 +45,7 @@ def _canonical(h: str) -> str:
     Returns the normalized key if matched, else the snake-cased header.
     """
     s = _snake(h)
-    for canon, variants in _ALIAS.items():
-        if s == canon or s in { _snake(v) for v in variants }:
-            return canon
-    return s
+    return _LOOKUP.get(s, s)
 
 def _coerce_value(key: str, val: str) -> Any:
     """
@@ -49,47 +63,61 @@ def _coerce_value(key: str, val: str) -> Any:
 
 # --- Loaders --------------------------------------------------------------------
 
-def load_results_csv(path: Path) -> List[Dict[str, Any]]:
+def iter_results_csv(path: Path) -> Iterator[Dict[str, Any]]:
     """
-    Load a single results CSV with a flexible header.
-    Canonical keys returned when present:
+    Stream rows of a single results CSV with a flexible header.
+    Canonical keys yielded when present:
       - date (str), home_team (str), away_team (str), home_pts (int|str), away_pts (int|str)
     Any extra columns are normalized to snake_case as well.
     """
     if not path.exists():
-        return []
-    lines = path.read_text(encoding="utf-8").splitlines()
-    if not lines:
-        return []
-
-    raw_header = [h.strip() for h in lines[0].split(",")]
-    header = [_canonical(h) for h in raw_header]
-
-    rows: List[Dict[str, Any]] = []
-    for ln in lines[1:]:
-        if not ln.strip():
-            continue
-        parts = [p.strip() for p in ln.split(",")]
-        # pad/truncate to header length
-        if len(parts) < len(header):
-            parts = parts + [""] * (len(header) - len(parts))
-        elif len(parts) > len(header):
-            parts = parts[:len(header)]
-        # coerce known numeric fields
-        coerced = {k: _coerce_value(k, v) for k, v in zip(header, parts)}
-        rows.append(coerced)
-    return rows
+        return
+
+    with path.open(newline="", encoding="utf-8", buffering=READ_BUFFER) as f:
+        reader = csv.reader(f)
+        raw_header = next(reader, None)
+        if raw_header is None:
+            return
+        # header mapping + numeric columns are resolved once per file
+        header = [_canonical(h) for h in raw_header]
+        n = len(header)
+        coerce_idx = [i for i, k in enumerate(header) if k in _NUMERIC_INT_FIELDS]
+
+        for parts in reader:
+            if not parts or (len(parts) == 1 and not parts[0].strip()):
+                continue
+            # pad/truncate to header length
+            if len(parts) < n:
+                parts = parts + [""] * (n - len(parts))
+            parts = [p.strip() for p in parts[:n]]
+            # coerce known numeric fields
+            for i in coerce_idx:
+                parts[i] = _coerce_value(header[i], parts[i])
+            yield dict(zip(header, parts))
+
+def load_results_csv(path: Path) -> List[Dict[str, Any]]:
+    """Load a single results CSV (see iter_results_csv) into a list."""
+    return list(iter_results_csv(path))
+
+def result_date(row: Dict[str, Any]) -> str:
+    """Sort key for result rows: the date string (YYYY-MM-DD sorts lexicographically)."""
+    return row.get("date", "")
+
+def iter_results_dir(dir_path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Stream rows of every *.csv in a directory, file by file (files in name
+    order, rows unsorted). Missing dir yields nothing.
+    """
+    if not dir_path.exists():
+        return
+    for p in sorted(dir_path.glob("*.csv")):
+        yield from iter_results_csv(p)
 
 def load_results_dir(dir_path: Path) -> List[Dict[str, Any]]:
     """
     Load all *.csv files in a directory, concatenated and sorted by date ascending.
     Accepts flexible headers per load_results_csv. Missing dir returns [].
     """
-    if not dir_path.exists():
-        return []
-    all_rows: List[Dict[str, Any]] = []
-    for p in sorted(dir_path.glob("*.csv")):
-        all_rows.extend(load_results_csv(p))
-    # Sort by date string ascending (YYYY-MM-DD sorts lexicographically)
-    all_rows.sort(key=lambda r: r.get("date", ""))
-    return all_rows
\ No newline at end of file
+    all_rows = list(iter_results_dir(dir_path))
+    all_rows.sort(key=result_date)
+    return all_rows
@@ -1,5 +1,7 @@
 from typing import Tuple
 
+import numpy as np
+
 def ev_and_edge(model_prob: float, fair_prob: float, odds_decimal: float) -> Tuple[float, float]:
     """
     Returns:
@@ -16,3 +18,20 @@ def ev_and_edge(model_prob: float, fair_prob: float, odds_decimal: float) -> Tup
     ev_per_dollar = model_prob * b - q
     edge_pct = model_prob - fair_prob
     return ev_per_dollar, edge_pct
+
+def ev_and_edge_batch(model_prob, fair_prob, odds_decimal) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized ev_and_edge over arrays; inputs are validated once for the batch.
+    Returns (ev_per_dollar, edge_pct) arrays.
+    """
+    p = np.asarray(model_prob, dtype=float)
+    fair = np.asarray(fair_prob, dtype=float)
+    odds = np.asarray(odds_decimal, dtype=float)
+    if not (np.all((p > 0) & (p < 1)) and np.all((fair > 0) & (fair < 1))):
+        raise ValueError("model_prob and fair_prob must be in (0,1)")
+    if not np.all(odds > 1.0):
+        raise ValueError("odds_decimal must be > 1.0")
+
+    ev_per_dollar = p * (odds - 1.0) - (1.0 - p)
+    edge_pct = p - fair
+    return ev_per_dollar, edge_pct
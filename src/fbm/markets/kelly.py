@@ -1,3 +1,5 @@
+import numpy as np
+
 def kelly_fractional(p_win: float, odds_decimal: float, bankroll: float, fraction: float = 0.33) -> float:
     """
     Fractional Kelly stake.
@@ -24,3 +26,23 @@ def kelly_fractional(p_win: float, odds_decimal: float, bankroll: float, fractio
         return 0.0
     kelly_unit = edge / b            # full Kelly fraction of bankroll
     return bankroll * fraction * kelly_unit
+
+def kelly_fractional_batch(p_win, odds_decimal, bankroll: float, fraction: float = 0.33) -> np.ndarray:
+    """
+    Vectorized kelly_fractional over arrays of p_win / odds_decimal.
+    Inputs are validated once for the whole batch; returns stakes (>= 0).
+    """
+    p = np.asarray(p_win, dtype=float)
+    odds = np.asarray(odds_decimal, dtype=float)
+    if not np.all((p > 0) & (p < 1)):
+        raise ValueError("p_win must be in (0,1)")
+    if not np.all(odds > 1.0):
+        raise ValueError("odds_decimal must be > 1.0")
+    if bankroll < 0:
+        raise ValueError("bankroll must be >= 0")
+    if not (0 < fraction <= 1.0):
+        raise ValueError("fraction must be in (0,1]")
+
+    b = odds - 1.0
+    edge = b * p - (1.0 - p)
+    return np.where(edge > 0, bankroll * fraction * (edge / b), 0.0)
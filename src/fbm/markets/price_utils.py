@@ -1,5 +1,15 @@
+from functools import lru_cache
 from typing import Tuple
 
+import numpy as np
+
+# Odds come from a small integer domain (roughly ±100..±2000), so the two
+# converters below are memoized per price: the lru_cache is the lookup table,
+# filled lazily with the prices a slate actually quotes (-110, -105, +100, ...)
+# and kept across runs in one process. lru_cache is thread-safe in CPython.
+# Whole slates go through the *_batch variants below instead.
+
+@lru_cache(maxsize=4096)
 def american_to_decimal(american: int) -> float:
     """
     +150 -> 2.50,  -120 -> 1.8333...
@@ -11,6 +21,7 @@ def american_to_decimal(american: int) -> float:
     else:
         return 1.0 + (100.0 / abs(american))
 
+@lru_cache(maxsize=4096)
 def implied_prob_from_american(american: int) -> float:
     """
     +150 -> 100/(150+100)=0.4,  -120 -> 120/(120+100)=0.54545...
@@ -31,3 +42,63 @@ def remove_vig_two_way(p_a: float, p_b: float) -> Tuple[float, float]:
         raise ValueError("Probabilities must be > 0")
     s = p_a + p_b
     return p_a / s, p_b / s
+
+# ---------------------------
+# Batched (array) variants
+# ---------------------------
+
+def american_to_decimal_batch(american) -> np.ndarray:
+    """Vectorized american_to_decimal over an array of nonzero American prices."""
+    a = np.asarray(american, dtype=float)
+    if np.any(a == 0):
+        raise ValueError("American odds cannot be 0")
+    with np.errstate(divide="ignore"):
+        return np.where(a > 0, 1.0 + (a / 100.0), 1.0 + (100.0 / np.abs(a)))
+
+def implied_prob_from_american_batch(american) -> np.ndarray:
+    """Vectorized implied_prob_from_american over an array of nonzero American prices."""
+    a = np.asarray(american, dtype=float)
+    if np.any(a == 0):
+        raise ValueError("American odds cannot be 0")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(a > 0, 100.0 / (a + 100.0), np.abs(a) / (np.abs(a) + 100.0))
+
+def remove_vig_two_way_batch(p_a, p_b) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized remove_vig_two_way: elementwise (p_a/s, p_b/s) with s = p_a + p_b."""
+    p_a = np.asarray(p_a, dtype=float)
+    p_b = np.asarray(p_b, dtype=float)
+    if np.any(p_a <= 0) or np.any(p_b <= 0):
+        raise ValueError("Probabilities must be > 0")
+    s = p_a + p_b
+    return p_a / s, p_b / s
+
+def _imp_and_dec_formula(a: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    absa = np.abs(a)
+    pos = a > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        imp = np.where(pos, 100.0 / (a + 100.0), absa / (absa + 100.0))
+        dec = np.where(pos, 1.0 + (a / 100.0), 1.0 + (100.0 / absa))
+    return imp, dec
+
+# Dense (implied prob, decimal) tables for integer prices in ±_LUT_MAX, built
+# with the same elementwise formulas, so a gather is bit-identical to computing.
+_LUT_MAX = 10000  # the full sportsbook range; 2 x 20001 float64 = ~320 KiB
+_IMP_LUT, _DEC_LUT = _imp_and_dec_formula(np.arange(-_LUT_MAX, _LUT_MAX + 1, dtype=float))
+
+def implied_prob_and_decimal_batch(american) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (implied prob, decimal odds) arrays for nonzero American prices. Integer
+    prices within ±10000 (every posted line, longshots included) are gathered
+    from lookup tables; any other array is converted once per distinct price
+    (a slate repeats a handful of prices) and scattered back.
+    """
+    a = np.asarray(american, dtype=float)
+    if np.any(a == 0):
+        raise ValueError("American odds cannot be 0")
+    if np.all((np.abs(a) <= _LUT_MAX) & (a == np.rint(a))):
+        ix = a.astype(np.intp) + _LUT_MAX
+        return _IMP_LUT[ix], _DEC_LUT[ix]
+    uniq, inverse = np.unique(a, return_inverse=True)
+    imp, dec = _imp_and_dec_formula(uniq)
+    inverse = inverse.reshape(a.shape)
+    return imp[inverse], dec[inverse]
@@ -0,0 +1,277 @@
+"""
+Vectorized pricing of a whole odds slate (ML HOME, ATS HOME/AWAY, OU OVER/UNDER).
+
+Rows are parsed once into column arrays; implied/fair probabilities, model
+probabilities, EV/edge and Kelly stakes are then computed per market with
+NumPy instead of per row. Candidates come back in the same order the per-row
+loop produced them (row by row, markets in the order above), one at a time.
+"""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from fbm.data.ingest.odds_csv import OddsTable, odds_cells, parse_cells
+from fbm.markets.price_utils import implied_prob_and_decimal_batch
+from fbm.modeling.baseline import BaselineModel
+
+_MIN_CHUNK = 256  # rows per worker below which thread dispatch costs more than it saves
+_MIN_PROCESS_CHUNK = 1024  # same for process workers (spawn + pickling the rows and model)
+_MIN_MC_PARALLEL = 1 << 20  # games x draws per market below which the MC markets run serially
+
+# (game_id, market, side, odds_am, odds_dec, line, fair_prob, model_prob, edge, ev_per_dollar, stake)
+Candidate = Tuple[str, str, str, int, float, str, float, float, float, float, float]
+
+def _two_way_columns(cells: Dict[str, Sequence], n: int, line_key: Optional[str], a_key: str, b_key: str):
+    """
+    Typed (line, price_a, price_b) columns from odds_cells output. A row is
+    usable only if all three parse and neither price is 0; unusable rows get
+    placeholder values.
+    """
+    pa, ok_a = parse_cells(cells[a_key], np.int64)
+    pb, ok_b = parse_cells(cells[b_key], np.int64)
+    ok = ok_a & ok_b & (pa != 0) & (pb != 0)
+    if line_key is None:
+        line = np.zeros(n)
+    else:
+        line, ok_line = parse_cells(cells[line_key], np.float64)
+        ok &= ok_line
+        line = np.where(ok, line, 0.0)
+    return line, np.where(ok, pa, 100).astype(np.float64), np.where(ok, pb, 100).astype(np.float64), ok
+
+def _devig_pair(pa: np.ndarray, pb: np.ndarray, converted=None):
+    """
+    De-vigged fair probs and decimal odds for both sides of a two-way market
+    in one pass: (fair_a, fair_b, dec_a, dec_b), one shared ph + pa sum.
+    Inputs are pre-screened by _two_way_columns (no zero prices).
+    `converted` = (imp_a, dec_a, imp_b, dec_b) skips the price conversion.
+
+    When both sides carry the same price on every row (the usual -110/-110
+    spread/total board) the fair probs are exactly 0.5 and side b's decimals
+    equal side a's, so only side a is converted.
+    """
+    if np.array_equal(pa, pb):
+        dec = converted[1] if converted is not None else implied_prob_and_decimal_batch(pa)[1]
+        half = np.full(len(pa), 0.5)
+        return half, half, dec, dec
+    if converted is None:
+        converted = implied_prob_and_decimal_batch(pa) + implied_prob_and_decimal_batch(pb)
+    imp_a, dec_a, imp_b, dec_b = converted
+    s = imp_a + imp_b
+    return imp_a / s, imp_b / s, dec_a, dec_b
+
+def _price_side(model_p, fair_p, dec, ok, bankroll: float, fraction: float, min_edge: float):
+    """
+    EV, edge and Kelly stake for one market side in one fused pass: b = dec - 1
+    and q = 1 - p are shared, and the Kelly numerator b*p - q is the EV itself.
+    Same arithmetic as ev_and_edge / kelly_fractional; rows failing their
+    validation drop out of `ok` (values there are not meaningful). The stake
+    is only computed where edge >= min_edge (0 elsewhere): those rows are
+    rejected by the ticket filter whatever their stake; when no row of the
+    side clears min_edge, EV and Kelly are skipped altogether (zeros returned).
+    """
+    ok = ok & (model_p > 0) & (model_p < 1) & (fair_p > 0) & (fair_p < 1) & (dec > 1.0)
+    edge = model_p - fair_p
+    live = ok & (edge >= min_edge)
+    if not live.any():
+        zeros = np.zeros_like(edge)
+        return zeros, edge, zeros, ok
+    b = dec - 1.0
+    ev = model_p * b - (1.0 - model_p)
+    stake = np.divide(ev, b, out=np.zeros_like(ev), where=live & (ev > 0))
+    stake *= bankroll * fraction
+    return ev, edge, stake, ok
+
+# market models: (model, home_ix, away_ix, mean_diff, line, total_mean, mc) -> P(side_a);
+# mean_diff is computed once per slate and shared by the ML and ATS markets, and
+# mc = (n, rng) switches the ATS/OU probabilities to Monte Carlo when n > 0, each
+# market drawing from its own generator
+def _ml_home_prob(model: BaselineModel, home_ix, away_ix, mean_diff, line, total_mean, mc) -> np.ndarray:
+    return model.win_probs_home(home_ix, away_ix, mean_diff=mean_diff)
+
+def _ats_home_prob(model: BaselineModel, home_ix, away_ix, mean_diff, line, total_mean, mc) -> np.ndarray:
+    return model.cover_probs_home(home_ix, away_ix, line, mean_diff=mean_diff, mc_n=mc[0], mc_rng=mc[1])
+
+def _ou_over_prob(model: BaselineModel, home_ix, away_ix, mean_diff, line, total_mean, mc) -> np.ndarray:
+    return model.over_probs(line, total_mean, mc_n=mc[0], mc_rng=mc[1])
+
+def _no_line(ln: float) -> str:
+    return ""
+
+def _neg_spread(ln: float) -> str:
+    return f"{-ln:+.1f}"
+
+# (market, (side_a, side_b), line column, (price_a, price_b) columns,
+#  (line label a, line label b), P(side_a) model, Monte Carlo capable). side_b
+# None = one-sided; side_b gets 1 - P(side_a) and is only offered when side_a is.
+_MARKETS = (
+    ("ML", ("HOME", None), None, ("home_ml", "away_ml"), (_no_line, _no_line), _ml_home_prob, False),
+    ("ATS", ("HOME", "AWAY"), "home_spread", ("home_spread_price", "away_spread_price"),
+     ("{:+.1f}".format, _neg_spread), _ats_home_prob, True),
+    ("OU", ("OVER", "UNDER"), "total_line", ("over_price", "under_price"),
+     ("{:.1f}".format, "{:.1f}".format), _ou_over_prob, True),
+)
+
+# every odds column pricing reads, pulled from the rows in one itemgetter pass
+_ROW_KEYS = ("game_id", "home_team", "away_team") + tuple(
+    k for _, _, line_key, price_keys, *_ in _MARKETS for k in ((line_key,) if line_key else ()) + price_keys
+)
+
+# upper bound on candidates per odds row (one per market side)
+SIDES_PER_ROW = sum(1 if side_b is None else 2 for _, (_, side_b), *_ in _MARKETS)
+
+OddsRows = Union[Sequence[Dict[str, str]], OddsTable]
+
+def price_slate(
+    rows: OddsRows,
+    model: BaselineModel,
+    league_total_mean: float,
+    *,
+    bankroll: float,
+    kelly_fraction: float,
+    min_edge: float = float("-inf"),
+    min_stake: float = float("-inf"),
+    workers: int = 1,
+    processes: bool = False,
+    mc_n: int = 0,
+    mc_seed: Optional[int] = None,
+) -> Iterator[Candidate]:
+    """
+    Lazily yield priced candidates for every market in the odds rows (schema
+    of load_odds_csv, as row dicts or a load_odds_table OddsTable). Rows with missing/zero prices or out-of-range
+    probabilities skip that market; for two-sided markets the second side is
+    only offered when the first is. Candidates below min_edge / min_stake are
+    masked out in the arrays, so only surviving tickets are materialized.
+
+    workers > 1 prices contiguous row chunks on a thread pool (slates of at
+    least _MIN_CHUNK rows per worker), or with processes=True on a process
+    pool (at least _MIN_PROCESS_CHUNK rows per worker, to cover spawn and
+    pickling); output order is the same either way.
+
+    mc_n > 0 estimates the ATS/OU model probabilities from mc_n Monte Carlo
+    draws shared by all games; ATS and OU each draw from an independent child
+    generator spawned from mc_seed (re-derived per chunk, so chunking doesn't
+    change them), and run concurrently on threads for large slates (NumPy
+    releases the GIL in the draws and ufuncs). Every row of those markets is
+    simulated, so one estimator decides all the filters. The moneyline stays
+    closed-form.
+
+    A Kelly stake never exceeds bankroll * kelly_fraction, so when that is
+    below min_stake nothing can be offered and no pricing is done.
+    """
+    if not rows:
+        return
+    if bankroll < 0:
+        raise ValueError("bankroll must be >= 0")
+    if not (0 < kelly_fraction <= 1.0):
+        raise ValueError("fraction must be in (0,1]")
+    if bankroll * kelly_fraction < min_stake:
+        return
+    args = (model, league_total_mean, bankroll, kelly_fraction, min_edge, min_stake, (int(mc_n or 0), mc_seed))
+    n_chunks = min(int(workers), len(rows) // (_MIN_PROCESS_CHUNK if processes else _MIN_CHUNK))
+    if n_chunks <= 1:
+        yield from _price_rows(rows, *args)
+        return
+
+    model._vectors()  # build the shared ratings vector once, before the workers read it
+    size = -(-len(rows) // n_chunks)
+    chunks = [rows[i:i + size] if isinstance(rows, OddsTable) else list(rows[i:i + size])
+              for i in range(0, len(rows), size)]
+    pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with pool(max_workers=n_chunks) as ex:
+        for part in ex.map(_price_chunk, chunks, *(repeat(a, len(chunks)) for a in args)):
+            yield from part
+
+def _price_chunk(rows, *args) -> List[Candidate]:
+    """Top-level (picklable) worker: one chunk's candidates as a list."""
+    return list(_price_rows(rows, *args))
+
+def _price_rows(
+    rows: OddsRows,
+    model: BaselineModel,
+    league_total_mean: float,
+    bankroll: float,
+    kelly_fraction: float,
+    min_edge: float,
+    min_stake: float,
+    mc: Tuple[int, Optional[int]] = (0, None),
+) -> Iterator[Candidate]:
+
+    cells = rows.cells(_ROW_KEYS) if isinstance(rows, OddsTable) else odds_cells(rows, _ROW_KEYS)
+    home_ix = model.team_indices(cells["home_team"])
+    away_ix = model.team_indices(cells["away_team"])
+    mean_diff = model.mean_diffs(home_ix, away_ix)
+
+    # typed columns per market, then every price (all markets, both sides)
+    # converted to implied prob / decimal odds in one stacked table gather
+    columns = [
+        _two_way_columns(cells, len(rows), line_key, key_a, key_b)
+        for _, _, line_key, (key_a, key_b), *_ in _MARKETS
+    ]
+    imp, dec = implied_prob_and_decimal_batch(np.stack([p for _, pa, pb, _ in columns for p in (pa, pb)]))
+
+    mc_n, mc_seed = mc
+    mc_ks = [k for k, m in enumerate(_MARKETS) if m[-1]] if mc_n > 0 else []
+
+    # fair probs and decimals per market; closed-form P(side_a) for the
+    # markets that are not simulated
+    devig, model_p = [], []
+    for k, (*_, prob_a, _) in enumerate(_MARKETS):
+        devig.append(_devig_pair(columns[k][1], columns[k][2],
+                                 (imp[2 * k], dec[2 * k], imp[2 * k + 1], dec[2 * k + 1])))
+        model_p.append(None if k in mc_ks else
+                       prob_a(model, home_ix, away_ix, mean_diff, columns[k][0], league_total_mean, (0, None)))
+
+    if mc_ks:
+        # independent, reproducible streams: one SeedSequence child per MC market
+        rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(mc_seed).spawn(len(mc_ks))]
+
+        def simulate(k: int, rng: np.random.Generator) -> np.ndarray:
+            return _MARKETS[k][5](model, home_ix, away_ix, mean_diff, columns[k][0], league_total_mean, (mc_n, rng))
+
+        if len(mc_ks) > 1 and len(rows) * mc_n >= _MIN_MC_PARALLEL:
+            with ThreadPoolExecutor(max_workers=len(mc_ks)) as ex:
+                estimates = list(ex.map(simulate, mc_ks, rngs))
+        else:
+            estimates = [simulate(k, rng) for k, rng in zip(mc_ks, rngs)]
+        for k, p in zip(mc_ks, estimates):
+            model_p[k] = p
+
+    # one column pass per market; each priced side is
+    # (market, side, prices, decimals, fair, model, (ev, edge, stake, emit), line, line label)
+    sides = []
+    for k, (market, (side_a, side_b), _, _, (fmt_a, fmt_b), _, _) in enumerate(_MARKETS):
+        line, pa, pb, ok = columns[k]
+        fair_a, fair_b, dec_a, dec_b = devig[k]
+        p_a = model_p[k]
+        ev_a, edge_a, stake_a, ok_a = _price_side(p_a, fair_a, dec_a, ok, bankroll, kelly_fraction, min_edge)
+        emit_a = ok_a & (edge_a >= min_edge) & (stake_a >= min_stake)
+        sides.append((market, side_a, pa, dec_a, fair_a, p_a, (ev_a, edge_a, stake_a, emit_a), line, fmt_a))
+        if side_b is not None:
+            p_b = 1.0 - p_a
+            ev_b, edge_b, stake_b, ok_b = _price_side(p_b, fair_b, dec_b, ok_a, bankroll, kelly_fraction, min_edge)
+            emit_b = ok_b & (edge_b >= min_edge) & (stake_b >= min_stake)
+            sides.append((market, side_b, pb, dec_b, fair_b, p_b, (ev_b, edge_b, stake_b, emit_b), line, fmt_b))
+
+    emit_any = np.logical_or.reduce([side[6][3] for side in sides])
+    sel = np.flatnonzero(emit_any)
+    if not len(sel):
+        return
+
+    # gather every emitted row's fields per side in one fancy-index + tolist,
+    # instead of indexing NumPy scalars per candidate
+    cols = []
+    for market, side, am, dec, fair, modelp, (ev, edge, stake, emit), line, fmt_line in sides:
+        cols.append((
+            market, side, emit[sel].tolist(), am[sel].astype(np.int64).tolist(), dec[sel].tolist(),
+            [fmt_line(ln) for ln in line[sel].tolist()], fair[sel].tolist(), modelp[sel].tolist(),
+            edge[sel].tolist(), ev[sel].tolist(), stake[sel].tolist(),
+        ))
+
+    game_ids = cells["game_id"]
+    for j, i in enumerate(sel.tolist()):
+        game_id = game_ids[i]
+        for market, side, emit, am, dec, line, fair, modelp, edge, ev, stake in cols:
+            if emit[j]:
+                yield (game_id, market, side, am[j], dec[j], line[j], fair[j], modelp[j], edge[j], ev[j], stake[j])
@@ -1,10 +1,7 @@
-from math import erf, sqrt
+import numpy as np
 
-_SQRT2 = sqrt(2.0)
-
-def _norm_cdf(z: float) -> float:
-    # Standard normal CDF via error function
-    return 0.5 * (1.0 + erf(z / _SQRT2))
+from fbm.modeling.posterior import prob_over_normal, prob_over_normal_batch
+from fbm.utils.normal_cdf import ArrayLike
 
 def prob_cover(diff_mean: float, spread_line: float, sigma_diff: float = 13.0) -> float:
     """
@@ -12,15 +9,23 @@ def prob_cover(diff_mean: float, spread_line: float, sigma_diff: float = 13.0) -
     We assume point differential D = Home - Away ~ Normal(diff_mean, sigma_diff).
     P(cover) = P(D > spread_line) = 1 - CDF((spread_line - diff_mean)/sigma)
     Push probability is ignored (small for .5 lines).
+    Thin wrapper over posterior.prob_over_normal (market-facing argument order).
     """
-    z = (spread_line - diff_mean) / sigma_diff
-    return 1.0 - _norm_cdf(z)
+    return prob_over_normal(diff_mean, sigma_diff, spread_line)
 
 def prob_over(total_mean: float, total_line: float, sigma_total: float = 10.0) -> float:
     """
     Probability the game goes over a total_line.
     We assume T = Home + Away ~ Normal(total_mean, sigma_total).
     P(over) = P(T > total_line) = 1 - CDF((total_line - total_mean)/sigma)
+    Thin wrapper over posterior.prob_over_normal (market-facing argument order).
     """
-    z = (total_line - total_mean) / sigma_total
-    return 1.0 - _norm_cdf(z)
+    return prob_over_normal(total_mean, sigma_total, total_line)
+
+def prob_cover_batch(diff_mean: ArrayLike, spread_line: ArrayLike, sigma_diff: float = 13.0) -> np.ndarray:
+    """Vectorized prob_cover over arrays of games/lines (one CDF sweep)."""
+    return prob_over_normal_batch(diff_mean, sigma_diff, spread_line)
+
+def prob_over_batch(total_mean: ArrayLike, total_line: ArrayLike, sigma_total: float = 10.0) -> np.ndarray:
+    """Vectorized prob_over over arrays of games/lines (one CDF sweep)."""
+    return prob_over_normal_batch(total_mean, sigma_total, total_line)
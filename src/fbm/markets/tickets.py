@@ -0,0 +1,48 @@
+"""
+Ticket schema shared by the CLI, CSV writers and notifiers.
+
+Tickets carry native numbers (odds, probabilities, edge, EV, stake); they are
+rendered for display (console, summary, notifiers) via TICKET_FORMATS. The
+CSVs use TICKET_CSV_FORMATS instead: probabilities, edge and EV are written
+as plain floats rounded to 6 places, and stakes as cents.
+Values that are already strings (e.g. tickets read back from a CSV) pass through.
+"""
+from typing import Any, Callable, Dict, List
+
+TICKET_HEADERS: List[str] = [
+    "game_id", "market", "side_or_bet", "odds_am", "odds_dec",
+    "line", "fair_prob", "model_prob", "edge", "ev_per_dollar", "kelly_stake",
+]
+
+TICKET_FORMATS: Dict[str, Callable[[Any], str]] = {
+    "odds_dec": "{:.4f}".format,
+    "fair_prob": "{:.4f}".format,
+    "model_prob": "{:.4f}".format,
+    "edge": "{:+.4f}".format,
+    "ev_per_dollar": "{:+.4f}".format,
+    "kelly_stake": "{:.2f}".format,
+}
+
+def _csv_float(v: Any) -> float:
+    return round(float(v), 6)
+
+# CSV files are for machines: no padding/sign formatting, csv.writer's str(float) does the rest
+TICKET_CSV_FORMATS: Dict[str, Callable[[Any], Any]] = {
+    "odds_dec": _csv_float,
+    "fair_prob": _csv_float,
+    "model_prob": _csv_float,
+    "edge": _csv_float,
+    "ev_per_dollar": _csv_float,
+    "kelly_stake": "{:.2f}".format,
+}
+
+def format_field(key: str, value: Any) -> Any:
+    """Render one ticket field for output; strings and unknown keys are left as-is."""
+    fmt = TICKET_FORMATS.get(key)
+    if fmt is None or isinstance(value, str):
+        return value
+    return fmt(value)
+
+def format_ticket(t: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a ticket with numeric fields rendered per TICKET_FORMATS."""
+    return {k: format_field(k, v) for k, v in t.items()}
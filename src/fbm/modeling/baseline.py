@@ -1,5 +1,10 @@
-import math
-from typing import Dict, Optional
+from itertools import repeat
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from fbm.modeling.posterior import cover_prob_batch, over_prob_batch
+from fbm.utils.normal_cdf import norm_cdf, norm_cdf_batch
 
 class BaselineModel:
     """
@@ -8,6 +13,12 @@ class BaselineModel:
       - hfa_points: home-field advantage added to home rating
       - sigma_diff: stdev (points) of score differential
       - sigma_total: stdev (points) of total score
+
+    For slate scoring the ratings are also held as a dense vector + team->index
+    map, rebuilt lazily when `ratings` is reassigned (assign a new dict rather
+    than mutating it in place); models built with from_arrays keep only the
+    vector until the dict is first read. win_prob_home results are memoized per
+    (home, away, hfa, sigma) and dropped on the same reassignment.
     """
 
     def __init__(
@@ -17,32 +28,128 @@ class BaselineModel:
         sigma_diff: float = 13.0,
         sigma_total: float = 10.0,
     ) -> None:
-        self.ratings: Dict[str, float] = ratings or {}
+        self.ratings = ratings or {}
         self.hfa_points: float = float(hfa_points)
         self.sigma_diff: float = float(sigma_diff)
         self.sigma_total: float = float(sigma_total)
 
+    @classmethod
+    def from_arrays(cls, teams: Sequence[str], ratings: np.ndarray, **kwargs) -> "BaselineModel":
+        """
+        Build from parallel (teams, ratings vector) arrays. The vector and
+        team->index map become the model's storage as-is; the `ratings` dict
+        is only materialized if something asks for it.
+        """
+        vals = np.asarray(ratings, dtype=float)
+        team_ix = {t: i for i, t in enumerate(teams)}
+        if len(team_ix) != len(vals):  # duplicate team names: last one wins, as in a dict
+            return cls(ratings=dict(zip(teams, vals.tolist())), **kwargs)
+        model = cls(**kwargs)
+        rvec = np.zeros(len(vals) + 1, dtype=float)
+        rvec[:-1] = vals
+        model._team_ix, model._rvec = team_ix, rvec
+        model._ratings = None
+        return model
+
+    @property
+    def ratings(self) -> Dict[str, float]:
+        if self._ratings is None:  # array-backed (from_arrays): build the dict view once
+            self._ratings = dict(zip(self._team_ix, self._rvec[:-1].tolist()))
+        return self._ratings
+
+    @ratings.setter
+    def ratings(self, value: Dict[str, float]) -> None:
+        self._ratings: Dict[str, float] = value
+        self._team_ix: Dict[str, int] = {}
+        self._rvec: Optional[np.ndarray] = None
+        self._wp_cache: Dict[Tuple[str, str, float, float], float] = {}
+
+    def _vectors(self) -> Tuple[Dict[str, int], np.ndarray]:
+        """(team -> index, ratings vector); the last slot is 0.0 for unknown teams."""
+        if self._rvec is None:
+            self._team_ix = {t: i for i, t in enumerate(self._ratings)}
+            rvec = np.zeros(len(self._ratings) + 1, dtype=float)
+            rvec[:-1] = np.fromiter(self._ratings.values(), dtype=float, count=len(self._ratings))
+            self._rvec = rvec
+        return self._team_ix, self._rvec
+
+    def team_indices(self, teams: Sequence[str]) -> np.ndarray:
+        """Map team names to indices into the ratings vector (unknown -> 0.0 slot)."""
+        ix, rvec = self._vectors()
+        # map() drives the dict lookups from C (no generator frame per team)
+        return np.fromiter(map(ix.get, teams, repeat(len(rvec) - 1)), dtype=np.intp, count=len(teams))
+
     def rating(self, team: str) -> float:
         return float(self.ratings.get(team, 0.0))
 
-    @staticmethod
-    def _phi(x: float) -> float:
-        """Standard normal CDF Φ(x)."""
-        # Φ(x) = 0.5 * (1 + erf(x / sqrt(2)))
-        return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+    _phi = staticmethod(norm_cdf)  # standard normal CDF Φ(x)
 
     def win_prob_home(self, home_team: str, away_team: str) -> float:
         """
         P(home_score - away_score > 0) when diff ~ Normal(mean, sigma_diff)
         mean = (rating_home - rating_away + hfa_points)
         """
-        mean = self.rating(home_team) - self.rating(away_team) + self.hfa_points
+        key = (home_team, away_team, self.hfa_points, self.sigma_diff)
+        p = self._wp_cache.get(key)
+        if p is None:
+            # one .get per team on the ratings dict itself (str hashes are cached)
+            r = self.ratings
+            mean = float(r.get(home_team, 0.0)) - float(r.get(away_team, 0.0)) + self.hfa_points
+            if self.sigma_diff <= 0:
+                # Degenerate; treat as coin flip if no variance
+                p = 0.5
+            else:
+                # P(diff > 0) = Φ(z)
+                p = self._phi(mean / self.sigma_diff)
+            self._wp_cache[key] = p
+        return p
+
+    def mean_diffs(self, home_idx: np.ndarray, away_idx: np.ndarray) -> np.ndarray:
+        """Expected home margin per game of a slate: r_home - r_away + hfa."""
+        _, rvec = self._vectors()
+        return rvec[home_idx] - rvec[away_idx] + self.hfa_points
+
+    def score_slate(
+        self, home_idx: np.ndarray, away_idx: np.ndarray, *, mean_diff: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Vectorized home win probabilities for a slate, given team indices
+        from team_indices(): Φ((r_home - r_away + hfa) / sigma_diff).
+        Pass mean_diff (from mean_diffs) to reuse margins already computed.
+        """
         if self.sigma_diff <= 0:
-            # Degenerate; treat as coin flip if no variance
-            return 0.5
-        z = mean / self.sigma_diff
-        # P(diff > 0) = Φ(z)
-        return self._phi(z)
+            return np.full(len(home_idx), 0.5)
+        mean = self.mean_diffs(home_idx, away_idx) if mean_diff is None else mean_diff
+        # P(diff > 0) = Φ(mean / sigma), same arithmetic as win_prob_home
+        return norm_cdf_batch(mean / self.sigma_diff)
+
+    win_probs_home = score_slate
+
+    def cover_probs_home(
+        self, home_idx: np.ndarray, away_idx: np.ndarray, home_spreads: np.ndarray,
+        *, mean_diff: Optional[np.ndarray] = None, mc_n: int = 0, mc_seed: Optional[int] = None,
+        mc_rng: Optional[np.random.Generator] = None,
+    ) -> np.ndarray:
+        """
+        Vectorized P(home covers) for a slate: margin ~ N(r_home - r_away + hfa,
+        sigma_diff^2) against each home spread, in one batched CDF call, or
+        estimated from mc_n shared Monte Carlo draws when mc_n > 0 (taken from
+        mc_rng if given, else seeded by mc_seed).
+        """
+        if mean_diff is None:
+            mean_diff = self.mean_diffs(home_idx, away_idx)
+        return cover_prob_batch(mean_diff, self.sigma_diff, home_spreads, n=mc_n, seed=mc_seed, rng=mc_rng)
+
+    def over_probs(
+        self, total_lines: np.ndarray, league_total_mean: float, *,
+        mc_n: int = 0, mc_seed: Optional[int] = None, mc_rng: Optional[np.random.Generator] = None,
+    ) -> np.ndarray:
+        """Vectorized P(over) for each total line: total ~ N(league_total_mean, sigma_total^2) (MC if mc_n > 0)."""
+        return over_prob_batch(league_total_mean, self.sigma_total, total_lines, n=mc_n, seed=mc_seed, rng=mc_rng)
+
+    def win_prob_home_batch(self, home_teams: Sequence[str], away_teams: Sequence[str]) -> np.ndarray:
+        """Vectorized win_prob_home over parallel sequences of home/away teams."""
+        return self.score_slate(self.team_indices(home_teams), self.team_indices(away_teams))
 
     def __repr__(self) -> str:
         return (
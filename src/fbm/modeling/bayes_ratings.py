@@ -1,11 +1,17 @@
 from typing import Dict, List, Tuple
 import numpy as np
 
-def _teams_index(results: List[dict]) -> Dict[str, int]:
-    teams = set()
-    for g in results:
-        teams.add(g["home_team"]); teams.add(g["away_team"])
-    return {t: i for i, t in enumerate(sorted(teams))}
+def _teams_index(results: List[dict]) -> Tuple[Dict[str, int], np.ndarray, np.ndarray]:
+    """
+    Sorted team -> index map plus contiguous int64 home/away index arrays,
+    from one np.unique over all team names (no per-game dict lookups).
+    """
+    n_games = len(results)
+    names = [g["home_team"] for g in results] + [g["away_team"] for g in results]
+    teams, inverse = np.unique(np.asarray(names, dtype=str), return_inverse=True)
+    inverse = inverse.astype(np.int64, copy=False).ravel()
+    idx = {t: i for i, t in enumerate(teams.tolist())}
+    return idx, inverse[:n_games], inverse[n_games:]
 
 def fit_bayes_ratings(
     results: List[dict],
@@ -20,29 +26,34 @@ def fit_bayes_ratings(
       y = (home_pts - away_pts - hfa_points) ≈ (R_home - R_away) + ε,  ε ~ N(0, σ^2)
     Prior: R ~ N(0, τ^2 I) -> ridge penalty λ = σ^2 / τ^2 (we use λ=l2_lambda directly).
 
+    The normal equations (XᵀX + λI) β = Xᵀy are accumulated directly from the
+    sparse home/away index arrays; the (G, T) design matrix is never materialized.
+
     Returns: (ratings_dict, team_index_map)
     """
     if not results:
         return {}, {}
 
-    idx = _teams_index(results)
+    idx, h, a = _teams_index(results)
     n_teams = len(idx)
-    rows = []
-    ys = []
-
-    for g in results:
-        h = idx[g["home_team"]]; a = idx[g["away_team"]]
-        y = float(g["home_pts"]) - float(g["away_pts"]) - float(hfa_points)
-        row = np.zeros(n_teams, dtype=float)
-        row[h] = 1.0; row[a] = -1.0
-        rows.append(row); ys.append(y)
-
-    X = np.vstack(rows)                 # (G, T)
-    y = np.asarray(ys, dtype=float)     # (G,)
-
-    lam = float(l2_lambda)
-    A = X.T @ X + lam * np.eye(n_teams)
-    b = X.T @ y
+    n_games = len(results)
+    hfa = float(hfa_points)
+
+    y = np.fromiter(
+        (float(g["home_pts"]) - float(g["away_pts"]) - hfa for g in results),
+        dtype=np.float64, count=n_games,
+    )
+
+    # XᵀX has only four nonzero contributions per game; sum the COO triplets
+    # (row, col, value) straight into the (T, T) system with bincount.
+    rows = np.concatenate([h, a, h, a])
+    cols = np.concatenate([h, a, a, h])
+    vals = np.repeat([1.0, 1.0, -1.0, -1.0], n_games)
+    A = np.bincount(rows * n_teams + cols, weights=vals, minlength=n_teams * n_teams)
+    A = A.reshape(n_teams, n_teams)
+    A[np.diag_indices(n_teams)] += float(l2_lambda)
+    b = (np.bincount(h, weights=y, minlength=n_teams)
+         - np.bincount(a, weights=y, minlength=n_teams))
     beta = np.linalg.solve(A, b)        # unconstrained
 
     if enforce_sum_zero:
@@ -1,18 +1,17 @@
 """
 Posterior predictive utilities under a Normal model.
 
-Closed-form CDF helpers + Monte Carlo simulators + MC confidence intervals.
+Closed-form CDF helpers (scalar + batched) + Monte Carlo simulators + MC confidence intervals.
+cover_prob / over_prob dispatch to the exact closed form unless MC is asked for.
 Python 3.9 compatible.
 """
-from math import erf, sqrt
+from math import exp, pi, sqrt
 from typing import Optional, Tuple
 import numpy as np
 
-SQRT2 = sqrt(2.0)
-
-def _phi(z: float) -> float:
-    """Standard Normal CDF using erf."""
-    return 0.5 * (1.0 + erf(z / SQRT2))
+from fbm.utils.normal_cdf import (
+    ArrayLike, HAVE_FAST_PPF, norm_cdf as _phi, norm_cdf_batch as _phi_batch, norm_ppf_batch
+)
 
 # ---------------------------
 # Closed-form Normal helpers
@@ -43,20 +42,76 @@ def prob_total_over(mean_total: float, sigma_total: float, total_line: float) ->
     """P(Over total) when total ~ N(mean_total, sigma_total^2)."""
     return prob_over_normal(mean_total, sigma_total, total_line)
 
+# ---------------------------
+# Batched Normal helpers
+# ---------------------------
+
+def prob_over_normal_batch(mean: ArrayLike, sigma: ArrayLike, line: ArrayLike) -> np.ndarray:
+    """
+    Vectorized prob_over_normal: P(X > line), X ~ N(mean, sigma^2), elementwise
+    over broadcast arrays. sigma <= 0 is a point mass at mean (0.5 at the line).
+    """
+    if np.ndim(sigma) == 0 and sigma > 0:
+        # common case (one model sigma for the whole slate): a single ufunc chain
+        z = (np.asarray(line, dtype=float) - np.asarray(mean, dtype=float)) / float(sigma)
+        return 1.0 - _phi_batch(z)
+    mean, sigma, line = np.broadcast_arrays(
+        np.asarray(mean, dtype=float), np.asarray(sigma, dtype=float), np.asarray(line, dtype=float)
+    )
+    degenerate = sigma <= 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = (line - mean) / np.where(degenerate, 1.0, sigma)
+    p = 1.0 - _phi_batch(z)
+    if degenerate.any():
+        p = np.where(degenerate, 0.5 * (np.sign(mean - line) + 1.0), p)
+    return p
+
+def prob_cover_spread_batch(mean_diff: ArrayLike, sigma_diff: ArrayLike, home_spread: ArrayLike) -> np.ndarray:
+    """Vectorized prob_cover_spread over arrays of games/lines."""
+    return prob_over_normal_batch(mean_diff, sigma_diff, home_spread)
+
+def prob_total_over_batch(mean_total: ArrayLike, sigma_total: ArrayLike, total_line: ArrayLike) -> np.ndarray:
+    """Vectorized prob_total_over over arrays of games/lines."""
+    return prob_over_normal_batch(mean_total, sigma_total, total_line)
+
 # ---------------------------
 # Monte Carlo posterior sims
 # ---------------------------
 
+_U_EPS = 1e-12  # keeps the stratified uniforms strictly inside (0, 1) for Φ⁻¹
+
+def _antithetic_normals(n: int, seed: Optional[int] = None, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    n standard normals as antithetic pairs (z, -z), the z stratified: one
+    uniform per equal-probability stratum of (0, 1), mapped through Φ⁻¹.
+    The P(X > line) estimands are 1-D indicator integrals with a single
+    jump, so only the stratum holding the jump contributes variance, far
+    less than the pairing alone leaves. Without scipy, Φ⁻¹ is a Python loop
+    that costs more than the variance saves, so the z are plain standard
+    normals. Odd n drops the last -z. A caller-owned `rng` is drawn from
+    (and advanced) instead of seeding a fresh generator.
+    """
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    m = (n + 1) // 2
+    if not HAVE_FAST_PPF:
+        z = rng.standard_normal(m)
+        return np.concatenate([z, -z])[:n]
+    u = (np.arange(m) + rng.random(m)) / m
+    z = norm_ppf_batch(np.clip(u, _U_EPS, 1.0 - _U_EPS))
+    return np.concatenate([z, -z])[:n]
+
 def simulate_cover_spread(
     mean_diff: float,
     sigma: float,
     spread: float,
     n: int = 10000,
-    seed: Optional[int] = None
+    seed: Optional[int] = None,
+    *,
+    rng: Optional[np.random.Generator] = None,
 ) -> float:
-    """Monte Carlo estimate of P(home margin > spread)."""
-    rng = np.random.default_rng(seed)
-    sims = rng.normal(loc=mean_diff, scale=sigma, size=n)
+    """Monte Carlo estimate of P(home margin > spread) (antithetic draws)."""
+    sims = mean_diff + sigma * _antithetic_normals(n, seed, rng)
     return float(np.mean(sims > spread))
 
 def simulate_total_over(
@@ -64,13 +119,40 @@ def simulate_total_over(
     sigma_total: float,
     line: float,
     n: int = 10000,
-    seed: Optional[int] = None
+    seed: Optional[int] = None,
+    *,
+    rng: Optional[np.random.Generator] = None,
 ) -> float:
-    """Monte Carlo estimate of P(total points > line)."""
-    rng = np.random.default_rng(seed)
-    sims = rng.normal(loc=total_mean, scale=sigma_total, size=n)
+    """Monte Carlo estimate of P(total points > line) (antithetic draws)."""
+    sims = total_mean + sigma_total * _antithetic_normals(n, seed, rng)
     return float(np.mean(sims > line))
 
+_MC_BLOCK = 1 << 22  # max games x draws materialized at once by the batched simulator
+
+def simulate_over_normal_batch(
+    mean: ArrayLike, sigma: ArrayLike, line: ArrayLike, n: int = 10000, seed: Optional[int] = None,
+    *, rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Monte Carlo P(X > line) per game, X ~ N(mean, sigma^2), for whole arrays:
+    one set of n antithetic draws is shared by every game (common random
+    numbers), so each entry equals the scalar simulators' result for the same
+    seed (or generator state). Games are swept in blocks to bound the
+    (games, n) sample matrix.
+    """
+    mean, sigma, line = (
+        np.ravel(a) for a in np.broadcast_arrays(
+            np.asarray(mean, dtype=float), np.asarray(sigma, dtype=float), np.asarray(line, dtype=float)
+        )
+    )
+    z = _antithetic_normals(n, seed, rng)
+    out = np.empty(len(mean))
+    step = max(1, _MC_BLOCK // max(1, n))
+    for i in range(0, len(mean), step):
+        sims = mean[i:i + step, None] + sigma[i:i + step, None] * z
+        out[i:i + step] = np.mean(sims > line[i:i + step, None], axis=1)
+    return out
+
 # ---------------------------
 # MC confidence intervals
 # ---------------------------
@@ -90,4 +172,104 @@ def mc_ci_normal(p_hat: float, n: int, z: float = 1.96) -> Tuple[float, float]:
     se = (p * (1.0 - p) / max(1, n)) ** 0.5
     lo = max(0.0, p - z * se)
     hi = min(1.0, p + z * se)
-    return (lo, hi)
\ No newline at end of file
+    return (lo, hi)
+
+def mc_ci_normal_batch(p_hat: ArrayLike, n: int, z: float = 1.96) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized mc_ci_normal over an array of MC estimates sharing one sample
+    count n (e.g. a slate from simulate_over_normal_batch): (lo, hi) arrays.
+    """
+    p = np.clip(np.asarray(p_hat, dtype=float), 0.0, 1.0)
+    if n <= 0:
+        return p, p.copy()
+    half = z * np.sqrt(p * (1.0 - p) / n)
+    return np.maximum(0.0, p - half), np.minimum(1.0, p + half)
+
+def prob_over_ci_delta(
+    mean: float, sigma: float, line: float, mean_se: float, z: float = 1.96
+) -> Tuple[float, float]:
+    """
+    Simulation-free CI for P(X > line) given uncertainty `mean_se` in the mean,
+    via the delta method on Φ: se_p = φ((line - mean)/sigma) / sigma * mean_se.
+    """
+    p = prob_over_normal(mean, sigma, line)
+    if sigma <= 0 or mean_se <= 0:
+        return (p, p)
+    zz = (line - mean) / sigma
+    se = exp(-0.5 * zz * zz) / sqrt(2.0 * pi) / sigma * mean_se
+    return (max(0.0, p - z * se), min(1.0, p + z * se))
+
+# ---------------------------
+# Exact-vs-MC dispatch
+# ---------------------------
+
+_METHODS = ("auto", "exact", "mc")
+
+def _use_mc(method: str, n: int) -> bool:
+    if method not in _METHODS:
+        raise ValueError(f"method must be one of {_METHODS}")
+    return method == "mc" or (method == "auto" and n > 0)
+
+def cover_prob(
+    mean_diff: float,
+    sigma: float,
+    spread: float,
+    *,
+    method: str = "auto",
+    n: int = 0,
+    seed: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None,
+) -> float:
+    """
+    P(home margin > spread). Closed form (no sampling) unless method='mc' or,
+    with method='auto', a positive sample count n is requested. Draws come
+    from `rng` when given (one generator shared across calls), else from seed.
+    """
+    if _use_mc(method, n):
+        return simulate_cover_spread(mean_diff, sigma, spread, n=n or 10000, seed=seed, rng=rng)
+    return prob_cover_spread(mean_diff, sigma, spread)
+
+def over_prob(
+    total_mean: float,
+    sigma_total: float,
+    line: float,
+    *,
+    method: str = "auto",
+    n: int = 0,
+    seed: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None,
+) -> float:
+    """P(total > line); same dispatch rules as cover_prob."""
+    if _use_mc(method, n):
+        return simulate_total_over(total_mean, sigma_total, line, n=n or 10000, seed=seed, rng=rng)
+    return prob_total_over(total_mean, sigma_total, line)
+
+def cover_prob_batch(
+    mean_diff: ArrayLike,
+    sigma: ArrayLike,
+    spread: ArrayLike,
+    *,
+    method: str = "auto",
+    n: int = 0,
+    seed: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """Vectorized cover_prob over arrays of games; same dispatch rules."""
+    if _use_mc(method, n):
+        return simulate_over_normal_batch(mean_diff, sigma, spread, n=n or 10000, seed=seed, rng=rng)
+    return prob_cover_spread_batch(mean_diff, sigma, spread)
+
+def over_prob_batch(
+    total_mean: ArrayLike,
+    sigma_total: ArrayLike,
+    line: ArrayLike,
+    *,
+    method: str = "auto",
+    n: int = 0,
+    seed: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """Vectorized over_prob over arrays of games; same dispatch rules."""
+    if _use_mc(method, n):
+        return simulate_over_normal_batch(total_mean, sigma_total, line, n=n or 10000, seed=seed, rng=rng)
+    return prob_total_over_batch(total_mean, sigma_total, line)
@@ -1,17 +1,32 @@
+import csv
 from pathlib import Path
 from typing import Dict
 
+import numpy as np
+
+from fbm.utils.cache import mtime_lru_cache
+
+@mtime_lru_cache(maxsize=8, copy=dict)
 def load_ratings_csv(path: Path) -> Dict[str, float]:
     """
     CSV schema: team,rating
-    Returns {} if file doesn't exist.
+    Returns {} if file doesn't exist. Quoted team names (as csv.writer emits
+    them) are supported.
+    Parsed contents are cached on (path, mtime); callers get a fresh copy.
     """
-    ratings: Dict[str, float] = {}
+    path = Path(path)
     if not path.exists():
-        return ratings
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if not line.strip() or line.lower().startswith("team,"):
-            continue
-        team, val = line.split(",", 1)
-        ratings[team.strip()] = float(val.strip())
-    return ratings
+        return {}
+    lines = [
+        ln for ln in path.read_text(encoding="utf-8").splitlines()
+        if ln.strip() and not ln.lower().startswith("team,")
+    ]
+    if not lines:
+        return {}
+    if any('"' in ln for ln in lines):
+        # quoted team names (commas inside a name): let the csv module split them
+        return {team.strip(): float(rating) for team, rating in csv.reader(lines)}
+    # one C-level parse into a (N, 2) string table, then a vectorized float cast
+    table = np.loadtxt(lines, delimiter=",", dtype=str, comments=None, ndmin=2)
+    teams = np.char.strip(table[:, 0]).tolist()
+    return dict(zip(teams, table[:, 1].astype(float).tolist()))
@@ -1,12 +1,26 @@
-from typing import Dict, List
+import math
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+# Module-level bindings for the per-game helpers (skip the math attribute lookup).
+_exp = math.exp
+_log1p = math.log1p
+
+# Logistic slope that makes 1/(1+exp(-1.7 z)) track Φ(z).
+_LOGISTIC_SLOPE = 1.7
 
 def _win_prob_from_rating_diff(diff_pts: float, scale_pts: float = 13.0) -> float:
     """
     Convert rating differential (pts) -> win probability via a smooth logistic
     proxy for a Normal CDF. Larger scale_pts => flatter curve (more conservative).
+
+    exp is kept on purpose: on CPython/NumPy, math.exp / np.exp beat the
+    transcendental-free alternatives (Elliott sigmoid: 0.08+ max error; 7/6
+    tanh Padé: ~1e-6 error but ~3-5x slower than exp scalar and vectorized).
     """
-    import math
-    return 1.0 / (1.0 + math.exp(-(diff_pts / scale_pts) * 1.7))
+    return 1.0 / (1.0 + _exp(-(diff_pts / scale_pts) * _LOGISTIC_SLOPE))
 
 def _mov_multiplier(margin_pts: float, *, scale_pts: float = 7.0, cap: float = 2.0) -> float:
     """
@@ -14,9 +28,8 @@ def _mov_multiplier(margin_pts: float, *, scale_pts: float = 7.0, cap: float = 2
     - Uses a gentle log growth: 1 + log1p(|margin| / scale)
     - Capped by `cap` to avoid blowout inflation.
     """
-    import math
     m = abs(margin_pts)
-    return min(cap, 1.0 + math.log1p(m / max(1e-9, scale_pts)))
+    return min(cap, 1.0 + _log1p(m / max(1e-9, scale_pts)))
 
 def fit_elo_ratings(
     results: List[dict],
@@ -29,6 +42,7 @@ def fit_elo_ratings(
     use_mov: bool = True,           # enable margin-of-victory weighting
     mov_scale_pts: float = 7.0,     # MOV scale (pts) in the log growth
     mov_cap: float = 2.0,           # maximum MOV multiplier
+    batch: bool = False,            # vectorized per-pass updates (see below)
 ) -> Dict[str, float]:
     """
     Very small Elo-like fitter on final scores.
@@ -41,39 +55,185 @@ def fit_elo_ratings(
       mult = MOV-multiplier (if enabled)
       R_home += k * mult * err
       R_away -= k * mult * err
+
+    batch=True swaps the sequential game-by-game pass for a vectorized one:
+    every game in a pass is scored against the ratings at the start of that
+    pass and all deltas are applied together. Much faster on large seasons,
+    but results differ slightly from the sequential default.
     """
-    ratings = dict(start_ratings or {})
+    if batch:
+        return _fit_elo_batch(
+            results, start_ratings=start_ratings, k=k, hfa_points=hfa_points, iters=iters,
+            scale_pts=scale_pts, use_mov=use_mov, mov_scale_pts=mov_scale_pts, mov_cap=mov_cap,
+        )
+
+    kernel = _jit_kernel()
+    if kernel is not None:
+        team2idx, R, h, a, hp, ap = _elo_arrays(results, start_ratings)
+        kernel(R, h, a, hp, ap, float(k), float(hfa_points), int(iters), float(scale_pts),
+               bool(use_mov), float(mov_scale_pts), float(mov_cap))
+        return {t: float(R[i]) for t, i in team2idx.items()}
 
-    def r(team: str) -> float:
-        return ratings.get(team, 0.0)
+    # Intern team names to small ints (start_ratings first, then order of
+    # appearance) and keep ratings in a flat list: indexed loads/stores
+    # instead of string-hashed dict probes in the hot loop.
+    team2idx: Dict[str, int] = {t: i for i, t in enumerate(start_ratings or {})}
+    R: List[float] = list((start_ratings or {}).values())
 
-    def add(team: str, delta: float):
-        ratings[team] = r(team) + delta
+    def _id(team: str) -> int:
+        i = team2idx.get(team)
+        if i is None:
+            i = team2idx[team] = len(R)
+            R.append(0.0)
+        return i
+
+    # Loop-invariant per game: outcome in [0,1] and k * MOV multiplier depend
+    # only on final scores, so compute them once rather than every iteration.
+    games = []
+    for g in results:
+        hp = g["home_pts"]; ap = g["away_pts"]
+        if hp > ap:
+            actual = 1.0
+        elif hp < ap:
+            actual = 0.0
+        else:
+            actual = 0.5
+        mult = _mov_multiplier(float(hp - ap), scale_pts=mov_scale_pts, cap=mov_cap) if use_mov else 1.0
+        games.append((_id(g["home_team"]), _id(g["away_team"]), actual, k * mult))
 
     for _ in range(max(1, iters)):
-        for g in results:
-            home = g["home_team"]; away = g["away_team"]
-            hp = g["home_pts"]; ap = g["away_pts"]
+        for h, a, actual, k_mult in games:
+            rh = R[h]; ra = R[a]
+            p_home = _win_prob_from_rating_diff((rh + hfa_points) - ra, scale_pts=scale_pts)
+            delta = k_mult * (actual - p_home)
+            R[h] = rh + delta
+            R[a] = ra - delta
+
+    return {t: R[i] for t, i in team2idx.items()}
 
-            # Outcome to [0,1]
-            if hp > ap:
-                actual = 1.0
-            elif hp < ap:
-                actual = 0.0
-            else:
-                actual = 0.5
+def _elo_arrays(
+    results: List[dict], start_ratings: Dict[str, float]
+) -> Tuple[Dict[str, int], np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Intern teams to ids (start_ratings first, then order of appearance) and
+    build (team2idx, R, home_idx, away_idx, home_pts, away_pts) arrays.
+    """
+    team2idx: Dict[str, int] = {t: i for i, t in enumerate(start_ratings or {})}
+    for g in results:
+        team2idx.setdefault(g["home_team"], len(team2idx))
+        team2idx.setdefault(g["away_team"], len(team2idx))
+    R = np.zeros(len(team2idx), dtype=np.float64)
+    for t, v in (start_ratings or {}).items():
+        R[team2idx[t]] = v
 
-            diff = (r(home) + hfa_points) - r(away)
-            p_home = _win_prob_from_rating_diff(diff, scale_pts=scale_pts)
-            err = actual - p_home
+    n = len(results)
+    h = np.fromiter((team2idx[g["home_team"]] for g in results), dtype=np.int64, count=n)
+    a = np.fromiter((team2idx[g["away_team"]] for g in results), dtype=np.int64, count=n)
+    hp = np.fromiter((g["home_pts"] for g in results), dtype=np.float64, count=n)
+    ap = np.fromiter((g["away_pts"] for g in results), dtype=np.float64, count=n)
+    return team2idx, R, h, a, hp, ap
 
-            margin = float(hp - ap)
-            mult = _mov_multiplier(margin, scale_pts=mov_scale_pts, cap=mov_cap) if use_mov else 1.0
+def _fit_elo_kernel(
+    R: np.ndarray, h: np.ndarray, a: np.ndarray, hp: np.ndarray, ap: np.ndarray,
+    k: float, hfa: float, iters: int, scale: float,
+    use_mov: bool, mov_scale: float, mov_cap: float,
+) -> None:
+    """
+    Sequential Elo passes over index arrays, updating R in place. Same maths
+    as the dict loop in fit_elo_ratings, written with scalar loads/stores only
+    so numba can compile it; used only when numba is installed.
+    """
+    mov_den = max(1e-9, mov_scale)
+    slope = _LOGISTIC_SLOPE / scale
+    n = h.shape[0]
+    # outcome and k * MOV weight depend only on the scores: hoist out of the passes
+    actual = np.empty(n)
+    k_mult = np.empty(n)
+    for i in range(n):
+        if hp[i] > ap[i]:
+            actual[i] = 1.0
+        elif hp[i] < ap[i]:
+            actual[i] = 0.0
+        else:
+            actual[i] = 0.5
+        mult = min(mov_cap, 1.0 + math.log1p(abs(hp[i] - ap[i]) / mov_den)) if use_mov else 1.0
+        k_mult[i] = k * mult
+    for _ in range(max(1, iters)):
+        for i in range(n):
+            hi = h[i]; ai = a[i]
+            diff = (R[hi] + hfa) - R[ai]
+            p_home = 1.0 / (1.0 + math.exp(-diff * slope))
+            delta = k_mult[i] * (actual[i] - p_home)
+            R[hi] += delta
+            R[ai] -= delta
 
-            add(home, k * mult * err)
-            add(away, -k * mult * err)
+_JIT_UNSET = object()
+_fit_elo_kernel_jit = _JIT_UNSET
 
-    return ratings
+def _jit_kernel():
+    """
+    numba-compiled _fit_elo_kernel, or None without numba. numba is optional
+    and slow to import, so it is only imported on the first sequential fit.
+    """
+    global _fit_elo_kernel_jit
+    if _fit_elo_kernel_jit is _JIT_UNSET:
+        try:
+            from numba import njit
+        except ImportError:  # pragma: no cover
+            _fit_elo_kernel_jit = None
+        else:
+            _fit_elo_kernel_jit = njit(cache=True)(_fit_elo_kernel)
+    return _fit_elo_kernel_jit
+
+def _fit_elo_batch(
+    results: List[dict],
+    *,
+    start_ratings: Dict[str, float],
+    k: float,
+    hfa_points: float,
+    iters: int,
+    scale_pts: float,
+    use_mov: bool,
+    mov_scale_pts: float,
+    mov_cap: float,
+) -> Dict[str, float]:
+    """fit_elo_ratings(batch=True): one vectorized pass over all games per iter."""
+    team2idx, R, h, a, hp, ap = _elo_arrays(results, start_ratings)
+    n = len(results)
+    actual = np.where(hp > ap, 1.0, np.where(hp < ap, 0.0, 0.5))
+    if use_mov:
+        # loop-invariant: depends only on final scores
+        mult = np.minimum(mov_cap, 1.0 + np.log1p(np.abs(hp - ap) / max(1e-9, mov_scale_pts)))
+    else:
+        mult = np.ones(n)
+
+    slope = _LOGISTIC_SLOPE / scale_pts
+    for _ in range(max(1, iters)):
+        diff = (R[h] + hfa_points) - R[a]
+        p_home = 1.0 / (1.0 + np.exp(-diff * slope))
+        delta = k * mult * (actual - p_home)
+        np.add.at(R, h, delta)
+        np.add.at(R, a, -delta)
+
+    return {t: float(R[i]) for t, i in team2idx.items()}
+
+def ratings_to_arrays(ratings: Dict[str, float]) -> Tuple[List[str], np.ndarray]:
+    """Split a ratings dict into (teams, float64 ratings vector), in dict order."""
+    teams = list(ratings)
+    return teams, np.fromiter(ratings.values(), dtype=np.float64, count=len(teams))
+
+def normalize_ratings_array(vals: np.ndarray, *, target_std: float = 3.0) -> np.ndarray:
+    """
+    normalize_ratings on a ratings vector, in place (also returned): re-center
+    to mean 0 and rescale to target_std unless the ratings are flat.
+    """
+    if len(vals) == 0:
+        return vals
+    vals -= vals.mean()
+    std = math.sqrt(float(np.dot(vals, vals)) / len(vals))
+    if std > 1e-9:
+        vals *= target_std / std
+    return vals
 
 def normalize_ratings(
     ratings: Dict[str, float],
@@ -84,18 +244,9 @@ def normalize_ratings(
     Re-center ratings to mean 0 and shrink std to target_std (default 3 pts).
     Keeps early-season probabilities in a reasonable range.
     """
-    import math
     if not ratings:
         return ratings
-    vals = list(ratings.values())
-    mean = sum(vals) / len(vals)
-    centered = {t: v - mean for t, v in ratings.items()}
-
-    vals2 = list(centered.values())
-    var = sum(v * v for v in vals2) / len(vals2)
-    std = math.sqrt(var) if var > 0 else 0.0
-
-    if std <= 1e-9:
-        return centered
-    scale = target_std / std
-    return {t: v * scale for t, v in centered.items()}
\ No newline at end of file
+    # one contiguous float vector: mean, variance and the rescale are C-level passes
+    teams, vals = ratings_to_arrays(ratings)
+    normalize_ratings_array(vals, target_std=target_std)
+    return dict(zip(teams, vals.tolist()))
@@ -1,83 +1,142 @@
-from typing import List, Dict, Any, Tuple
-import urllib.request
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+import heapq
+import http.client
 import urllib.parse
-import urllib.error
+
+from fbm.markets.tickets import format_ticket
 
 Ticket = Dict[str, Any]
 
+@lru_cache(maxsize=4096)
 def _parse_float(s: str, default: float = 0.0) -> float:
     try:
         return float(str(s).replace("$", "").replace(",", ""))
     except Exception:
         return default
 
+def _num(v: Any) -> float:
+    """Numeric ticket field: native numbers as-is, CSV strings parsed (cached)."""
+    if isinstance(v, (int, float)):
+        return v
+    return _parse_float(v)
+
 def select_top_tickets(tickets: List[Ticket], top_n: int = 3) -> List[Ticket]:
     """
     Sort by edge desc, then kelly_stake desc. Returns top_n.
-    Strings are like '+0.1234' and '1,234.56' per CSV schema.
+    Numeric fields are compared directly; strings like '+0.1234' and
+    '1,234.56' (CSV schema) are parsed.
+    Keys are parsed once per ticket; heapq.nlargest keeps it O(N log top_n)
+    with the same stable ordering as sorted(..., reverse=True)[:top_n].
     """
-    return sorted(
+    return heapq.nlargest(
+        top_n,
         tickets,
-        key=lambda t: (_parse_float(t.get("edge", "0")), _parse_float(t.get("kelly_stake", "0"))),
-        reverse=True,
-    )[:top_n]
+        key=lambda t: (_num(t.get("edge", "0")), _num(t.get("kelly_stake", "0"))),
+    )
+
+_LINE_TMPL = (
+    "{game_id} · {market} {side_or_bet}{line_part} · odds {odds_am} ({odds_dec}) · "
+    "fair {fair_prob} · model {model_prob}{ci_part} · edge {edge} · EV {ev_per_dollar} · "
+    "stake ${kelly_stake}"
+)
+_MSG_LIMIT = 1000     # IFTTT-friendly message size
+_MSG_TRUNCATED = 980  # budget kept when the message has to be cut
+
+class _TicketFields(dict):
+    """format_map view of a ticket: missing fields render as '?'."""
+    def __missing__(self, key: str) -> str:
+        return "?"
+
+def _ticket_line(t: Ticket) -> str:
+    t = format_ticket(t)
+    fields = _TicketFields(t)
+    fields["line_part"] = f" · line {t['line']}" if t.get("line") else ""
+    fields["ci_part"] = (
+        f" · CI [{t['model_prob_lo']}..{t['model_prob_hi']}]"
+        if t.get("model_prob_lo") and t.get("model_prob_hi") else ""
+    )
+    fields["kelly_stake"] = t.get("kelly_stake", "0")
+    return _LINE_TMPL.format_map(fields)
 
 def build_title_and_message(
     tickets: List[Ticket], league: str, season: int, week: int, top_n: int = 3
 ) -> Tuple[str, str]:
     """
     Returns (title, message) for IFTTT. Message trimmed < ~1000 chars.
+    Lines are added against a running size budget; once the message would
+    pass the limit, whole lines are dropped back under the truncation budget.
     """
     title = f"FBM Picks — {league} {season} W{week}"
     top = select_top_tickets(tickets, top_n=top_n)
     if not top:
         return title, "No tickets passed filters."
 
-    lines = []
+    lines: List[str] = []
+    used = 0
+    truncated = False
     for t in top:
-        parts = [
-            f"{t.get('game_id','?')}",
-            f"{t.get('market','?')} {t.get('side_or_bet','?')}",
-        ]
-        if t.get("line"):
-            parts.append(f"line {t['line']}")
-        parts.extend([
-            f"odds {t.get('odds_am','?')} ({t.get('odds_dec','?')})",
-            f"fair {t.get('fair_prob','?')}",
-            f"model {t.get('model_prob','?')}",
-        ])
-        if t.get("model_prob_lo") and t.get("model_prob_hi"):
-            parts.append(f"CI [{t['model_prob_lo']}..{t['model_prob_hi']}]")
-        parts.extend([
-            f"edge {t.get('edge','?')}",
-            f"EV {t.get('ev_per_dollar','?')}",
-            f"stake ${t.get('kelly_stake','0')}",
-        ])
-        lines.append(" · ".join(parts))
+        line = _ticket_line(t)
+        used += len(line) + (1 if lines else 0)
+        lines.append(line)
+        if used > _MSG_LIMIT:
+            truncated = True
+            break
+
+    if truncated:
+        while lines and used > _MSG_TRUNCATED:
+            used -= len(lines.pop()) + (1 if lines else 0)
+        msg = "\n".join(lines) if lines else _ticket_line(top[0])[:_MSG_TRUNCATED]
+        return title, msg + "\n…(truncated)"
+    return title, "\n".join(lines)
+
+_IFTTT_HOST = "maker.ifttt.com"
+_conn: Optional[http.client.HTTPSConnection] = None
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+def _ifttt_connection(timeout: int) -> http.client.HTTPSConnection:
+    global _conn
+    if _conn is None:
+        _conn = http.client.HTTPSConnection(_IFTTT_HOST, timeout=timeout)
+    return _conn
 
-    msg = "\n".join(lines)
-    if len(msg) > 1000:
-        msg = msg[:980] + "\n…(truncated)"
-    return title, msg
+def _reset_connection() -> None:
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
 
-def post_ifttt(key: str, event: str, title: str, message: str) -> Tuple[bool, str]:
+def post_ifttt(key: str, event: str, title: str, message: str, timeout: int = 10) -> Tuple[bool, str]:
     """
     POST to IFTTT Webhooks:
       https://maker.ifttt.com/trigger/{event}/with/key/{key}
     Sends value1=title, value2=message. Returns (ok, info).
+    The HTTPS connection is kept alive and reused across calls; a connection
+    the server already closed is reopened once.
     """
-    url = f"https://maker.ifttt.com/trigger/fbm_picks/with/key/btPgWVfuA3QVq6MUJtc0wV"
+    path = (
+        f"/trigger/{urllib.parse.quote(event, safe='')}"
+        f"/with/key/{urllib.parse.quote(key, safe='')}"
+    )
     data = urllib.parse.urlencode({"value1": title, "value2": message}).encode("utf-8")
-    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/x-www-form-urlencoded"})
+    headers = {"Content-Type": "application/x-www-form-urlencoded", "Connection": "keep-alive"}
     try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            code = resp.getcode()
-            if 200 <= code < 300:
-                return True, f"ok ({code})"
-            return False, f"HTTP {code}"
-    except urllib.error.HTTPError as e:
-        return False, f"HTTPError {e.code}"
-    except urllib.error.URLError as e:
-        return False, f"URLError {e.reason}"
+        for attempt in range(2):
+            conn = _ifttt_connection(timeout)
+            try:
+                conn.request("POST", path, body=data, headers=headers)
+                resp = conn.getresponse()
+                resp.read()
+                break
+            except Exception as e:
+                _reset_connection()
+                if attempt or not isinstance(e, _STALE_CONNECTION_ERRORS):
+                    raise
+        code = resp.status
+        if 200 <= code < 300:
+            return True, f"ok ({code})"
+        return False, f"HTTPError {code}"
+    except (http.client.HTTPException, OSError) as e:
+        return False, f"URLError {e}"
     except Exception as e:
-        return False, f"Exception {e}"
\ No newline at end of file
+        return False, f"Exception {e}"
@@ -1,106 +1,166 @@
 import argparse
+import csv
+import json
 import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from typing import List, Set
 
-from fbm.utils.partitions import part_path
-from fbm.utils.io import ensure_dir
-from fbm.config.loader import load_config
+import numpy as np
 
-from fbm.data.ingest.odds_csv import load_odds_csv
-from fbm.data.ingest.results_csv import load_results_dir
+from fbm.utils.partitions import partition_set
+from fbm.utils.io import ensure_dir, ensure_dirs
+from fbm.config.loader import load_daily_config
+
+from fbm.data.ingest.odds_csv import load_odds_table
+from fbm.data.ingest.results_csv import iter_results_dir, result_date
 from fbm.data.fetch.theoddsapi import fetch_odds_to_csv, fetch_recent_scores_to_csv
 
-from fbm.markets.price_utils import (
-    implied_prob_from_american,
-    remove_vig_two_way,
-    american_to_decimal,
-)
-from fbm.markets.kelly import kelly_fractional
-from fbm.markets.edge import ev_and_edge
+from fbm.markets.slate import SIDES_PER_ROW, price_slate
+from fbm.markets.tickets import TICKET_CSV_FORMATS, TICKET_HEADERS, format_ticket
 from fbm.modeling.baseline import BaselineModel
+from fbm.modeling.posterior import mc_ci_normal_batch
 from fbm.modeling.ratings_csv import load_ratings_csv
-from fbm.modeling.ratings_fit import fit_elo_ratings, normalize_ratings
-from fbm.modeling.bayes_ratings import fit_bayes_ratings
-from fbm.modeling.posterior import prob_cover_spread, prob_total_over
-from fbm.utils.csvout import write_csv
-from fbm.utils.history import append_csv
+from fbm.modeling.ratings_fit import normalize_ratings_array, ratings_to_arrays
+from fbm.utils.csvout import WRITE_BUFFER, row_values, write_csv_rows
+from fbm.utils.history import append_csv_rows
+
+try:  # optional C JSON encoder for the notify payload
+    import orjson as _orjson
+except ImportError:  # pragma: no cover
+    _orjson = None
 
 SPORT_SLUG = {
     "NFL": "americanfootball_nfl",
     "CFB": "americanfootball_ncaaf",
 }
 
-def _ensure_sample_odds_csv(bronze_path: Path) -> Path:
-    csv_path = bronze_path / "odds.csv"
-    if not csv_path.exists():
-        csv_path.write_text(
-            "game_id,home_team,away_team,home_ml,away_ml,home_spread,home_spread_price,away_spread_price,total_line,over_price,under_price\n"
-            "W1-001,Chiefs,Bengals,-120,110,-2.5,-110,-110,48.5,-110,-110\n"
-            "W1-002,49ers,Cowboys,-140,120,-3.5,-110,-110,45.0,-105,-115\n",
-            encoding="utf-8",
-        )
-        print(f"[fbm] Created sample odds file at {csv_path}")
-    return csv_path
+# sample inputs written when no live data is available
+_SAMPLE_ODDS_CSV = (
+    "game_id,home_team,away_team,home_ml,away_ml,home_spread,home_spread_price,away_spread_price,total_line,over_price,under_price\n"
+    "W1-001,Chiefs,Bengals,-120,110,-2.5,-110,-110,48.5,-110,-110\n"
+    "W1-002,49ers,Cowboys,-140,120,-3.5,-110,-110,45.0,-105,-115\n"
+)
+_SAMPLE_RESULTS_CSV = (
+    "date,home_team,away_team,home_pts,away_pts\n"
+    "2024-12-01,Chiefs,Bengals,27,24\n"
+    "2024-12-08,49ers,Cowboys,23,20\n"
+)
 
-def _ensure_sample_results_csv(season_silver_path: Path) -> Path:
-    games_dir = season_silver_path / "games"
-    ensure_dir(games_dir)
-    csv_path = games_dir / "results.csv"
+# sample CSVs already seen on disk this process (skips the stat on repeat daily() calls)
+_SAMPLES_PRESENT: Set[str] = set()
+
+def _ensure_sample_csv(csv_path: Path, text: str, kind: str) -> Path:
+    """Write `text` to csv_path unless it exists; checked on disk once per process."""
+    key = str(csv_path)
+    if key in _SAMPLES_PRESENT:
+        return csv_path
     if not csv_path.exists():
-        csv_path.write_text(
-            "date,home_team,away_team,home_pts,away_pts\n"
-            "2024-12-01,Chiefs,Bengals,27,24\n"
-            "2024-12-08,49ers,Cowboys,23,20\n",
-            encoding="utf-8",
-        )
-        print(f"[fbm] Created sample results file at {csv_path}")
+        ensure_dir(csv_path.parent)
+        csv_path.write_text(text, encoding="utf-8")
+        print(f"[fbm] Created sample {kind} file at {csv_path}")
+    _SAMPLES_PRESENT.add(key)
     return csv_path
 
-def _write_ratings_csv(path: Path, ratings: dict) -> None:
-    lines = ["team,rating"]
-    for team in sorted(ratings.keys()):
-        lines.append(f"{team},{ratings[team]:.6f}")
+def _ensure_sample_odds_csv(bronze_path: Path) -> Path:
+    return _ensure_sample_csv(bronze_path / "odds.csv", _SAMPLE_ODDS_CSV, "odds")
+
+def _ensure_sample_results_csv(games_dir: Path) -> Path:
+    return _ensure_sample_csv(games_dir / "results.csv", _SAMPLE_RESULTS_CSV, "results")
+
+def _write_ratings_csv(path: Path, teams: List[str], ratings: np.ndarray) -> None:
+    # parallel (teams, ratings) arrays; the bayes fit already returns teams in
+    # name order (np.unique), so the argsort only runs when needed
+    names = np.asarray(teams, dtype=str)
+    # ratings rendered by a single %-format call (C loop, no per-row f-strings)
+    vals = (("%.6f\n" * len(teams)) % tuple(ratings.tolist())).split()
+    if (names[:-1] <= names[1:]).all():
+        rows = zip(teams, vals)
+    else:
+        rows = ((teams[i], vals[i]) for i in np.argsort(names, kind="stable").tolist())
+    # csv.writer quotes team names that contain commas or quotes
     ensure_dir(path.parent)
-    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with path.open("w", newline="", encoding="utf-8", buffering=WRITE_BUFFER) as f:
+        w = csv.writer(f, lineterminator="\n")
+        w.writerow(("team", "rating"))
+        w.writerows(rows)
 
 def _summarize_tickets(tickets):
     """Return (summary_text, total_stake, total_exp_ev) and a markdown table string."""
     total_stake = 0.0
     total_exp_ev = 0.0
     lines = []
-    for t in tickets:
-        stake = float(t["_stake_num"])
-        ev    = float(t["_ev_num"])
-        total_stake += stake
-        total_exp_ev += ev
-        # Compact one-liner
-        lines.append(f"{t['game_id']} {t['market']} {t['side_or_bet']} {t['odds_am']} | edge {t['edge']} | stake ${stake:,.0f}")
-    summary = "\n".join(lines)
-
-    # Markdown table (nice to view on GitHub)
     md = [
         "| Game | Market | Side | American | Decimal | Line | Fair | Model | Edge | EV/$ | Stake |",
         "|-----:|:------:|:----:|---------:|--------:|-----:|-----:|------:|-----:|-----:|------:|",
     ]
     for t in tickets:
+        # cents, as written to tickets.csv
+        stake = round(t["kelly_stake"], 2)
+        total_stake += stake
+        total_exp_ev += round(t["ev_per_dollar"] * t["kelly_stake"], 2)
+        f = format_ticket(t)
+        # Compact one-liner
+        lines.append(f"{t['game_id']} {t['market']} {t['side_or_bet']} {t['odds_am']} | edge {f['edge']} | stake ${stake:,.0f}")
+        # Markdown table (nice to view on GitHub)
         md.append(
-            f"| {t['game_id']} | {t['market']} | {t['side_or_bet']} | {t['odds_am']} | {t['odds_dec']} | "
-            f"{t['line']} | {t['fair_prob']} | {t['model_prob']} | {t['edge']} | {t['ev_per_dollar']} | ${float(t['_stake_num']):,.2f} |"
+            f"| {t['game_id']} | {t['market']} | {t['side_or_bet']} | {t['odds_am']} | {f['odds_dec']} | "
+            f"{t['line']} | {f['fair_prob']} | {f['model_prob']} | {f['edge']} | {f['ev_per_dollar']} | ${stake:,.2f} |"
         )
+    summary = "\n".join(lines)
     md.append("")
     md.append(f"**Total stake**: ${total_stake:,.2f}   |   **Expected profit**: ${total_exp_ev:,.2f}")
     return summary, total_stake, total_exp_ev, "\n".join(md)
 
+def _json_bytes(obj) -> bytes:
+    """UTF-8 JSON body: orjson when installed (bytes directly), else stdlib json."""
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+# closing recap of a daily run, written in one go
+_PIPELINE_FOOTER = (
+    "\nPipeline (live if configured):\n"
+    " - fetch results (live or sample) -> season_silver/games/results.csv\n"
+    " - fit ratings -> season_silver/teams/ratings_fitted_{method}.csv\n"
+    " - fetch odds (live or sample) -> bronze/week/odds.csv\n"
+    " - compute edges + kelly -> gold/week/tickets.csv + gold/summary.md + season_history.csv\n"
+    "Done.\n"
+)
+
+# console echo of one ticket: a %-template filled straight from the candidate
+# tuple (cheaper than format_map on the dict); %-style has no thousands
+# separator, so the stake arrives pre-rendered with ",.2f"
+_TICKET_ECHO = "%s,%s,%s,%d,%.4f,%s,%.4f,%.4f,%+.4f,%+.4f,$%s\n"
+
+def _iter_tickets(candidates, echo: List[str]):
+    """
+    Yield ticket dicts for already-filtered priced candidates, appending each
+    console line to `echo` (written out in one go by the caller). Tickets hold
+    numbers; see fbm.markets.tickets for rendering.
+    """
+    add_line = echo.append
+    for c in candidates:
+        game_id, market, side, am, dec, line, fair, modelp, edge, ev, stake = c
+        t = {
+            "game_id": game_id, "market": market, "side_or_bet": side,
+            "odds_am": am, "odds_dec": dec, "line": line,
+            "fair_prob": fair, "model_prob": modelp,
+            "edge": edge, "ev_per_dollar": ev, "kelly_stake": stake,
+        }
+        add_line(_TICKET_ECHO % (c[:10] + (format(stake, ",.2f"),)))
+        yield t
+
 def daily(season: int, week: int, league: str, config_path: str,
           mc_n: int = None, mc_seed: int = None,
           notify_ifttt: bool = False, notify_top_n: int = 3,
           use_live: bool = True, scores_days: int = 14):
-    cfg = load_config(config_path)
-    bankroll = float(cfg["betting"]["bankroll"])
-    kelly_frac = float(cfg["betting"]["kelly_fraction"])
-    min_edge = float(cfg["betting"].get("min_edge_pct", 0.0))
-    min_stake = float(cfg["betting"].get("min_kelly_stake", 0.0))
+    cfg = load_daily_config(config_path)
+    bankroll, kelly_frac = cfg.bankroll, cfg.kelly_fraction
+    min_edge, min_stake = cfg.min_edge, cfg.min_stake
 
     def passes(edge: float, stake: float) -> bool:
         return (edge >= min_edge) and (stake >= min_stake)
@@ -108,228 +168,189 @@ def daily(season: int, week: int, league: str, config_path: str,
     print(f"[fbm] Running daily pipeline | league={league} season={season} week={week}")
     if mc_n is not None:
         print(f"[posterior] Monte Carlo: n={mc_n}, seed={mc_seed if mc_seed is not None else '-'}")
+    # ATS/OU stay on the exact Normal CDF unless the config opts into MC pricing
+    # (model.mc_closed_form: false); only then does --mc-n reach the slate
+    mc_price_n = 0 if cfg.mc_closed_form else (mc_n or 0)
     print(
         f"[config] file={config_path} | bankroll=${bankroll:,.0f}, "
         f"kelly_fraction={kelly_frac}, min_edge={min_edge:.3f}, min_kelly=${min_stake:,.2f}"
     )
 
-    dataroot = cfg["paths"]["datalake"]
-    bronze = part_path(dataroot, "bronze", league, season, week)
-    silver = part_path(dataroot, "silver", league, season, week)
-    gold = part_path(dataroot, "gold", league, season, week)
-    print("Planned output locations (creating if missing):")
-    print(f" - bronze → {bronze}")
-    print(f" - silver → {silver}")
-    print(f" - gold   → {gold}")
-    ensure_dir(bronze); ensure_dir(silver); ensure_dir(gold)
-
-    season_silver = part_path(dataroot, "silver", league, season, None)
-    ensure_dir(Path(season_silver) / "teams")
-    ensure_dir(Path(season_silver) / "games")
+    bronze, silver, gold, _, season_gold, teams_dir, games_dir = partition_set(
+        cfg.datalake, league, season, week
+    )
+    sys.stdout.write(
+        "Planned output locations (creating if missing):\n"
+        f" - bronze → {bronze}\n - silver → {silver}\n - gold   → {gold}\n"
+    )
+    ensure_dirs(bronze, silver, gold, teams_dir, games_dir)
 
     odds_key = os.environ.get("ODDS_API_KEY")
     sport = SPORT_SLUG.get(league, "americanfootball_nfl")
 
+    # Odds don't depend on the fit: when live, fetch them on a worker thread so
+    # the request overlaps the scores fetch, results load and ratings fit
+    odds_csv = bronze / "odds.csv"
+    odds_fetch = None
+    odds_fallback = False
+    if use_live and odds_key:
+        odds_pool = ThreadPoolExecutor(max_workers=1)
+        odds_fetch = odds_pool.submit(fetch_odds_to_csv, odds_key, sport, odds_csv)
+        odds_pool.shutdown(wait=False)
+
     # Scores for ratings fit (recent N days)
-    res_csv = Path(season_silver) / "games" / "results.csv"
+    res_csv = games_dir / "results.csv"
     if use_live and odds_key:
         try:
             fetch_recent_scores_to_csv(odds_key, sport, res_csv, days_from=scores_days)
             print(f"[live] results fetched -> {res_csv}")
         except Exception as e:
             print(f"[live] results fetch failed: {e}; using sample.")
-            _ensure_sample_results_csv(Path(season_silver))
+            _ensure_sample_results_csv(games_dir)
     else:
-        _ensure_sample_results_csv(Path(season_silver))
+        _ensure_sample_results_csv(games_dir)
 
-    ratings_path = Path(season_silver) / "teams" / "ratings.csv"
+    ratings_path = teams_dir / "ratings.csv"
     starting_ratings = load_ratings_csv(ratings_path)
     print(f"[ratings] starter: {len(starting_ratings)} from {ratings_path}")
 
-    games_dir = Path(season_silver) / "games"
-    results = load_results_dir(games_dir)
+    # one streamed scan: collect the games for the fit and the league scoring totals
+    results = []
+    pts_total = n_totals = 0
+    for g in iter_results_dir(games_dir):
+        results.append(g)
+        hp, ap = g.get("home_pts"), g.get("away_pts")
+        # iter_results_csv already coerced the scores: ints are usable, the
+        # rest ("" or unparsable text) is skipped without re-casting
+        if type(hp) is int and type(ap) is int:
+            pts_total += hp + ap
+            n_totals += 1
+    results.sort(key=result_date)
     print(f"[results] loaded {len(results)} games from {games_dir} (*.csv)")
 
     # Fit ratings
-    model_cfg = cfg.get("model", {})
-    method = str(model_cfg.get("ratings_method", "elo")).lower()
+    method = cfg.ratings_method
+    hfa_cfg, sigma_diff, sigma_total = cfg.hfa_points, cfg.sigma_diff, cfg.sigma_total
 
+    # fitters are imported on their branch only (keeps CLI start-up lean)
     if method == "bayes":
-        l2_lambda = float(model_cfg.get("bayes_l2_lambda", 4.0))
-        hfa_cfg = float(model_cfg.get("hfa_points", 2.0))
+        from fbm.modeling.bayes_ratings import fit_bayes_ratings
         fitted, _ = fit_bayes_ratings(
             results,
             hfa_points=hfa_cfg,
-            l2_lambda=l2_lambda,
+            l2_lambda=cfg.bayes_l2_lambda,
             start_ratings=starting_ratings or None,
             enforce_sum_zero=True,
         )
-        target_std = float(model_cfg.get("ratings_target_std", 3.0))
-        fitted = normalize_ratings(fitted, target_std=target_std)
         method_used = "bayes"
     else:
-        hfa_cfg = float(model_cfg.get("hfa_points", 2.0))
-        scale_pts = float(model_cfg.get("sigma_diff", 13.0))
-        elo_k = float(model_cfg.get("elo_k", 20.0))
-        elo_iters = int(model_cfg.get("elo_iters", 2))
-        use_mov = bool(model_cfg.get("mov_enabled", True))
-        mov_scale = float(model_cfg.get("mov_scale_pts", 7.0))
-        mov_cap = float(model_cfg.get("mov_cap", 2.0))
+        from fbm.modeling.ratings_fit import fit_elo_ratings
         fitted = fit_elo_ratings(
             results,
             start_ratings=starting_ratings,
-            k=elo_k,
+            k=cfg.elo_k,
             hfa_points=hfa_cfg,
-            iters=elo_iters,
-            scale_pts=scale_pts,
-            use_mov=use_mov,
-            mov_scale_pts=mov_scale,
-            mov_cap=mov_cap,
+            iters=cfg.elo_iters,
+            scale_pts=sigma_diff,
+            use_mov=cfg.mov_enabled,
+            mov_scale_pts=cfg.mov_scale_pts,
+            mov_cap=cfg.mov_cap,
+            batch=cfg.elo_batch,
         )
-        target_std = float(model_cfg.get("ratings_target_std", 3.0))
-        fitted = normalize_ratings(fitted, target_std=target_std)
         method_used = "elo"
 
-    fitted_path = Path(season_silver) / "teams" / f"ratings_fitted_{method_used}.csv"
-    _write_ratings_csv(fitted_path, fitted)
-    print(f"[ratings] fitted ({method_used}): {len(fitted)} saved to {fitted_path}")
+    # ratings as parallel (teams, vector) arrays from here on
+    teams, rvals = ratings_to_arrays(fitted)
+    normalize_ratings_array(rvals, target_std=cfg.ratings_target_std)
+
+    fitted_path = teams_dir / f"ratings_fitted_{method_used}.csv"
+    _write_ratings_csv(fitted_path, teams, rvals)
+    print(f"[ratings] fitted ({method_used}): {len(teams)} saved to {fitted_path}")
 
-    model = BaselineModel(
-        ratings=fitted,
-        hfa_points=float(model_cfg.get("hfa_points", 2.0)),
-        sigma_diff=float(model_cfg.get("sigma_diff", 13.0)),
-        sigma_total=float(model_cfg.get("sigma_total", 10.0)),
+    model = BaselineModel.from_arrays(
+        teams, rvals,
+        hfa_points=hfa_cfg, sigma_diff=sigma_diff, sigma_total=sigma_total,
     )
 
-    # League totals mean from results
-    if results:
-        totals = [
-            int(g["home_pts"]) + int(g["away_pts"])
-            for g in results
-            if g.get("home_pts") not in ("", None) and g.get("away_pts") not in ("", None)
-        ]
-        league_total_mean = sum(totals) / len(totals) if totals else float(model_cfg.get("league_total_mean", 45.0))
+    # League totals mean from results (accumulated while loading them)
+    if n_totals:
+        league_total_mean = pts_total / n_totals
     else:
-        league_total_mean = float(model_cfg.get("league_total_mean", 45.0))
+        league_total_mean = cfg.league_total_mean
     print(f"[totals] league_total_mean = {league_total_mean:.2f}")
 
     # Odds
-    odds_csv = Path(bronze) / "odds.csv"
-    if use_live and odds_key:
+    if odds_fetch is not None:
         try:
-            fetch_odds_to_csv(odds_key, sport, odds_csv)
+            odds_fetch.result()
             print(f"[live] odds fetched -> {odds_csv}")
         except Exception as e:
             print(f"[live] odds fetch failed: {e}; using sample.")
-            odds_csv = _ensure_sample_odds_csv(Path(bronze))
+            odds_csv = _ensure_sample_odds_csv(bronze)
+            odds_fallback = True
     else:
-        odds_csv = _ensure_sample_odds_csv(Path(bronze))
-
-    rows = load_odds_csv(odds_csv)
-
-    headers = [
-        "game_id","market","side_or_bet","odds_am","odds_dec",
-        "line","fair_prob","model_prob","edge","ev_per_dollar","kelly_stake",
-    ]
+        odds_csv = _ensure_sample_odds_csv(bronze)
+
+    rows = load_odds_table(odds_csv)  # column-major: pricing reads it without per-row dicts
+    # Nothing to price, or a live run whose odds fetch fell back to the sample
+    # slate: skip pricing/outputs/notify (FBM_PROCESS_SAMPLE=1 prices the sample anyway)
+    if odds_fallback and not os.environ.get("FBM_PROCESS_SAMPLE"):
+        print("[odds] live odds unavailable; skipping pricing of the sample slate.")
+        rows = []
+    elif not rows:
+        print(f"[odds] no odds rows in {odds_csv}; nothing to price.")
+    if not rows:
+        sys.stdout.write(_PIPELINE_FOOTER)
+        return
+
+    headers = TICKET_HEADERS
     # season history gets extra context:
     season_headers = headers + ["league","season","week","run_ts"]
-    tickets = []
-
-    # Printing header
-    print("\nTickets (filtered):")
-    print("GameID,Market,Side/Bet,Odds(Am),Odds(Dec),Line,FairProb,ModelProb,Edge,EV_per_$,KellyStake")
-
-    for r in rows:
-        game_id = r["game_id"]; home = r["home_team"]; away = r["away_team"]
-
-        def _push(market, side, am, dec, line, fair, modelp, edge, ev, stake):
-            if (edge >= min_edge) and (stake >= min_stake):
-                print(f"{game_id},{market},{side},{am},{dec:.4f},{line},{fair:.4f},{modelp:.4f},{edge:+.4f},{ev:+.4f},${stake:,.2f}")
-                tickets.append({
-                    "game_id": game_id, "market": market, "side_or_bet": side,
-                    "odds_am": str(am), "odds_dec": f"{dec:.4f}", "line": str(line),
-                    "fair_prob": f"{fair:.4f}", "model_prob": f"{modelp:.4f}",
-                    "edge": f"{edge:+.4f}", "ev_per_dollar": f"{ev:+.4f}",
-                    "kelly_stake": f"{stake:.2f}",
-                    # numeric for summary math
-                    "_stake_num": f"{stake:.2f}",
-                    "_ev_num": f"{ev*stake:.2f}",
-                })
-
-        # Moneyline HOME
-        try:
-            h_ml = int(r["home_ml"]); a_ml = int(r["away_ml"])
-        except Exception:
-            h_ml = a_ml = 0
-        if h_ml != 0 and a_ml != 0:
-            p_h_imp = implied_prob_from_american(h_ml); p_a_imp = implied_prob_from_american(a_ml)
-            p_h_fair, _ = remove_vig_two_way(p_h_imp, p_a_imp)
-            ml_model = model.win_prob_home(home, away)
-            dec_h = american_to_decimal(h_ml)
-            ev_ml, edge_ml = ev_and_edge(ml_model, p_h_fair, dec_h)
-            stake_ml = kelly_fractional(ml_model, dec_h, bankroll=bankroll, fraction=kelly_frac)
-            _push("ML", "HOME", h_ml, dec_h, "", p_h_fair, ml_model, edge_ml, ev_ml, stake_ml)
-
-        # ATS HOME + AWAY
-        try:
-            sp_line = float(r["home_spread"])
-            sp_home_price = int(r["home_spread_price"]); sp_away_price = int(r["away_spread_price"])
-            p_sp_h_imp = implied_prob_from_american(sp_home_price); p_sp_a_imp = implied_prob_from_american(sp_away_price)
-            p_sp_h_fair, p_sp_a_fair = remove_vig_two_way(p_sp_h_imp, p_sp_a_imp)
-            mean_diff = fitted.get(home, 0.0) - fitted.get(away, 0.0) + model.hfa_points
-            sp_model_home = prob_cover_spread(mean_diff, model.sigma_diff, sp_line)
-            dec_sp_home = american_to_decimal(sp_home_price)
-            ev_sp_h, edge_sp_h = ev_and_edge(sp_model_home, p_sp_h_fair, dec_sp_home)
-            stake_sp_h = kelly_fractional(sp_model_home, dec_sp_home, bankroll=bankroll, fraction=kelly_frac)
-            _push("ATS", "HOME", sp_home_price, dec_sp_home, f"{sp_line:+.1f}", p_sp_h_fair, sp_model_home, edge_sp_h, ev_sp_h, stake_sp_h)
-
-            sp_model_away = 1.0 - sp_model_home
-            dec_sp_away = american_to_decimal(sp_away_price)
-            ev_sp_a, edge_sp_a = ev_and_edge(sp_model_away, p_sp_a_fair, dec_sp_away)
-            stake_sp_a = kelly_fractional(sp_model_away, dec_sp_away, bankroll=bankroll, fraction=kelly_frac)
-            _push("ATS", "AWAY", sp_away_price, dec_sp_away, f"{-sp_line:+.1f}", p_sp_a_fair, sp_model_away, edge_sp_a, ev_sp_a, stake_sp_a)
-        except Exception:
-            pass
-
-        # Totals OVER + UNDER
-        try:
-            tot_line = float(r["total_line"])
-            over_price = int(r["over_price"]); under_price = int(r["under_price"])
-            p_over_imp = implied_prob_from_american(over_price); p_under_imp = implied_prob_from_american(under_price)
-            p_over_fair, p_under_fair = remove_vig_two_way(p_over_imp, p_under_imp)
-            tot_model_over = prob_total_over(league_total_mean, model.sigma_total, tot_line)
-            dec_over = american_to_decimal(over_price)
-            ev_ou_o, edge_ou_o = ev_and_edge(tot_model_over, p_over_fair, dec_over)
-            stake_ou_o = kelly_fractional(tot_model_over, dec_over, bankroll=bankroll, fraction=kelly_frac)
-            _push("OU", "OVER", over_price, dec_over, f"{tot_line:.1f}", p_over_fair, tot_model_over, edge_ou_o, ev_ou_o, stake_ou_o)
-
-            tot_model_under = 1.0 - tot_model_over
-            dec_under = american_to_decimal(under_price)
-            ev_ou_u, edge_ou_u = ev_and_edge(tot_model_under, p_under_fair, dec_under)
-            stake_ou_u = kelly_fractional(tot_model_under, dec_under, bankroll=bankroll, fraction=kelly_frac)
-            _push("OU", "UNDER", under_price, dec_under, f"{tot_line:.1f}", p_under_fair, tot_model_under, edge_ou_u, ev_ou_u, stake_ou_u)
-        except Exception:
-            pass
-
-    # Save weekly tickets CSV
-    out_csv = Path(gold) / "tickets.csv"
-    write_csv(out_csv, tickets, headers)
+
+    # Ticket table header + one line per ticket, written to stdout in one go
+    echo: List[str] = [
+        "\nTickets (filtered):\n",
+        "GameID,Market,Side/Bet,Odds(Am),Odds(Dec),Line,FairProb,ModelProb,Edge,EV_per_$,KellyStake\n",
+    ]
+    # sized for the worst case (every market side of every row), trimmed after
+    tickets: List[dict] = [None] * (SIDES_PER_ROW * len(rows))
+    n_tickets = 0
+    for t in _iter_tickets(
+        price_slate(rows, model, league_total_mean, bankroll=bankroll, kelly_fraction=kelly_frac,
+                    min_edge=min_edge, min_stake=min_stake,
+                    workers=cfg.slate_workers, processes=cfg.slate_processes,
+                    mc_n=mc_price_n, mc_seed=mc_seed),
+        echo,
+    ):
+        tickets[n_tickets] = t
+        n_tickets += 1
+    del tickets[n_tickets:]
+    sys.stdout.write("".join(echo))
+
+    if mc_price_n:
+        # ATS/OU model probs are MC estimates: one vectorized CI over all of them
+        # (the i.i.d. bound, conservative for the stratified antithetic draws)
+        mc_probs = [t["model_prob"] for t in tickets if t["market"] != "ML"]
+        if mc_probs:
+            lo, hi = mc_ci_normal_batch(mc_probs, mc_price_n)
+            print(f"[posterior] MC 95% CI half-width on ticket probs: max ±{float((hi - lo).max()) / 2:.4f}")
+
+    # Save weekly tickets CSV; the rendered rows are reused for the history
+    ticket_rows = list(row_values(tickets, headers, TICKET_CSV_FORMATS))
+    out_csv = gold / "tickets.csv"
+    write_csv_rows(out_csv, ticket_rows, headers)
     print(f"\nSaved {len(tickets)} tickets to {out_csv}")
 
     # Append season history (gold/season_history.csv)
     run_ts = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-    season_history_path = Path(part_path(cfg["paths"]["datalake"], "gold", league, season, None)) / "season_history.csv"
-    season_rows = []
-    for t in tickets:
-        row = {k: t.get(k, "") for k in headers}
-        row.update({"league": league, "season": season, "week": week, "run_ts": run_ts})
-        season_rows.append(row)
-    append_csv(season_history_path, season_rows, season_headers)
-    print(f"[history] appended {len(season_rows)} rows -> {season_history_path}")
+    season_history_path = season_gold / "season_history.csv"
+    ctx = [league, season, week, run_ts]
+    n_hist = append_csv_rows(season_history_path, (r + ctx for r in ticket_rows), season_headers)
+    print(f"[history] appended {n_hist} rows -> {season_history_path}")
 
     # Write a markdown summary for quick viewing in GitHub
     summary_txt, total_stake, total_exp_ev, md_table = _summarize_tickets(tickets)
-    md_path = Path(gold) / "summary.md"
+    md_path = gold / "summary.md"
     md_path.write_text(
         f"# {league} {season} Week {week} — Model Picks\n\n"
         f"**Total stake:** ${total_stake:,.2f}  \n"
@@ -342,7 +363,7 @@ def daily(season: int, week: int, league: str, config_path: str,
     # Optional IFTTT notification (cleaner text)
     if notify_ifttt and tickets:
         try:
-            import json, urllib.request
+            import urllib.request
             key = os.environ.get("IFTTT_KEY")
             event = os.environ.get("IFTTT_EVENT", "fbm_picks")
             if not key:
@@ -352,26 +373,92 @@ def daily(season: int, week: int, league: str, config_path: str,
                 # compact top-N lines
                 lines = []
                 for t in tickets[:top_n]:
-                    lines.append(f"{t['market']} {t['side_or_bet']} {t['odds_am']} | edge {t['edge']} | stake ${float(t['_stake_num']):,.0f}")
+                    lines.append(f"{t['market']} {t['side_or_bet']} {t['odds_am']} | edge {t['edge']:+.4f} | stake ${round(t['kelly_stake'], 2):,.0f}")
                 lines.append(f"— Total stake: ${total_stake:,.0f} | Exp. profit: ${total_exp_ev:,.0f}")
                 msg_title = f"{league} {season} W{week}: Top {min(top_n, len(tickets))} tickets"
                 msg_body = "\n".join(lines)
                 payload = {"value1": msg_title, "value2": msg_body}
                 url = f"https://maker.ifttt.com/trigger/{event}/with/key/{key}"
-                req = urllib.request.Request(url, data=json.dumps(payload).encode("utf-8"), headers={"Content-Type": "application/json"})
-                with urllib.request.urlopen(req, timeout=10) as resp:
-                    print(f"[notify] IFTTT: ok ({resp.getcode()})")
+                req = urllib.request.Request(url, data=_json_bytes(payload), headers={"Content-Type": "application/json"})
+                # sent in the background; main() joins it before exiting
+                _start_background(_send_ifttt_request, req)
         except Exception as e:
             print(f"[notify] IFTTT error: {e}")
 
-    print("\nPipeline (live if configured):")
-    print(" - fetch results (live or sample) -> season_silver/games/results.csv")
-    print(" - fit ratings -> season_silver/teams/ratings_fitted_{method}.csv")
-    print(" - fetch odds (live or sample) -> bronze/week/odds.csv")
-    print(" - compute edges + kelly -> gold/week/tickets.csv + gold/summary.md + season_history.csv")
-    print("Done.")
+    sys.stdout.write(_PIPELINE_FOOTER)
+
+# non-daemon worker threads started by daily() (e.g. the IFTTT POST), joined by main()
+_BACKGROUND: List[threading.Thread] = []
+
+def _start_background(target, *args) -> threading.Thread:
+    t = threading.Thread(target=target, args=args, daemon=False)
+    t.start()
+    _BACKGROUND.append(t)
+    return t
+
+def _join_background() -> None:
+    while _BACKGROUND:
+        _BACKGROUND.pop().join()
+
+def _send_ifttt_request(req) -> None:
+    import urllib.request
+    try:
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            print(f"[notify] IFTTT: ok ({resp.getcode()})")
+    except Exception as e:
+        print(f"[notify] IFTTT error: {e}")
+
+# `daily` options the argv fast path understands: flag -> (daily() kwarg, type);
+# type None marks a store_true switch.
+_DAILY_OPTS = {
+    "--season": ("season", int), "--week": ("week", int), "--league": ("league", str),
+    "--config": ("config_path", str), "--mc-n": ("mc_n", int), "--mc-seed": ("mc_seed", int),
+    "--notify-top-n": ("notify_top_n", int), "--scores-days": ("scores_days", int),
+    "--notify-ifttt": ("notify_ifttt", None), "--no-live": ("use_live", None),
+}
+
+def _fast_daily_args(argv: List[str]):
+    """
+    Parse the plain `daily --opt value ...` shape without building the argparse
+    parser. Returns daily() kwargs, or None for anything else (help, prefixes,
+    --opt=value, bad values, missing required options) so argparse handles it
+    with its usual messages.
+    """
+    if not argv or argv[0] != "daily":
+        return None
+    kw = {"league": "NFL", "config_path": "conf/default.yaml", "mc_n": None, "mc_seed": None,
+          "notify_ifttt": False, "notify_top_n": 3, "use_live": True, "scores_days": 14}
+    i = 1
+    try:
+        while i < len(argv):
+            name, typ = _DAILY_OPTS[argv[i]]
+            if typ is None:
+                kw[name] = name != "use_live"
+                i += 1
+                continue
+            val = argv[i + 1]
+            if val.startswith("--"):
+                return None
+            kw[name] = typ(val)
+            i += 2
+    except (KeyError, IndexError, ValueError):
+        return None
+    if "season" not in kw or "week" not in kw or kw["league"] not in ("NFL", "CFB"):
+        return None
+    return kw
 
 def main():
+    try:
+        _main()
+    finally:
+        _join_background()
+
+def _main():
+    fast = _fast_daily_args(sys.argv[1:])
+    if fast is not None:
+        daily(**fast)
+        return
+
     parser = argparse.ArgumentParser(prog="fbm", description="Football Bayesian Model CLI")
     sub = parser.add_subparsers(dest="cmd", required=True)
 
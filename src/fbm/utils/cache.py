@@ -0,0 +1,53 @@
+"""
+File-content memoization keyed on (path, mtime_ns, size, inode).
+
+A loader wrapped with mtime_lru_cache re-parses only when the file changed
+(rewritten in place or replaced via os.replace). Cached values are shared,
+so each hit hands the caller a copy made by `copy` (deepcopy by default).
+"""
+import copy as _copy
+import inspect
+import os
+from functools import lru_cache, wraps
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+def _stat_key(path) -> tuple:
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+def mtime_lru_cache(
+    maxsize: int = 32, copy: Callable[[Any], Any] = _copy.deepcopy
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Decorator for loaders whose first argument is a file path. A missing file
+    bypasses the cache so the loader's own handling (raise / empty) applies.
+    The wrapped function exposes cache_clear() / cache_info(). The loader's
+    own defaults (including a default path) are applied before the cache key
+    is built, so `load()` and `load(default)` share one entry.
+    """
+    def deco(fn: Callable[..., T]) -> Callable[..., T]:
+        sig = inspect.signature(fn)
+
+        @lru_cache(maxsize=maxsize)
+        def _cached(path_str: str, _key: tuple, *args, **kwargs):
+            return fn(path_str, *args, **kwargs)
+
+        @wraps(fn)
+        def wrapper(*a, **kw):
+            bound = sig.bind(*a, **kw)
+            bound.apply_defaults()
+            path, *args = bound.args
+            kwargs = bound.kwargs
+            path_str = os.fspath(path)
+            try:
+                key = _stat_key(path_str)
+            except OSError:
+                return fn(path, *args, **kwargs)
+            return copy(_cached(path_str, key, *args, **kwargs))
+
+        wrapper.cache_clear = _cached.cache_clear
+        wrapper.cache_info = _cached.cache_info
+        return wrapper
+    return deco
@@ -1,11 +1,59 @@
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
 import csv
+from operator import itemgetter
 
-def write_csv(path: Path, rows: List[Dict[str, Any]], headers: List[str]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=headers)
-        w.writeheader()
-        for r in rows:
-            w.writerow({k: r.get(k, "") for k in headers})
+from fbm.utils.io import ensure_dir
+
+Formatters = Dict[str, Callable[[Any], Any]]  # column -> renderer (str, or a value csv can stringify)
+
+WRITE_BUFFER = 1 << 16  # 64 KiB: a slate's CSV goes out in a handful of write() calls
+
+def row_values(
+    rows: Iterable[Dict[str, Any]], headers: List[str], formatters: Optional[Formatters] = None
+) -> Iterator[List[Any]]:
+    """
+    Lazily turn dict rows into value lists in `headers` order: missing keys
+    become "", other keys are dropped, and non-string values of formatted
+    columns are rendered through `formatters` (column -> callable).
+    Complete rows are read with one itemgetter call; rows missing a header
+    key fall back to per-key .get().
+    """
+    formatters = formatters or {}
+    fmt_cols = [(i, formatters[h]) for i, h in enumerate(headers) if h in formatters]
+    if len(headers) > 1:
+        getter = itemgetter(*headers)
+    else:  # itemgetter of one key returns the bare value, of none raises
+        def getter(r):
+            return tuple(r[h] for h in headers)
+    for r in rows:
+        try:
+            out = list(getter(r))
+        except KeyError:
+            out = [r.get(h, "") for h in headers]
+        for i, fmt in fmt_cols:
+            v = out[i]
+            if not isinstance(v, str):
+                out[i] = fmt(v)
+        yield out
+
+def write_csv(
+    path: Path, rows: Iterable[Dict[str, Any]], headers: List[str], formatters: Optional[Formatters] = None
+) -> None:
+    """
+    Stream rows (any iterable, e.g. a generator) to a CSV with the given headers.
+    Missing keys are written as "", keys not in headers are ignored. Numeric
+    values are rendered at write time through `formatters` (column -> callable).
+    """
+    write_csv_rows(path, row_values(rows, headers, formatters), headers)
+
+def write_csv_rows(path: Path, rows: Iterable[Sequence[Any]], headers: List[str]) -> None:
+    """
+    write_csv for rows already rendered as value sequences in `headers` order
+    (e.g. from row_values): no dict lookups or formatting, values written as-is.
+    """
+    ensure_dir(path.parent)
+    with path.open("w", newline="", encoding="utf-8", buffering=WRITE_BUFFER) as f:
+        w = csv.writer(f)
+        w.writerow(headers)
+        w.writerows(rows)
@@ -1,15 +1,36 @@
+import csv
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Iterable, List, Dict, Any, Optional, Sequence
 
-def append_csv(path: Path, rows: List[Dict[str, Any]], headers: List[str]) -> None:
+from fbm.utils.csvout import WRITE_BUFFER, Formatters, row_values
+from fbm.utils.io import ensure_dir
+
+def append_csv(
+    path: Path, rows: Iterable[Dict[str, Any]], headers: List[str], formatters: Optional[Formatters] = None
+) -> int:
     """
     Append rows to a CSV; write header if the file doesn't exist.
-    Uses UTF-8 and no extra dependencies.
+    Uses UTF-8 and no extra dependencies. rows may be a generator;
+    returns the number of rows written. `formatters` renders numeric columns
+    as in write_csv.
+    """
+    return append_csv_rows(path, row_values(rows, headers, formatters), headers)
+
+def append_csv_rows(path: Path, rows: Iterable[Sequence[Any]], headers: List[str]) -> int:
+    """
+    append_csv for rows already rendered as value sequences in `headers` order
+    (e.g. from row_values); returns the number of rows written.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
+    ensure_dir(path.parent)
     write_header = not path.exists()
-    with path.open("a", encoding="utf-8", newline="") as f:
+    with path.open("a", encoding="utf-8", newline="", buffering=WRITE_BUFFER) as f:
+        # csv.writer quotes fields holding commas/quotes (a plain join corrupted
+        # those rows); "\n" line endings as before
+        w = csv.writer(f, lineterminator="\n")
         if write_header:
-            f.write(",".join(headers) + "\n")
-        for r in rows:
-            f.write(",".join(str(r.get(h, "")) for h in headers) + "\n")
+            w.writerow(headers)
+        n = 0
+        for vals in rows:
+            w.writerow(vals)
+            n += 1
+    return n
@@ -1,5 +1,17 @@
+import os
 from pathlib import Path
 
+READ_BUFFER = 1 << 20  # 1 MiB: ingest CSVs are read in a few read() calls, not one per ~4 KiB
+
 def ensure_dir(path: Path) -> None:
-    """Create directory path if it doesn't exist."""
-    Path(path).mkdir(parents=True, exist_ok=True)
+    """
+    Create directory path if it doesn't exist. An existing directory costs
+    one stat; no memoization, so a directory removed between runs is recreated.
+    """
+    if not os.path.isdir(path):
+        Path(path).mkdir(parents=True, exist_ok=True)
+
+def ensure_dirs(*paths: Path) -> None:
+    """ensure_dir over several paths: one stat each when they already exist."""
+    for p in paths:
+        ensure_dir(p)
@@ -0,0 +1,43 @@
+"""
+Standard Normal CDF Φ, shared by the market and modeling helpers.
+
+norm_cdf is the scalar path (math.erf beats ufunc dispatch for one value);
+norm_cdf_batch evaluates whole arrays, via scipy.special.ndtr when installed;
+norm_ppf_batch is its inverse (scipy.special.ndtri, else statistics.NormalDist).
+Without scipy both batch helpers loop over math.erf / NormalDist in Python, so
+they agree with the scalar path but are no faster than calling it per element.
+"""
+from math import erf, sqrt
+from statistics import NormalDist
+from typing import Union
+import numpy as np
+
+try:  # optional C-level vectorized Normal CDF and its inverse
+    from scipy.special import ndtr as _ndtr, ndtri as _ndtri
+except ImportError:  # pragma: no cover
+    _ndtr = _ndtri = None
+
+ArrayLike = Union[float, np.ndarray]
+HAVE_FAST_PPF = _ndtri is not None  # norm_ppf_batch is vectorized C, not a Python loop
+
+_SQRT2 = sqrt(2.0)
+_erf_ufunc = np.frompyfunc(erf, 1, 1)
+_inv_cdf_ufunc = np.frompyfunc(NormalDist().inv_cdf, 1, 1)
+
+def norm_cdf(z: float) -> float:
+    """Φ(z) = 0.5 * (1 + erf(z / sqrt(2)))."""
+    return 0.5 * (1.0 + erf(z / _SQRT2))
+
+def norm_cdf_batch(z: ArrayLike) -> np.ndarray:
+    """Elementwise Φ(z) over an array (vectorized only when scipy is installed)."""
+    z = np.asarray(z, dtype=float)
+    if _ndtr is not None:
+        return _ndtr(z)
+    return 0.5 * (1.0 + _erf_ufunc(z / _SQRT2).astype(float))
+
+def norm_ppf_batch(p: ArrayLike) -> np.ndarray:
+    """Elementwise Φ⁻¹(p) over probabilities in (0, 1) (vectorized only with scipy)."""
+    p = np.asarray(p, dtype=float)
+    if _ndtri is not None:
+        return _ndtri(p)
+    return _inv_cdf_ufunc(p).astype(float)
@@ -1,11 +1,54 @@
 # src/fbm/utils/partitions.py
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, NamedTuple, Optional, Sequence, Tuple
 
+def _week_suffix(week: Optional[int]) -> str:
+    return f"/week={week}" if week is not None else ""
+
+@lru_cache(maxsize=1024)
 def part_path(root: str, layer: str, league: str, season: int, week: Optional[int] = None) -> Path:
     """
     Build a data path like:
     data/bronze/league=NFL/season=2025/week=1
+    Memoized: Path objects are immutable, so repeat calls share one instance.
     """
-    base = Path(root) / layer / f"league={league}" / f"season={season}"
-    return base / f"week={week}" if week is not None else base
+    return Path(f"{root}/{layer}/league={league}/season={season}{_week_suffix(week)}")
+
+@lru_cache(maxsize=256)
+def _part_paths(root: str, league: str, season: int, week: Optional[int], layers: Tuple[str, ...]) -> Tuple[Path, ...]:
+    suffix = f"league={league}/season={season}{_week_suffix(week)}"
+    return tuple(Path(f"{root}/{layer}/{suffix}") for layer in layers)
+
+def part_paths(
+    root: str, league: str, season: int, week: Optional[int] = None,
+    layers: Sequence[str] = ("bronze", "silver", "gold"),
+) -> Dict[str, Path]:
+    """part_path for several layers at once: {layer: path}, sharing one formatted suffix."""
+    layers = tuple(layers)
+    return dict(zip(layers, _part_paths(str(root), league, season, week, layers)))
+
+class PartitionSet(NamedTuple):
+    """
+    Every partition a weekly run touches: the week's three layers, season-level
+    silver/gold, and the season silver teams/ (ratings) and games/ (results) dirs.
+    """
+    bronze: Path
+    silver: Path
+    gold: Path
+    season_silver: Path
+    season_gold: Path
+    season_teams: Path
+    season_games: Path
+
+@lru_cache(maxsize=256)
+def partition_set(root: str, league: str, season: int, week: int) -> PartitionSet:
+    """All weekly-run paths from one pass: each layer's season path, plus /week=N (memoized)."""
+    root = str(root)
+    base = {layer: f"{root}/{layer}/league={league}/season={season}" for layer in ("bronze", "silver", "gold")}
+    wk = _week_suffix(week)
+    return PartitionSet(
+        *(Path(base[layer] + wk) for layer in ("bronze", "silver", "gold")),
+        season_silver=Path(base["silver"]), season_gold=Path(base["gold"]),
+        season_teams=Path(base["silver"] + "/teams"), season_games=Path(base["silver"] + "/games"),
+    )
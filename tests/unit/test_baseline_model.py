@@ -6,3 +6,62 @@ def test_baseline_win_prob_moves_with_ratings():
     p_away_home = m.win_prob_home("B", "A")  # swap home/away
     assert p_home > 0.5
     assert p_away_home < 0.5
+
+def test_baseline_win_prob_batch_matches_scalar():
+    m = BaselineModel(ratings={"A": 3.0, "B": 0.0, "C": -1.5}, hfa_points=2.0, sigma_diff=13.0)
+    homes, aways = ["A", "B", "C"], ["B", "C", "Z"]
+    batch = m.win_prob_home_batch(homes, aways)
+    for h, a, p in zip(homes, aways, batch):
+        assert abs(p - m.win_prob_home(h, a)) < 1e-12
+
+def test_baseline_score_slate_tracks_reassigned_ratings():
+    m = BaselineModel(ratings={"A": 3.0, "B": 0.0}, hfa_points=0.0, sigma_diff=13.0)
+    h, a = m.team_indices(["A"]), m.team_indices(["B"])
+    assert m.score_slate(h, a)[0] > 0.5
+    m.ratings = {"A": -3.0, "B": 0.0}
+    assert m.win_prob_home_batch(["A"], ["B"])[0] < 0.5
+
+def test_baseline_win_prob_cache_invalidated_on_reassign():
+    m = BaselineModel(ratings={"A": 3.0, "B": 0.0}, hfa_points=0.0, sigma_diff=13.0)
+    assert m.win_prob_home("A", "B") > 0.5
+    m.ratings = {"A": -3.0, "B": 0.0}
+    assert m.win_prob_home("A", "B") < 0.5
+    m.hfa_points = 10.0  # hfa/sigma are part of the cache key
+    assert m.win_prob_home("A", "B") > 0.5
+
+def test_baseline_from_arrays_matches_dict_model():
+    import numpy as np
+    teams, vals = ["A", "B", "C"], np.array([3.0, 0.0, -1.5])
+    m = BaselineModel.from_arrays(teams, vals, hfa_points=2.0, sigma_diff=13.0)
+    ref = BaselineModel(ratings=dict(zip(teams, vals.tolist())), hfa_points=2.0, sigma_diff=13.0)
+    assert m.ratings == ref.ratings
+    assert list(m.win_prob_home_batch(["A", "C"], ["B", "Z"])) == list(ref.win_prob_home_batch(["A", "C"], ["B", "Z"]))
+
+def test_vectorized_cover_and_over_probs_match_scalar():
+    import numpy as np
+    from fbm.modeling.posterior import prob_cover_spread, prob_total_over
+    m = BaselineModel(ratings={"A": 3.0, "B": -1.0}, hfa_points=2.0, sigma_diff=13.0, sigma_total=10.0)
+    h, a = m.team_indices(["A", "B"]), m.team_indices(["B", "A"])
+    cover = m.cover_probs_home(h, a, np.array([-2.5, 3.5]))
+    assert abs(cover[0] - prob_cover_spread(6.0, 13.0, -2.5)) < 1e-12
+    assert abs(cover[1] - prob_cover_spread(-2.0, 13.0, 3.5)) < 1e-12
+    over = m.over_probs(np.array([44.5, 47.0]), 45.0)
+    assert abs(over[1] - prob_total_over(45.0, 10.0, 47.0)) < 1e-12
+
+def test_slate_methods_accept_precomputed_mean_diff():
+    m = BaselineModel(ratings={"A": 3.0, "B": -1.0}, hfa_points=2.0)
+    h, a = m.team_indices(["A", "B"]), m.team_indices(["B", "A"])
+    md = m.mean_diffs(h, a)
+    assert md.tolist() == [6.0, -2.0]
+    assert (m.win_probs_home(h, a, mean_diff=md) == m.score_slate(h, a)).all()
+    assert (m.cover_probs_home(h, a, [-2.5, 3.5], mean_diff=md) == m.cover_probs_home(h, a, [-2.5, 3.5])).all()
+
+def test_from_arrays_builds_ratings_dict_on_demand():
+    import numpy as np
+    m = BaselineModel.from_arrays(["A", "B"], np.array([1.0, -1.0]))
+    assert m._ratings is None
+    m.score_slate(m.team_indices(["A"]), m.team_indices(["B"]))
+    assert m._ratings is None  # slate scoring runs on the vector alone
+    assert m.rating("A") == 1.0 and m.ratings == {"A": 1.0, "B": -1.0}
+    dup = BaselineModel.from_arrays(["A", "A"], np.array([1.0, 2.0]))
+    assert dup.ratings == {"A": 2.0} and dup.team_indices(["A"]).tolist() == [0]
@@ -11,3 +11,22 @@ def test_bayes_ratings_simple_signal():
     assert r["A"] > r["B"]
     # Sum-to-zero constraint
     assert abs(sum(r.values())) < 1e-6
+
+def test_bayes_ratings_match_dense_design_matrix():
+    import numpy as np
+    results = [
+        {"home_team":"A","away_team":"B","home_pts":28,"away_pts":20},
+        {"home_team":"B","away_team":"C","home_pts":10,"away_pts":17},
+        {"home_team":"C","away_team":"A","home_pts":24,"away_pts":24},
+        {"home_team":"A","away_team":"C","home_pts":31,"away_pts":3},
+    ]
+    r, idx = fit_bayes_ratings(results, hfa_points=2.0, l2_lambda=4.0)
+    X = np.zeros((len(results), len(idx)))
+    y = np.zeros(len(results))
+    for i, g in enumerate(results):
+        X[i, idx[g["home_team"]]] = 1.0; X[i, idx[g["away_team"]]] = -1.0
+        y[i] = g["home_pts"] - g["away_pts"] - 2.0
+    beta = np.linalg.solve(X.T @ X + 4.0 * np.eye(len(idx)), X.T @ y)
+    beta -= beta.mean()
+    for team, j in idx.items():
+        assert abs(r[team] - beta[j]) < 1e-9
@@ -0,0 +1,71 @@
+from fbm.orchestration.cli import _fast_daily_args
+
+def test_fast_daily_args_matches_argparse_defaults():
+    kw = _fast_daily_args(["daily", "--season", "2025", "--week", "2", "--no-live"])
+    assert kw == {
+        "season": 2025, "week": 2, "league": "NFL", "config_path": "conf/default.yaml",
+        "mc_n": None, "mc_seed": None, "notify_ifttt": False, "notify_top_n": 3,
+        "use_live": False, "scores_days": 14,
+    }
+    kw = _fast_daily_args(["daily", "--week", "3", "--season", "2024", "--league", "CFB",
+                           "--notify-ifttt", "--mc-seed", "-1"])
+    assert kw["league"] == "CFB" and kw["notify_ifttt"] and kw["mc_seed"] == -1 and kw["use_live"]
+
+def test_fast_daily_args_defers_to_argparse():
+    for argv in (
+        [], ["daily", "--help"], ["daily", "--season", "2025"],           # help / missing --week
+        ["daily", "--season=2025", "--week", "1"], ["daily", "--seas", "2025", "--week", "1"],
+        ["daily", "--season", "x", "--week", "1"], ["daily", "--season", "2025", "--week", "1", "--league", "XFL"],
+        ["daily", "--season", "2025", "--week", "1", "--config", "--no-live"],
+    ):
+        assert _fast_daily_args(argv) is None
+
+def test_write_ratings_csv_sorts_only_when_needed(tmp_path):
+    import numpy as np
+    from fbm.orchestration.cli import _write_ratings_csv
+    for teams in (["A", "B", "C"], ["C", "A", "B"]):
+        out = tmp_path / "r.csv"
+        vals = np.array([{"A": 1.0, "B": 2.0, "C": 3.0}[t] for t in teams])
+        _write_ratings_csv(out, teams, vals)
+        assert out.read_text(encoding="utf-8").splitlines() == [
+            "team,rating", "A,1.000000", "B,2.000000", "C,3.000000"]
+
+def test_write_ratings_csv_quotes_names_and_round_trips(tmp_path):
+    import numpy as np
+    from fbm.modeling.ratings_csv import load_ratings_csv
+    from fbm.orchestration.cli import _write_ratings_csv
+    out = tmp_path / "r.csv"
+    _write_ratings_csv(out, ["Miami (OH)", "Texas A&M, College Station"], np.array([-1.5, 2.25]))
+    assert out.read_text(encoding="utf-8").splitlines()[2] == '"Texas A&M, College Station",2.250000'
+    assert load_ratings_csv(out) == {"Miami (OH)": -1.5, "Texas A&M, College Station": 2.25}
+
+def test_background_threads_are_joined():
+    import threading
+    from fbm.orchestration import cli
+    done = threading.Event()
+    cli._start_background(done.set)
+    cli._join_background()
+    assert done.is_set() and cli._BACKGROUND == []
+
+def test_json_bytes_round_trips():
+    import json
+    from fbm.orchestration.cli import _json_bytes
+    payload = {"value1": "NFL 2025 W2", "value2": "— Total stake: $1"}
+    body = _json_bytes(payload)
+    assert isinstance(body, bytes) and json.loads(body.decode("utf-8")) == payload
+
+def test_iter_tickets_echo_line():
+    from fbm.orchestration.cli import _iter_tickets
+    echo = []
+    c = ("W1-001", "ATS", "HOME", -110, 1.909090909, "-2.5", 0.5, 0.79036, 0.29036, 0.50888, 1847.2412)
+    (t,) = _iter_tickets([c], echo)
+    assert t["kelly_stake"] == 1847.2412 and t["odds_am"] == -110
+    assert echo == ["W1-001,ATS,HOME,-110,1.9091,-2.5,0.5000,0.7904,+0.2904,+0.5089,$1,847.24\n"]
+
+def test_sample_csv_written_once_and_checked_once(tmp_path):
+    from fbm.orchestration import cli
+    games = tmp_path / "games"
+    path = cli._ensure_sample_results_csv(games)
+    assert path.read_text(encoding="utf-8") == cli._SAMPLE_RESULTS_CSV
+    path.unlink()
+    assert cli._ensure_sample_results_csv(games) == path and not path.exists()  # memoized, no re-probe
@@ -5,3 +5,48 @@ def test_load_config_reads_yaml_defaults():
     assert "paths" in cfg and "datalake" in cfg["paths"]
     assert "betting" in cfg and "bankroll" in cfg["betting"]
     assert isinstance(cfg["betting"]["bankroll"], (int, float))
+
+def test_load_config_cached_copy_and_reloads_on_change(tmp_path):
+    import os
+    p = tmp_path / "cfg.yaml"
+    p.write_text("betting:\n  bankroll: 100\n", encoding="utf-8")
+    cfg = load_config(str(p))
+    cfg["betting"]["bankroll"] = 5  # callers get a copy, never the cached dict
+    assert load_config(str(p))["betting"]["bankroll"] == 100
+    p.write_text("betting:\n  bankroll: 200\n", encoding="utf-8")
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_config(str(p))["betting"]["bankroll"] == 200
+
+def test_load_config_parses_once_per_file_version():
+    load_config.cache_clear()
+    for _ in range(3):
+        load_config("conf/default.yaml")
+    info = load_config.cache_info()
+    assert info.misses == 1 and info.hits == 2
+
+def test_daily_config_typed_fields_and_defaults(tmp_path):
+    from dataclasses import FrozenInstanceError
+    import pytest
+    from fbm.config.loader import DailyConfig, load_daily_config
+    p = tmp_path / "cfg.yaml"
+    p.write_text(
+        "paths:\n  datalake: lake\nbetting:\n  bankroll: 100\n  kelly_fraction: 0.5\n"
+        "model:\n  ratings_method: Bayes\n  elo_iters: '3'\n", encoding="utf-8",
+    )
+    cfg = load_daily_config(str(p))
+    assert (cfg.datalake, cfg.bankroll, cfg.kelly_fraction) == ("lake", 100.0, 0.5)
+    assert cfg.ratings_method == "bayes" and cfg.elo_iters == 3 and cfg.mc_closed_form is True
+    assert cfg.min_edge == 0.0 and cfg.sigma_diff == DailyConfig.sigma_diff
+    assert load_daily_config(str(p)) is cfg  # frozen: shared, not copied
+    with pytest.raises(FrozenInstanceError):
+        cfg.bankroll = 1.0
+    with pytest.raises(KeyError):
+        DailyConfig.from_dict({"paths": {"datalake": "x"}, "betting": {"bankroll": 1}})
+
+def test_loaders_keep_their_default_path():
+    from fbm.config.loader import load_daily_config
+    load_config.cache_clear()
+    assert load_config() == load_config("conf/default.yaml")
+    assert load_config.cache_info().misses == 1  # default and explicit path share one entry
+    assert load_daily_config().bankroll == float(load_config()["betting"]["bankroll"])
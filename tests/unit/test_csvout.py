@@ -9,3 +9,51 @@ def test_write_csv(tmp_path: Path):
     text = out.read_text(encoding="utf-8").strip().splitlines()
     assert text[0] == "game_id,market"
     assert text[1].startswith("G1,ML")
+
+def test_write_csv_streams_generator_and_ignores_extras(tmp_path: Path):
+    out = tmp_path / "tickets.csv"
+    rows = ({"game_id": f"G{i}", "_private": "x"} for i in range(2))
+    write_csv(out, rows, ["game_id", "market"])
+    assert out.read_text(encoding="utf-8").splitlines() == ["game_id,market", "G0,", "G1,"]
+
+def test_write_csv_formatters_render_numbers(tmp_path: Path):
+    out = tmp_path / "tickets.csv"
+    rows = [{"game_id": "G1", "edge": 0.01234}, {"game_id": "G2", "edge": "+0.5000"}]
+    write_csv(out, rows, ["game_id", "edge"], formatters={"edge": "{:+.4f}".format})
+    assert out.read_text(encoding="utf-8").splitlines()[1:] == ["G1,+0.0123", "G2,+0.5000"]
+
+def test_row_values_orders_fills_and_formats():
+    from fbm.utils.csvout import row_values
+    rows = [{"edge": 0.5, "game_id": "G1", "extra": 1}]
+    assert list(row_values(rows, ["game_id", "line", "edge"], {"edge": "{:+.2f}".format})) == [["G1", "", "+0.50"]]
+
+def test_ticket_csv_formats_write_plain_floats(tmp_path: Path):
+    from fbm.markets.tickets import TICKET_CSV_FORMATS
+    out = tmp_path / "tickets.csv"
+    write_csv(out, [{"edge": 0.19695123, "fair_prob": 0.5, "kelly_stake": 12.345}],
+              ["edge", "fair_prob", "kelly_stake"], formatters=TICKET_CSV_FORMATS)
+    assert out.read_text(encoding="utf-8").splitlines()[1] == "0.196951,0.5,12.35"
+
+def test_append_csv_quotes_commas_and_keeps_header_once(tmp_path: Path):
+    from fbm.utils.history import append_csv
+    out = tmp_path / "history.csv"
+    assert append_csv(out, [{"game_id": "G1", "line": "a,b"}], ["game_id", "line"]) == 1
+    assert append_csv(out, iter([{"game_id": "G2"}]), ["game_id", "line"]) == 1
+    assert out.read_text(encoding="utf-8") == 'game_id,line\nG1,"a,b"\nG2,\n'
+
+def test_row_values_single_header():
+    from fbm.utils.csvout import row_values
+    assert list(row_values([{"a": 1}, {}], ["a"])) == [[1], [""]]
+
+def test_prerendered_rows_writers_match_dict_writers(tmp_path: Path):
+    from fbm.utils.csvout import row_values, write_csv_rows
+    from fbm.utils.history import append_csv, append_csv_rows
+    rows = [{"game_id": "G1", "edge": 0.25}, {"game_id": "G,2", "edge": -0.5}]
+    headers, fmts = ["game_id", "edge"], {"edge": "{:+.2f}".format}
+    rendered = list(row_values(rows, headers, fmts))
+    write_csv(tmp_path / "a.csv", rows, headers, formatters=fmts)
+    write_csv_rows(tmp_path / "b.csv", rendered, headers)
+    assert (tmp_path / "a.csv").read_bytes() == (tmp_path / "b.csv").read_bytes()
+    assert append_csv(tmp_path / "c.csv", rows, headers, formatters=fmts) == 2
+    assert append_csv_rows(tmp_path / "d.csv", rendered, headers) == 2
+    assert (tmp_path / "c.csv").read_bytes() == (tmp_path / "d.csv").read_bytes()
@@ -5,3 +5,10 @@ def test_ev_and_edge_basic():
     ev, edge = ev_and_edge(0.55, 0.50, 2.0)
     assert ev > 0
     assert abs(edge - 0.05) < 1e-12
+
+def test_ev_and_edge_batch_matches_scalar():
+    from fbm.markets.edge import ev_and_edge_batch
+    evs, edges = ev_and_edge_batch([0.55, 0.40], [0.50, 0.45], [2.0, 2.5])
+    for i, args in enumerate([(0.55, 0.50, 2.0), (0.40, 0.45, 2.5)]):
+        ev, edge = ev_and_edge(*args)
+        assert abs(evs[i] - ev) < 1e-12 and abs(edges[i] - edge) < 1e-12
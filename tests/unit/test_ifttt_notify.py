@@ -12,4 +12,68 @@ def test_select_top_tickets_ordering():
 def test_build_title_and_message_empty():
     title, msg = build_title_and_message([], "NFL", 2025, 2, top_n=3)
     assert "FBM Picks — NFL 2025 W2" in title
-    assert "No tickets" in msg
\ No newline at end of file
+    assert "No tickets" in msg
+
+def test_select_top_tickets_ties_keep_input_order():
+    tickets = [
+        {"edge": "+0.05", "kelly_stake": "1,000.00", "game_id": "A"},
+        {"edge": "+0.05", "kelly_stake": "1000", "game_id": "B"},
+        {"edge": "bad", "kelly_stake": "5", "game_id": "C"},
+    ]
+    assert [t["game_id"] for t in select_top_tickets(tickets, top_n=3)] == ["A", "B", "C"]
+
+def test_build_message_truncates_on_line_boundary():
+    tickets = [
+        {"game_id": f"G{i}-" + "x" * 200, "market": "ML", "side_or_bet": "HOME",
+         "edge": f"+0.0{9 - i}", "kelly_stake": "10.00"}
+        for i in range(8)
+    ]
+    _, msg = build_title_and_message(tickets, "NFL", 2025, 2, top_n=8)
+    assert msg.endswith("\n…(truncated)")
+    assert len(msg) <= 1000
+    body = msg[: -len("\n…(truncated)")].split("\n")
+    assert all(line.endswith("stake $10.00") for line in body)
+
+class _FakeIftttConnection:
+    instances = []
+    def __init__(self, host, timeout=None):
+        self.host, self.requests = host, []
+        _FakeIftttConnection.instances.append(self)
+    def request(self, method, path, body=None, headers=None):
+        self.requests.append((method, path, body))
+    def getresponse(self):
+        class _Resp:
+            status = 200
+            def read(self):
+                return b"Congratulations!"
+        return _Resp()
+    def close(self):
+        pass
+
+def test_post_ifttt_uses_event_and_key_and_reuses_connection(monkeypatch):
+    from fbm.notify import ifttt
+    monkeypatch.setattr(ifttt.http.client, "HTTPSConnection", _FakeIftttConnection)
+    monkeypatch.setattr(ifttt, "_conn", None)
+    _FakeIftttConnection.instances = []
+
+    assert ifttt.post_ifttt("k/1", "my_event", "T", "a b") == (True, "ok (200)")
+    assert ifttt.post_ifttt("k/1", "my_event", "T2", "c")[0]
+    assert len(_FakeIftttConnection.instances) == 1
+    conn = _FakeIftttConnection.instances[0]
+    assert conn.host == "maker.ifttt.com"
+    method, path, body = conn.requests[0]
+    assert (method, path) == ("POST", "/trigger/my_event/with/key/k%2F1")
+    assert body == b"value1=T&value2=a+b"
+
+def test_numeric_tickets_sort_and_render():
+    tickets = [
+        {"game_id": "A", "market": "ML", "side_or_bet": "HOME", "odds_am": -120,
+         "odds_dec": 1.8333333, "line": "", "edge": 0.031, "ev_per_dollar": 0.05, "kelly_stake": 12.345},
+        {"game_id": "B", "market": "OU", "side_or_bet": "OVER", "odds_am": 100,
+         "odds_dec": 2.0, "line": "48.5", "edge": 0.042, "ev_per_dollar": 0.08, "kelly_stake": 20.0},
+    ]
+    assert [t["game_id"] for t in select_top_tickets(tickets, top_n=2)] == ["B", "A"]
+    _, msg = build_title_and_message(tickets, "NFL", 2025, 2, top_n=2)
+    first, second = msg.split("\n")
+    assert "odds 100 (2.0000)" in first and "edge +0.0420" in first and first.endswith("stake $20.00")
+    assert second.endswith("stake $12.35")
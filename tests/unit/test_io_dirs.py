@@ -6,3 +6,18 @@ def test_ensure_dir_creates_nested(tmp_path: Path):
     assert not p.exists()
     ensure_dir(p)
     assert p.exists() and p.is_dir()
+
+def test_ensure_dir_recreates_removed_dir(tmp_path: Path):
+    p = tmp_path / "a" / "b"
+    ensure_dir(p)
+    ensure_dir(p)  # existing dir: no-op
+    p.rmdir()
+    ensure_dir(p)
+    assert p.is_dir()
+
+def test_ensure_dirs_creates_each(tmp_path: Path):
+    from fbm.utils.io import ensure_dirs
+    paths = [tmp_path / "bronze" / "w", tmp_path / "silver" / "teams", tmp_path / "silver" / "games"]
+    ensure_dirs(*paths)
+    ensure_dirs(*paths)
+    assert all(p.is_dir() for p in paths)
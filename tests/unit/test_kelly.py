@@ -13,3 +13,13 @@ def test_kelly_monotonic_in_bankroll():
     s1 = kelly_fractional(0.55, 2.0, bankroll=1000.0, fraction=0.5)
     s2 = kelly_fractional(0.55, 2.0, bankroll=2000.0, fraction=0.5)
     assert s2 > s1
+
+def test_kelly_batch_matches_scalar():
+    import pytest
+    from fbm.markets.kelly import kelly_fractional_batch
+    ps, odds = [0.5, 0.55, 0.6], [2.0, 2.0, 1.91]
+    stakes = kelly_fractional_batch(ps, odds, bankroll=1000.0, fraction=0.5)
+    for p, o, s in zip(ps, odds, stakes):
+        assert abs(s - kelly_fractional(p, o, bankroll=1000.0, fraction=0.5)) < 1e-9
+    with pytest.raises(ValueError):
+        kelly_fractional_batch([0.5, 1.0], [2.0, 2.0], bankroll=1000.0)
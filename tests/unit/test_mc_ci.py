@@ -5,3 +5,13 @@ def test_mc_ci_normal_bounds_and_width():
     assert 0.55 < lo < 0.6
     assert 0.6 < hi < 0.65
     assert 0.0 <= lo <= 1.0 and 0.0 <= hi <= 1.0
+
+def test_mc_ci_normal_batch_matches_scalar():
+    from fbm.modeling.posterior import mc_ci_normal, mc_ci_normal_batch
+    ps = [0.0, 0.25, 0.5, 0.999, 1.2]
+    lo, hi = mc_ci_normal_batch(ps, 1000)
+    for p, l, h in zip(ps, lo, hi):
+        ref = mc_ci_normal(p, 1000)
+        assert abs(l - ref[0]) < 1e-15 and abs(h - ref[1]) < 1e-15
+    lo, hi = mc_ci_normal_batch(ps, 0)
+    assert lo.tolist() == hi.tolist() == [0.0, 0.25, 0.5, 0.999, 1.0]
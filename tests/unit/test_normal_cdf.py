@@ -0,0 +1,15 @@
+from fbm.utils.normal_cdf import norm_cdf, norm_cdf_batch
+
+def test_norm_cdf_scalar_and_batch_agree():
+    zs = [-3.0, -1.0, 0.0, 0.5, 2.0]
+    batch = norm_cdf_batch(zs)
+    assert abs(norm_cdf(0.0) - 0.5) < 1e-12
+    for z, p in zip(zs, batch):
+        assert abs(p - norm_cdf(z)) < 1e-12
+
+def test_norm_ppf_batch_inverts_cdf():
+    import numpy as np
+    from fbm.utils.normal_cdf import norm_cdf_batch, norm_ppf_batch
+    p = np.array([1e-9, 0.025, 0.5, 0.9, 1 - 1e-9])
+    assert np.allclose(norm_cdf_batch(norm_ppf_batch(p)), p, rtol=1e-6, atol=0)
+    assert norm_ppf_batch(np.array([0.5]))[0] == 0.0
@@ -0,0 +1,44 @@
+from pathlib import Path
+from fbm.data.ingest.odds_csv import load_odds_csv
+
+def test_load_odds_csv_normalizes_headers_and_values(tmp_path: Path):
+    p = tmp_path / "odds.csv"
+    p.write_text(
+        "Game ID, Home Team ,Home ML\n"
+        "W1-001, Chiefs ,-120\n"
+        "\n",
+        encoding="utf-8",
+    )
+    rows = load_odds_csv(p)
+    assert rows == [{"game_id": "W1-001", "home_team": "Chiefs", "home_ml": "-120"}]
+
+def test_odds_column_typed_with_fallback():
+    import numpy as np
+    from fbm.data.ingest.odds_csv import odds_column
+    vals, ok = odds_column([{"p": "-110"}, {"p": "+120"}], "p", np.int64)
+    assert vals.tolist() == [-110, 120] and ok.all()
+    vals, ok = odds_column([{"p": "-110"}, {"p": ""}, {}, {"p": "105.0"}], "p", np.int64)
+    assert ok.tolist() == [True, False, False, False]
+    assert vals[0] == -110
+    lines, ok = odds_column([{"l": "-2.5"}, {"l": "x"}], "l")
+    assert ok.tolist() == [True, False] and lines[0] == -2.5
+
+def test_odds_cells_one_pass_with_missing_keys():
+    from fbm.data.ingest.odds_csv import odds_cells
+    rows = [{"a": "1", "b": "2"}, {"a": "3", "b": "4"}]
+    assert odds_cells(rows, ["a", "b"]) == {"a": ("1", "3"), "b": ("2", "4")}
+    assert odds_cells(rows, ["b"]) == {"b": ["2", "4"]}
+    assert odds_cells([], ["a", "b"]) == {"a": (), "b": ()}
+    short = rows + [{"a": "5"}]  # short CSV line: missing key -> None
+    assert odds_cells(short, ["a", "b"]) == {"a": ["1", "3", "5"], "b": ["2", "4", None]}
+
+def test_load_odds_table_matches_row_loader(tmp_path: Path):
+    from fbm.data.ingest.odds_csv import load_odds_table, odds_cells
+    p = tmp_path / "odds.csv"
+    p.write_text("Game ID, Home ML ,Total Line\nW1, -120 ,45.5\nW2,110\n\nW3,-105,44,extra\n", encoding="utf-8")
+    table, rows = load_odds_table(p), load_odds_csv(p)
+    keys = ["game_id", "home_ml", "total_line", "missing"]
+    assert len(table) == len(rows) == 3
+    assert {k: list(v) for k, v in table.cells(keys).items()} == {k: list(v) for k, v in odds_cells(rows, keys).items()}
+    assert table[1:].cells(["game_id"]) == {"game_id": ("W2", "W3")} and len(table[1:]) == 2
+    assert load_odds_table(p) is table
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from fbm.utils.partitions import part_path
 
 def test_part_path_includes_parts():
@@ -6,3 +8,27 @@ def test_part_path_includes_parts():
     assert "league=NFL" in text
     assert "season=2025" in text
     assert "week=1" in text
+
+def test_part_paths_match_part_path():
+    from fbm.utils.partitions import part_paths
+    for week in (1, None):
+        paths = part_paths("./data", "NFL", 2025, week)
+        assert list(paths) == ["bronze", "silver", "gold"]
+        for layer, p in paths.items():
+            assert p == part_path("./data", layer, "NFL", 2025, week)
+    assert part_path("./data", "gold", "NFL", 2025) == Path("data/gold/league=NFL/season=2025")
+
+def test_partition_set_matches_part_path():
+    from fbm.utils.partitions import partition_set
+    ps = partition_set("./data", "NFL", 2025, 2)
+    for layer in ("bronze", "silver", "gold"):
+        assert getattr(ps, layer) == part_path("./data", layer, "NFL", 2025, 2)
+    assert ps.season_silver == part_path("./data", "silver", "NFL", 2025)
+    assert ps.season_gold == part_path("./data", "gold", "NFL", 2025)
+
+def test_partition_set_season_subdirs():
+    from fbm.utils.partitions import partition_set
+    ps = partition_set("./data", "NFL", 2025, 2)
+    assert ps.season_teams == ps.season_silver / "teams"
+    assert ps.season_games == ps.season_silver / "games"
+    assert partition_set("./data", "NFL", 2025, 2) is ps
@@ -26,3 +26,93 @@ def test_degenerate_sigma():
     assert prob_over_normal(mean=50.0, sigma=0.0, line=49.0) == 1.0
     assert prob_over_normal(mean=50.0, sigma=0.0, line=51.0) == 0.0
     assert prob_over_normal(mean=50.0, sigma=0.0, line=50.0) == 0.5
+
+def test_batch_matches_scalar():
+    import numpy as np
+    from fbm.modeling.posterior import prob_over_normal_batch
+    means = np.array([40.0, 45.0, 50.0, 50.0])
+    sigmas = np.array([10.0, 10.0, 10.0, 0.0])
+    lines = np.array([45.0, 45.0, 45.0, 49.0])
+    batch = prob_over_normal_batch(means, sigmas, lines)
+    for m, s, l, p in zip(means, sigmas, lines, batch):
+        assert abs(p - prob_over_normal(m, s, l)) < 1e-12
+
+def test_mc_simulators_close_to_closed_form():
+    from fbm.modeling.posterior import simulate_cover_spread, simulate_total_over
+    p_mc = simulate_cover_spread(mean_diff=3.0, sigma=13.0, spread=-2.5, n=20001, seed=7)
+    assert abs(p_mc - prob_cover_spread(3.0, 13.0, -2.5)) < 0.01
+    # antithetic pairs make the estimate exact at the mean
+    assert simulate_total_over(total_mean=45.0, sigma_total=10.0, line=45.0, n=1000, seed=1) == 0.5
+
+def test_cover_prob_dispatch_exact_vs_mc():
+    import pytest
+    from fbm.modeling.posterior import cover_prob, over_prob
+    exact = prob_cover_spread(3.0, 13.0, -2.5)
+    assert cover_prob(3.0, 13.0, -2.5) == exact
+    assert cover_prob(3.0, 13.0, -2.5, method="exact", n=5000) == exact
+    assert abs(cover_prob(3.0, 13.0, -2.5, n=20000, seed=3) - exact) < 0.01
+    assert over_prob(45.0, 10.0, 45.0, method="mc", n=1000, seed=1) == 0.5
+    with pytest.raises(ValueError):
+        cover_prob(0.0, 1.0, 0.0, method="bogus")
+
+def test_prob_over_ci_delta_brackets_point():
+    from fbm.modeling.posterior import prob_over_ci_delta
+    lo, hi = prob_over_ci_delta(48.0, 10.0, 45.0, mean_se=1.5)
+    p = prob_over_normal(48.0, 10.0, 45.0)
+    assert lo < p < hi
+    assert prob_over_ci_delta(48.0, 10.0, 45.0, mean_se=0.0) == (p, p)
+
+def test_batch_scalar_sigma_fast_path_matches_scalar():
+    import numpy as np
+    from fbm.modeling.posterior import prob_cover_spread_batch, prob_total_over_batch
+    lines = np.array([-3.5, 0.0, 7.0])
+    means = np.array([2.0, -1.0, 7.0])
+    got = prob_cover_spread_batch(means, 13.0, lines)
+    assert got.shape == (3,)
+    for m, l, p in zip(means, lines, got):
+        assert abs(p - prob_cover_spread(m, 13.0, l)) < 1e-12
+    over = prob_total_over_batch(45.0, 10.0, lines + 45.0)
+    assert abs(over[1] - 0.5) < 1e-12
+
+def test_batched_mc_matches_scalar_simulators_and_exact():
+    import numpy as np
+    from fbm.modeling.posterior import (
+        cover_prob_batch, over_prob_batch, simulate_cover_spread, simulate_total_over,
+    )
+    means, spreads = np.array([3.0, -1.0, 0.0]), np.array([-2.5, 1.5, 0.0])
+    mc = cover_prob_batch(means, 13.0, spreads, n=4001, seed=7)
+    for m, sp, p in zip(means, spreads, mc):
+        assert p == simulate_cover_spread(m, 13.0, sp, n=4001, seed=7)
+    exact = cover_prob_batch(means, 13.0, spreads)
+    assert np.allclose(mc, exact, atol=0.03)
+    over = over_prob_batch(45.0, 10.0, np.array([44.5, 47.0]), method="mc", seed=3)
+    assert over[1] == simulate_total_over(45.0, 10.0, 47.0, n=10000, seed=3)
+
+def test_shared_generator_advances_across_mc_calls():
+    import numpy as np
+    from fbm.modeling.posterior import _antithetic_normals, cover_prob_batch, over_prob_batch, simulate_total_over
+    rng = np.random.default_rng(5)
+    first = cover_prob_batch(np.array([3.0]), 13.0, np.array([-2.5]), n=999, rng=rng)
+    second = over_prob_batch(45.0, 10.0, np.array([47.0]), n=999, rng=rng)
+    assert first[0] == cover_prob_batch(np.array([3.0]), 13.0, np.array([-2.5]), n=999, seed=5)[0]
+    replay = np.random.default_rng(5)
+    _antithetic_normals(999, rng=replay)  # the draws the cover call consumed
+    assert second[0] == simulate_total_over(45.0, 10.0, 47.0, n=999, rng=replay)
+
+def test_stratified_draws_beat_iid_error(monkeypatch):
+    import numpy as np
+    import fbm.modeling.posterior as posterior
+    from fbm.modeling.posterior import prob_cover_spread, simulate_cover_spread
+    monkeypatch.setattr(posterior, "HAVE_FAST_PPF", True)  # stratify even on the slow Φ⁻¹ fallback
+    exact = prob_cover_spread(3.0, 13.0, -2.5)
+    errs = [simulate_cover_spread(3.0, 13.0, -2.5, n=1000, seed=s) - exact for s in range(50)]
+    # i.i.d. sampling would give a standard error near sqrt(p(1-p)/n) ~ 0.016
+    assert np.std(errs) < 0.002
+
+def test_draws_without_fast_ppf_are_plain_antithetic_normals(monkeypatch):
+    import numpy as np
+    import fbm.modeling.posterior as posterior
+    monkeypatch.setattr(posterior, "HAVE_FAST_PPF", False)
+    z = posterior._antithetic_normals(7, seed=3)
+    assert np.allclose(z[:3], -z[4:])
+    assert z[:4].tolist() == np.random.default_rng(3).standard_normal(4).tolist()
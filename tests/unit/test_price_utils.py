@@ -20,3 +20,42 @@ def test_remove_vig_two_way():
     assert abs((p_home_fair + p_away_fair) - 1.0) < 1e-9
     # and preserve ordering
     assert p_home_fair > p_away_fair
+
+def test_batch_converters_match_scalar():
+    from fbm.markets.price_utils import (
+        american_to_decimal_batch, implied_prob_from_american_batch, remove_vig_two_way_batch,
+    )
+    prices = [-110, 150, -100, 100, -250]
+    dec = american_to_decimal_batch(prices)
+    imp = implied_prob_from_american_batch(prices)
+    for i, a in enumerate(prices):
+        assert dec[i] == american_to_decimal(a)
+        assert imp[i] == implied_prob_from_american(a)
+    fa, fb = remove_vig_two_way_batch(imp[:2], imp[2:4])
+    ra, rb = remove_vig_two_way(imp[0], imp[2])
+    assert (fa[0], fb[0]) == (ra, rb)
+
+def test_converters_memoize_common_prices():
+    american_to_decimal.cache_clear()
+    implied_prob_from_american.cache_clear()
+    for _ in range(3):
+        american_to_decimal(-110)
+        implied_prob_from_american(-110)
+    assert american_to_decimal.cache_info().hits == 2
+    assert implied_prob_from_american.cache_info().hits == 2
+
+def test_lut_batch_matches_scalar_in_and_out_of_range():
+    import numpy as np
+    from fbm.markets.price_utils import implied_prob_and_decimal_batch
+    for prices in ([-110, -105, 100, 150, -1000, 1000], [-110, 5000], [-110, 102.5], [5000, -110, 5000, -1500], [-110, 25000, 25000, -20000]):
+        imp, dec = implied_prob_and_decimal_batch(np.array(prices, dtype=float))
+        for i, a in enumerate(prices):
+            assert imp[i] == implied_prob_from_american(a)
+            assert dec[i] == american_to_decimal(a)
+
+def test_lut_covers_sportsbook_range_edges():
+    import numpy as np
+    from fbm.markets.price_utils import implied_prob_and_decimal_batch
+    imp, dec = implied_prob_and_decimal_batch(np.array([-10000.0, 10000.0, -101.0]))
+    assert imp.tolist() == [implied_prob_from_american(a) for a in (-10000, 10000, -101)]
+    assert dec.tolist() == [american_to_decimal(a) for a in (-10000, 10000, -101)]
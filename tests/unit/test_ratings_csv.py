@@ -12,3 +12,20 @@ def test_load_ratings_csv_missing_file_returns_empty(tmp_path: Path):
     p = tmp_path / "ratings.csv"
     r = load_ratings_csv(p)
     assert r == {}
+
+def test_load_ratings_csv_sees_rewritten_file(tmp_path: Path):
+    import os
+    p = tmp_path / "ratings.csv"
+    p.write_text("team,rating\nChiefs,3.0\n", encoding="utf-8")
+    r = load_ratings_csv(p)
+    r["Chiefs"] = 99.0  # callers get a copy, never the cached dict
+    assert load_ratings_csv(p) == {"Chiefs": 3.0}
+    p.write_text("team,rating\nChiefs,1.5\n", encoding="utf-8")
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_ratings_csv(p) == {"Chiefs": 1.5}
+
+def test_load_ratings_csv_strips_and_skips_blanks(tmp_path: Path):
+    p = tmp_path / "ratings.csv"
+    p.write_text("team,rating\n Chiefs , 3.0\n\nBengals,-1e-1\n", encoding="utf-8")
+    assert load_ratings_csv(p) == {"Chiefs": 3.0, "Bengals": -0.1}
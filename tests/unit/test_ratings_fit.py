@@ -13,3 +13,54 @@ def test_elo_fit_handles_ties():
     r = fit_elo_ratings(results, k=20.0, iters=1)
     # Ratings should remain close to start (0) after a tie
     assert abs(r.get("A",0.0)) < 5.0 and abs(r.get("B",0.0)) < 5.0
+
+def test_elo_batch_single_game_matches_sequential():
+    # with one game per pass there is no ordering effect, so both modes agree
+    results = [{"home_team":"A","away_team":"B","home_pts":27,"away_pts":10}]
+    seq = fit_elo_ratings(results, k=20.0, hfa_points=2.0, iters=1, start_ratings={"C": 1.0})
+    bat = fit_elo_ratings(results, k=20.0, hfa_points=2.0, iters=1, start_ratings={"C": 1.0}, batch=True)
+    assert seq.keys() == bat.keys()
+    for t in seq:
+        assert abs(seq[t] - bat[t]) < 1e-9
+
+def test_elo_batch_pushes_better_team_up():
+    results = [
+        {"home_team":"A","away_team":"B","home_pts":27,"away_pts":10},
+        {"home_team":"B","away_team":"A","home_pts":14,"away_pts":24},
+        {"home_team":"A","away_team":"C","home_pts":21,"away_pts":21},
+    ]
+    r = fit_elo_ratings(results, k=20.0, hfa_points=2.0, iters=2, batch=True)
+    assert r["A"] > r["C"] > r["B"]
+
+def test_elo_array_kernel_matches_dict_loop():
+    from fbm.modeling import ratings_fit
+    results = [
+        {"home_team":"A","away_team":"B","home_pts":27,"away_pts":10},
+        {"home_team":"B","away_team":"C","home_pts":14,"away_pts":24},
+        {"home_team":"C","away_team":"A","home_pts":21,"away_pts":21},
+        {"home_team":"A","away_team":"C","home_pts":3,"away_pts":35},
+    ]
+    start = {"B": 1.5}
+    ref = fit_elo_ratings(results, start_ratings=start, k=20.0, hfa_points=2.0, iters=3)
+    team2idx, R, h, a, hp, ap = ratings_fit._elo_arrays(results, start)
+    ratings_fit._fit_elo_kernel(R, h, a, hp, ap, 20.0, 2.0, 3, 13.0, True, 7.0, 2.0)
+    assert list(team2idx) == list(ref)
+    for t, i in team2idx.items():
+        assert abs(R[i] - ref[t]) < 1e-9
+
+def test_normalize_ratings_centers_and_scales():
+    from fbm.modeling.ratings_fit import normalize_ratings
+    out = normalize_ratings({"A": 10.0, "B": 4.0, "C": 1.0}, target_std=3.0)
+    vals = list(out.values())
+    assert list(out) == ["A", "B", "C"]
+    assert abs(sum(vals)) < 1e-12
+    assert abs((sum(v * v for v in vals) / 3) ** 0.5 - 3.0) < 1e-12
+    assert normalize_ratings({"A": 2.0, "B": 2.0}) == {"A": 0.0, "B": 0.0}
+
+def test_normalize_ratings_array_in_place_matches_dict_version():
+    from fbm.modeling.ratings_fit import normalize_ratings, normalize_ratings_array, ratings_to_arrays
+    ratings = {"A": 10.0, "B": 4.0, "C": 1.0}
+    teams, vals = ratings_to_arrays(ratings)
+    out = normalize_ratings_array(vals, target_std=2.0)
+    assert out is vals
+    assert dict(zip(teams, vals.tolist())) == normalize_ratings(ratings, target_std=2.0)
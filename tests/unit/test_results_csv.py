@@ -14,3 +14,22 @@ def test_results_loader_reads_and_normalizes(tmp_path: Path):
     assert r["home_team"] == "Chiefs"
     assert r["away_team"] == "Bengals"
     assert r["home_pts"] == 27 and r["away_pts"] == 24
+
+def test_results_loader_handles_quoted_fields(tmp_path: Path):
+    p = tmp_path / "results.csv"
+    p.write_text(
+        "date,home_team,away_team,home_pts,away_pts\n"
+        '2024-12-01,"Washington, DC",Bengals,27,24\n',
+        encoding="utf-8",
+    )
+    rows = load_results_csv(p)
+    assert rows[0]["home_team"] == "Washington, DC"
+    assert rows[0]["away_pts"] == 24
+
+def test_iter_results_dir_streams_files_and_load_sorts(tmp_path: Path):
+    from fbm.data.ingest.results_csv import iter_results_dir, load_results_dir
+    (tmp_path / "a.csv").write_text("date,home_team,away_team\n2024-12-08,C,D\n", encoding="utf-8")
+    (tmp_path / "b.csv").write_text("date,home_team,away_team\n2024-12-01,A,B\n", encoding="utf-8")
+    assert [r["home_team"] for r in iter_results_dir(tmp_path)] == ["C", "A"]
+    assert [r["home_team"] for r in load_results_dir(tmp_path)] == ["A", "C"]
+    assert list(iter_results_dir(tmp_path / "missing")) == []
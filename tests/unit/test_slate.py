@@ -0,0 +1,167 @@
+import math
+
+from fbm.markets.edge import ev_and_edge
+from fbm.markets.kelly import kelly_fractional
+from fbm.markets.price_utils import american_to_decimal, implied_prob_from_american, remove_vig_two_way
+from fbm.markets.slate import price_slate
+from fbm.modeling.baseline import BaselineModel
+from fbm.modeling.posterior import prob_cover_spread, prob_total_over
+
+ROWS = [
+    {"game_id": "G1", "home_team": "A", "away_team": "B", "home_ml": "-120", "away_ml": "110",
+     "home_spread": "-2.5", "home_spread_price": "-110", "away_spread_price": "-105",
+     "total_line": "48.5", "over_price": "-110", "under_price": "-110"},
+    # bad ML, no spread, priced total
+    {"game_id": "G2", "home_team": "C", "away_team": "X", "home_ml": "", "away_ml": "150",
+     "home_spread": "", "home_spread_price": "-110", "away_spread_price": "-110",
+     "total_line": "41.0", "over_price": "+100", "under_price": "-120"},
+    # zero price disables ML only
+    {"game_id": "G3", "home_team": "B", "away_team": "C", "home_ml": "0", "away_ml": "-200",
+     "home_spread": "3.0", "home_spread_price": "+105", "away_spread_price": "-125",
+     "total_line": "", "over_price": "", "under_price": ""},
+]
+
+def test_price_slate_matches_scalar_helpers():
+    model = BaselineModel(ratings={"A": 2.0, "B": -1.0, "C": 0.5}, hfa_points=2.0, sigma_diff=13.0, sigma_total=10.0)
+    got = list(price_slate(ROWS, model, 45.0, bankroll=1000.0, kelly_fraction=0.33))
+    assert [(c[0], c[1], c[2]) for c in got] == [
+        ("G1", "ML", "HOME"), ("G1", "ATS", "HOME"), ("G1", "ATS", "AWAY"),
+        ("G1", "OU", "OVER"), ("G1", "OU", "UNDER"),
+        ("G2", "OU", "OVER"), ("G2", "OU", "UNDER"),
+        ("G3", "ATS", "HOME"), ("G3", "ATS", "AWAY"),
+    ]
+
+    # ATS AWAY of G3 recomputed with the scalar helpers
+    _, _, _, am, dec, line, fair, modelp, edge, ev, stake = got[-1]
+    p_home = prob_cover_spread(-1.0 - 0.5 + 2.0, 13.0, 3.0)
+    _, fair_ref = remove_vig_two_way(implied_prob_from_american(105), implied_prob_from_american(-125))
+    dec_ref = american_to_decimal(-125)
+    ev_ref, edge_ref = ev_and_edge(1.0 - p_home, fair_ref, dec_ref)
+    assert (am, line) == (-125, "-3.0")
+    assert math.isclose(dec, dec_ref) and math.isclose(fair, fair_ref)
+    assert math.isclose(modelp, 1.0 - p_home) and math.isclose(edge, edge_ref) and math.isclose(ev, ev_ref)
+    assert math.isclose(stake, kelly_fractional(1.0 - p_home, dec_ref, 1000.0, 0.33), abs_tol=1e-12)
+
+    # ML HOME and OU OVER of G1
+    assert math.isclose(got[0][7], model.win_prob_home("A", "B"))
+    assert math.isclose(got[3][7], prob_total_over(45.0, 10.0, 48.5))
+
+def test_price_slate_empty():
+    assert list(price_slate([], BaselineModel(), 45.0, bankroll=1000.0, kelly_fraction=0.33)) == []
+
+def test_price_slate_threaded_chunks_keep_order(monkeypatch):
+    from fbm.markets import slate
+    monkeypatch.setattr(slate, "_MIN_CHUNK", 2)
+    rows = [dict(r, game_id=f"{r['game_id']}-{k}") for k in range(4) for r in ROWS]
+    model = BaselineModel(ratings={"A": 2.0, "B": -1.0, "C": 0.5})
+    serial = list(price_slate(rows, model, 45.0, bankroll=1000.0, kelly_fraction=0.33))
+    threaded = list(price_slate(rows, model, 45.0, bankroll=1000.0, kelly_fraction=0.33, workers=3))
+    assert threaded == serial
+
+def test_price_slate_filter_mask_matches_python_filter():
+    model = BaselineModel(ratings={"A": 2.0, "B": -1.0, "C": 0.5})
+    every = list(price_slate(ROWS, model, 45.0, bankroll=1000.0, kelly_fraction=0.33))
+    kept = list(price_slate(ROWS, model, 45.0, bankroll=1000.0, kelly_fraction=0.33, min_edge=0.0, min_stake=1.0))
+    assert kept == [c for c in every if c[8] >= 0.0 and c[10] >= 1.0]
+    assert 0 < len(kept) < len(every)
+
+def test_price_slate_rejects_bad_kelly_settings():
+    import pytest
+    with pytest.raises(ValueError):
+        list(price_slate(ROWS, BaselineModel(), 45.0, bankroll=1000.0, kelly_fraction=0.0))
+    with pytest.raises(ValueError):
+        list(price_slate(ROWS, BaselineModel(), 45.0, bankroll=-1.0, kelly_fraction=0.33))
+
+def test_price_slate_process_chunks_keep_order(monkeypatch):
+    from fbm.markets import slate
+    monkeypatch.setattr(slate, "_MIN_PROCESS_CHUNK", 2)
+    rows = [dict(r, game_id=f"{r['game_id']}-{k}") for k in range(2) for r in ROWS]
+    model = BaselineModel(ratings={"A": 2.0, "B": -1.0, "C": 0.5})
+    serial = list(price_slate(rows, model, 45.0, bankroll=1000.0, kelly_fraction=0.33))
+    pooled = list(price_slate(rows, model, 45.0, bankroll=1000.0, kelly_fraction=0.33, workers=2, processes=True))
+    assert pooled == serial
+
+def test_sides_per_row_bounds_candidates():
+    from fbm.markets.slate import SIDES_PER_ROW
+    assert SIDES_PER_ROW == 5  # ML HOME, ATS HOME/AWAY, OU OVER/UNDER
+
+def test_devig_pair_equal_prices_short_circuit():
+    import numpy as np
+    from fbm.markets.slate import _devig_pair
+    p = np.array([-110.0, -105.0, 120.0])
+    fair_a, fair_b, dec_a, dec_b = _devig_pair(p, p.copy())
+    assert (fair_a == 0.5).all() and (fair_b == 0.5).all()
+    assert dec_a.tolist() == [american_to_decimal(-110), american_to_decimal(-105), american_to_decimal(120)]
+    assert dec_b is dec_a
+    fair_a, fair_b, _, _ = _devig_pair(p, np.array([-110.0, -115.0, 120.0]))
+    assert fair_a[0] == 0.5 and math.isclose(fair_a[1] + fair_b[1], 1.0)
+
+def test_devig_pair_precomputed_matches_direct():
+    import numpy as np
+    from fbm.markets.price_utils import implied_prob_and_decimal_batch
+    from fbm.markets.slate import _devig_pair
+    pa, pb = np.array([-110.0, 150.0]), np.array([-110.0, -170.0])
+    imp, dec = implied_prob_and_decimal_batch(np.stack([pa, pb]))
+    direct = _devig_pair(pa, pb)
+    hoisted = _devig_pair(pa, pb, (imp[0], dec[0], imp[1], dec[1]))
+    assert all(np.array_equal(x, y) for x, y in zip(direct, hoisted))
+
+def test_price_side_skips_kelly_when_no_row_clears_min_edge():
+    import numpy as np
+    from fbm.markets.slate import _price_side
+    p, fair, dec = np.array([0.55, 0.60]), np.array([0.5, 0.5]), np.array([1.9, 1.9])
+    ok = np.array([True, True])
+    ev, edge, stake, ok_out = _price_side(p, fair, dec, ok, 1000.0, 0.5, 0.2)
+    assert ok_out.all() and np.allclose(edge, [0.05, 0.10])
+    assert not ev.any() and not stake.any()
+    ev, edge, stake, _ = _price_side(p, fair, dec, ok, 1000.0, 0.5, 0.08)
+    assert stake[0] == 0.0 and stake[1] > 0.0 and math.isclose(ev[1], 0.6 * 0.9 - 0.4)
+
+def test_price_slate_monte_carlo_close_to_exact_and_chunk_invariant(monkeypatch):
+    from fbm.markets import slate
+    model = BaselineModel(ratings={"A": 2.0, "B": -1.0, "C": 0.5})
+    kw = dict(bankroll=1000.0, kelly_fraction=0.33)
+    exact = list(price_slate(ROWS, model, 45.0, **kw))
+    mc = list(price_slate(ROWS, model, 45.0, mc_n=20000, mc_seed=1, **kw))
+    assert [c[:3] for c in mc] == [c[:3] for c in exact]
+    for e, m in zip(exact, mc):
+        assert abs(e[7] - m[7]) < 0.02
+    assert mc[0][7] == exact[0][7]  # moneyline stays closed-form
+    monkeypatch.setattr(slate, "_MIN_CHUNK", 2)
+    rows = [dict(r, game_id=f"{r['game_id']}-{k}") for k in range(4) for r in ROWS]
+    serial = list(price_slate(rows, model, 45.0, mc_n=500, mc_seed=1, **kw))
+    assert list(price_slate(rows, model, 45.0, mc_n=500, mc_seed=1, workers=3, **kw)) == serial
+
+def test_price_slate_mc_min_edge_only_filters_the_full_sweep():
+    model = BaselineModel(ratings={"A": 2.0, "B": -1.0, "C": 0.5})
+    rows = [dict(r, game_id=f"{r['game_id']}-{k}") for k in range(4) for r in ROWS]
+    kw = dict(bankroll=1000.0, kelly_fraction=0.33, mc_n=400, mc_seed=2)
+    everything = list(price_slate(rows, model, 45.0, **kw))
+    filtered = list(price_slate(rows, model, 45.0, min_edge=0.05, **kw))
+    assert filtered == [c for c in everything if c[8] >= 0.05]
+
+def test_price_slate_stake_ceiling_below_min_stake_prices_nothing():
+    model = BaselineModel(ratings={"A": 2.0, "B": -1.0, "C": 0.5})
+    assert list(price_slate(ROWS, model, 45.0, bankroll=100.0, kelly_fraction=0.25, min_stake=25.01)) == []
+    assert list(price_slate(ROWS, model, 45.0, bankroll=100.0, kelly_fraction=0.25, min_stake=0.0))
+
+def test_price_slate_mc_markets_on_threads_match_serial(monkeypatch):
+    from fbm.markets import slate
+    model = BaselineModel(ratings={"A": 2.0, "B": -1.0, "C": 0.5})
+    kw = dict(bankroll=1000.0, kelly_fraction=0.33, mc_n=300, mc_seed=4)
+    serial = list(price_slate(ROWS, model, 45.0, **kw))
+    monkeypatch.setattr(slate, "_MIN_MC_PARALLEL", 0)
+    assert list(price_slate(ROWS, model, 45.0, **kw)) == serial
+
+def test_price_slate_accepts_column_table(monkeypatch):
+    from fbm.data.ingest.odds_csv import OddsTable
+    from fbm.markets import slate
+    model = BaselineModel(ratings={"A": 2.0, "B": -1.0, "C": 0.5})
+    rows = [dict(r, game_id=f"{r['game_id']}-{k}") for k in range(4) for r in ROWS]
+    keys = list(rows[0])
+    table = OddsTable({k: tuple(r[k] for r in rows) for k in keys}, len(rows))
+    kw = dict(bankroll=1000.0, kelly_fraction=0.33)
+    expected = list(price_slate(rows, model, 45.0, **kw))
+    assert list(price_slate(table, model, 45.0, **kw)) == expected
+    monkeypatch.setattr(slate, "_MIN_CHUNK", 2)
+    assert list(price_slate(table, model, 45.0, workers=3, **kw)) == expected
@@ -13,3 +13,11 @@ def test_prob_over_symmetry():
 def test_prob_cover_shifts_correctly():
     # If mean diff is much greater than line, cover probability > 0.5
     assert prob_cover(diff_mean=-1.0, spread_line=-3.0, sigma_diff=13.0) > 0.5
+
+def test_batch_variants_match_scalar():
+    from fbm.markets.spread_total import prob_cover_batch, prob_over_batch
+    ps = prob_cover_batch([-1.0, 3.0], [-3.0, -2.5], sigma_diff=13.0)
+    assert abs(ps[0] - prob_cover(-1.0, -3.0, 13.0)) < 1e-12
+    assert abs(ps[1] - prob_cover(3.0, -2.5, 13.0)) < 1e-12
+    po = prob_over_batch([48.0], [45.0], sigma_total=10.0)
+    assert abs(po[0] - prob_over(48.0, 45.0, 10.0)) < 1e-12
@@ -0,0 +1,206 @@
+from fbm.data.fetch.theoddsapi import _reduce_event
+
+def test_reduce_event_best_ml_and_consensus_lines():
+    ev = {
+        "home_team": "H", "away_team": "A",
+        "bookmakers": [
+            {"markets": [
+                {"key": "h2h", "outcomes": [{"name": "H", "price": -120}, {"name": "A", "price": 100}]},
+                {"key": "spreads", "outcomes": [{"name": "H", "point": -2.5, "price": -110},
+                                                {"name": "A", "point": 2.5, "price": -110}]},
+                {"key": "totals", "outcomes": [{"name": "Over", "point": 45.5, "price": -105},
+                                               {"name": "Under", "point": 45.5, "price": -115}]},
+            ]},
+            {"markets": [
+                {"key": "h2h", "outcomes": [{"name": "H", "price": -110}, {"name": "A", "price": 110}]},
+                {"key": "spreads", "outcomes": [{"name": "H", "point": -2.5, "price": -120},
+                                                {"name": "A", "point": 2.5, "price": -100}]},
+                {"key": "totals", "outcomes": [{"name": "Over", "point": 45.5, "price": -115},
+                                               {"name": "Under", "point": 45.5, "price": -105}]},
+            ]},
+        ],
+    }
+    home_ml, away_ml, sp, sp_h, sp_a, ou, over, under = _reduce_event(ev)
+    assert (home_ml, away_ml) == (-110, 110)
+    assert sp == -2.5 and sp_h == -115 and sp_a == -105
+    assert ou == 45.5 and over == -110 and under == -110
+
+def test_reduce_event_consensus_is_most_quoted_home_line():
+    def book(pt, price):
+        return {"markets": [{"key": "spreads", "outcomes": [
+            {"name": "H", "point": pt, "price": price}, {"name": "A", "point": -pt, "price": -110}]}]}
+    ev = {"home_team": "H", "away_team": "A",
+          "bookmakers": [book(-3.0, -110), book(-2.5, -120), book(-2.5, -100)]}
+    _, _, sp, sp_h, sp_a, _, _, _ = _reduce_event(ev)
+    assert sp == -2.5 and sp_h == -110 and sp_a == -110
+
+def test_reduce_event_no_books():
+    assert _reduce_event({"home_team": "H", "away_team": "A"}) == (None,) * 8
+
+class _FakeResponse:
+    def __init__(self, body, headers, status=200):
+        self.status, self.reason, self.headers, self._body = status, "OK", headers, body
+    def read(self):
+        return self._body
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+class _FakeConnection:
+    instances = []
+    def __init__(self, host, timeout=None, context=None):
+        self.host, self.timeout, self.sock, self.requests = host, timeout, None, []
+        _FakeConnection.instances.append(self)
+    def request(self, method, target, headers=None):
+        self.requests.append((method, target, headers))
+    def getresponse(self):
+        import gzip
+        return _FakeResponse(gzip.compress(b'[{"id": "G1"}]'), {"Content-Encoding": "gzip"})
+    def close(self):
+        pass
+
+def test_get_reuses_connection_and_decodes_gzip(monkeypatch):
+    import threading
+    from fbm.data.fetch import theoddsapi
+    monkeypatch.setattr(theoddsapi.http.client, "HTTPSConnection", _FakeConnection)
+    monkeypatch.setattr(theoddsapi, "_CONNECTIONS", threading.local())
+    _FakeConnection.instances = []
+
+    assert theoddsapi._get("https://example.invalid/v4/odds?a=1") == [{"id": "G1"}]
+    assert theoddsapi._get("https://example.invalid/v4/scores") == [{"id": "G1"}]
+    assert len(_FakeConnection.instances) == 1
+    conn = _FakeConnection.instances[0]
+    assert [r[1] for r in conn.requests] == ["/v4/odds?a=1", "/v4/scores"]
+    assert conn.requests[0][2]["Accept-Encoding"] == "gzip"
+
+class _FakeSocket:
+    def settimeout(self, timeout):
+        self.timeout = timeout
+
+def test_pooled_connection_takes_each_calls_timeout(monkeypatch):
+    import threading
+    from fbm.data.fetch import theoddsapi
+    monkeypatch.setattr(theoddsapi.http.client, "HTTPSConnection", _FakeConnection)
+    monkeypatch.setattr(theoddsapi, "_CONNECTIONS", threading.local())
+    _FakeConnection.instances = []
+
+    theoddsapi._get("https://example.invalid/v4/odds", timeout=5)
+    conn = _FakeConnection.instances[0]
+    assert conn.timeout == 5
+    conn.sock = _FakeSocket()  # connected by the first request
+    theoddsapi._get("https://example.invalid/v4/scores", timeout=30)
+    assert len(_FakeConnection.instances) == 1
+    assert conn.timeout == 30 and conn.sock.timeout == 30
+
+class _RedirectingConnection(_FakeConnection):
+    """Answers /v4/old with a relative 302 to /v4/new."""
+    def getresponse(self):
+        if self.requests[-1][1] == "/v4/old":
+            return _FakeResponse(b"", {"Location": "/v4/new"}, status=302)
+        return super().getresponse()
+
+def test_get_follows_redirects(monkeypatch):
+    import threading
+    from fbm.data.fetch import theoddsapi
+    monkeypatch.setattr(theoddsapi.http.client, "HTTPSConnection", _RedirectingConnection)
+    monkeypatch.setattr(theoddsapi, "_CONNECTIONS", threading.local())
+    _FakeConnection.instances = []
+
+    assert theoddsapi._get("https://example.invalid/v4/old") == [{"id": "G1"}]
+    assert [r[1] for r in _FakeConnection.instances[0].requests] == ["/v4/old", "/v4/new"]
+
+def test_get_gives_up_on_a_redirect_loop(monkeypatch):
+    import threading, urllib.error
+    import pytest
+    from fbm.data.fetch import theoddsapi
+
+    class _Loop(_FakeConnection):
+        def getresponse(self):
+            return _FakeResponse(b"", {"Location": "/v4/old"}, status=301)
+
+    monkeypatch.setattr(theoddsapi.http.client, "HTTPSConnection", _Loop)
+    monkeypatch.setattr(theoddsapi, "_CONNECTIONS", threading.local())
+    _FakeConnection.instances = []
+    with pytest.raises(urllib.error.HTTPError):
+        theoddsapi._get("https://example.invalid/v4/old")
+    assert len(_FakeConnection.instances[0].requests) == theoddsapi._MAX_REDIRECTS + 1
+
+class _ExclusiveConnection(_FakeConnection):
+    """Fails like http.client when a second request starts before the first response is read."""
+    def request(self, method, target, headers=None):
+        import http.client, time
+        if getattr(self, "busy", False):
+            raise http.client.CannotSendRequest("Request-sent")
+        self.busy = True
+        time.sleep(0.002)  # widen the window in which another thread could interleave
+        super().request(method, target, headers)
+    def getresponse(self):
+        self.busy = False
+        return super().getresponse()
+
+def test_get_from_two_threads_uses_a_connection_per_thread(monkeypatch):
+    import threading
+    from fbm.data.fetch import theoddsapi
+    monkeypatch.setattr(theoddsapi.http.client, "HTTPSConnection", _ExclusiveConnection)
+    monkeypatch.setattr(theoddsapi, "_CONNECTIONS", threading.local())
+    _FakeConnection.instances = []
+    errors, start = [], threading.Barrier(2)
+
+    def fetch(path):
+        start.wait()
+        try:
+            for _ in range(20):
+                assert theoddsapi._get(f"https://example.invalid/v4/{path}") == [{"id": "G1"}]
+        except Exception as e:  # surfaced in the main thread below
+            errors.append(e)
+
+    threads = [threading.Thread(target=fetch, args=(p,)) for p in ("odds", "scores")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert len(_FakeConnection.instances) == 2
+    assert sorted(len(c.requests) for c in _FakeConnection.instances) == [20, 20]
+
+def test_fetch_recent_scores_to_csv_quotes_and_skips_incomplete(tmp_path, monkeypatch):
+    from fbm.data.fetch import theoddsapi
+    from fbm.data.ingest.results_csv import load_results_csv
+    data = [
+        {"completed": True, "home_team": "Miami (OH)", "away_team": "Ohio, Bobcats",
+         "commence_time": "2025-09-06T17:00:00Z",
+         "scores": [{"name": "Miami (OH)", "score": "24"}, {"name": "Ohio, Bobcats", "score": "17"}]},
+        {"completed": False, "home_team": "A", "away_team": "B"},
+    ]
+    monkeypatch.setattr(theoddsapi, "_get", lambda url, timeout=20: data)
+    out = theoddsapi.fetch_recent_scores_to_csv("k", "americanfootball_ncaaf", tmp_path / "results.csv")
+    rows = load_results_csv(out)
+    assert rows == [{"date": "2025-09-06", "home_team": "Miami (OH)", "away_team": "Ohio, Bobcats",
+                     "home_pts": 24, "away_pts": 17}]
+    assert not (tmp_path / "results.csv.tmp").exists()
+
+def test_reduce_event_quantizes_float_noise_into_one_line():
+    ev = {"home_team": "H", "away_team": "A", "bookmakers": [
+        {"markets": [{"key": "totals", "outcomes": [{"name": "Over", "point": 45.5, "price": -110}]}]},
+        {"markets": [{"key": "totals", "outcomes": [{"name": "Over", "point": 45.5000001, "price": -120}]}]},
+    ]}
+    _, _, _, _, _, ou, over, _ = _reduce_event(ev)
+    assert ou == 45.5 and isinstance(ou, float) and over == -115
+
+def test_fetch_odds_to_csv_reuses_fresh_cached_payload(tmp_path, monkeypatch):
+    from fbm.data.fetch import theoddsapi
+    calls = []
+    def fake_get_bytes(url, timeout=20):
+        calls.append(url)
+        return b'[{"id": "G1", "home_team": "H", "away_team": "A", "bookmakers": []}]'
+    monkeypatch.setattr(theoddsapi, "_get_bytes", fake_get_bytes)
+
+    cache = tmp_path / "cache"
+    out = tmp_path / "odds.csv"
+    theoddsapi.fetch_odds_to_csv("secret", "americanfootball_nfl", out, cache_dir=cache)
+    theoddsapi.fetch_odds_to_csv("secret", "americanfootball_nfl", out, cache_dir=cache)
+    assert len(calls) == 1
+    assert out.read_text(encoding="utf-8").splitlines()[1].startswith("G1,H,A,")
+    assert not any("secret" in p.name for p in cache.iterdir())
+
+    theoddsapi.fetch_odds_to_csv("secret", "americanfootball_nfl", out, cache_dir=cache, cache_ttl_s=0)
+    assert len(calls) == 2